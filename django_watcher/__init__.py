@@ -1,9 +1,15 @@
 from .abstract_watcher import AbstractWatcher  # noqa: F401
 from .decorators import watched  # noqa: F401
 from .mixins import (  # noqa: F401
+    ArchiveWatcherMixin,
+    AuditWatcherMixin,
+    CacheInvalidationWatcherMixin,
+    CounterCacheWatcherMixin,
     CreateWatcherMixin,
     DeleteWatcherMixin,
     MetaParams,
     SaveWatcherMixin,
+    SearchIndexWatcherMixin,
+    SoftDeleteWatcherMixin,
     UpdateWatcherMixin,
 )
@@ -1,44 +1,309 @@
 import inspect
-from typing import Any, Callable, TypeVar, Union, cast
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from django.db import models, transaction
+from django.db import connections, models, router, transaction
+
+from . import profiling, stats, tracing
+from .cache import HookCache, get_hook_cache
 
 
 T = TypeVar('T', bound=models.Model)
 TargetType = Union[T, models.QuerySet]
 
+# Values of MetaParams source
+_INSTANCE = 'instance'
+_QUERY_SET = 'query_set'
+
 
 class AbstractWatcher:
+    # Set to True, or to select_for_update kwargs (e.g. {'skip_locked': True, 'of': ('self',)}),
+    # to fetch update/delete targets once with a lock and share those rows between the hooks
+    # and the operation
+    select_for_update: Union[bool, Dict[str, Any]] = False
+    # Fields loaded on the targets of each hook, e.g. {'post_delete': ['id', 'owner_id']}
+    hook_fields: Dict[str, List[str]] = {}
+    # Database alias of the running operation, set by _run_inside_transaction
+    using: Optional[str] = None
+    # Max number of entries kept by `cache`, least recently used ones are evicted first
+    cache_size: int = 128
+    # The watched model, set when the watcher is built for an operation
+    model: Optional[Type[models.Model]] = None
+    # Operations taking longer, in milliseconds, are logged on `django_watcher.slow` with the time
+    # of each hook and their slowest queries
+    slow_operation_ms: Optional[float] = None
+
     class Meta:
         abstract = True
 
+    def __init__(self) -> None:
+        # Name of the running operation, set by run
+        self.operation: Optional[str] = None
+        # Timings of the running operation, in seconds, recorded on the stats registry
+        self.hook_times: Dict[str, List[float]] = {}
+        self.transaction_time: Optional[float] = None
+
     def is_queryset(self, target: TargetType) -> bool:
         return isinstance(target, models.QuerySet)
 
     def to_queryset(self, target: TargetType) -> models.QuerySet:
         if not self.is_queryset(target):
             target = cast(models.Model, target)
-            target = target.__class__.objects.filter(pk=target.pk)
+            using = self.using or target._state.db  # pylint: disable=protected-access
+            target = target.__class__.objects.using(using).filter(pk=target.pk)
 
         return target
 
-    @transaction.atomic
+    @property
+    def cache(self) -> HookCache:
+        """
+        cache is shared by the operations of this watcher and model running in the same
+        transaction, so hooks can memoize lookups repeated on each operation.
+        It's discarded on commit or rollback.
+        """
+        using = self.using or router.db_for_write(cast(Type[models.Model], self.model))
+        return get_hook_cache(using, (type(self), self.model), self.cache_size)
+
+    # pylint: disable=protected-access
+    def get_db_alias(self, target: TargetType, using: Optional[str] = None) -> str:
+        """
+        get_db_alias returns the database alias an operation on target writes to,
+        following the same rules as Django's save, delete and QuerySet write operations
+
+        :param target: Instance or queryset of the operation
+        :param using: The `using` param given to the operation, if any
+        :returns: The database alias
+        """
+        if using:
+            return using
+        if self.is_queryset(target):
+            queryset = cast(Any, target)
+            return queryset._db or router.db_for_write(queryset.model, **queryset._hints)
+        instance = cast(models.Model, target)
+        return router.db_for_write(instance.__class__, instance=instance)
+
+    # pylint: disable=protected-access
+    def pin_queryset(self, target: models.QuerySet, pks: Iterable[Any]) -> models.QuerySet:
+        """
+        pin_queryset returns a queryset with the same class and database of target, filtered only
+        by the given pks, so it keeps matching the same rows after they are changed
+
+        :param target: The queryset to take class, model and database from
+        :param pks: The primary keys of the rows
+        :returns: The pinned queryset
+        """
+        source = cast(Any, target)
+        queryset = target.__class__(model=target.model, using=source._db, hints=source._hints)
+        return queryset.filter(pk__in=list(pks))
+
+    # pylint: disable=protected-access
+    def to_snapshot(
+        self, target: models.QuerySet, instances: List[models.Model]
+    ) -> models.QuerySet:
+        """
+        to_snapshot returns a queryset pinned to the instances, which are already its result cache,
+        so iterating it, len, count, exists, first and last don't hit the database while chained
+        querysets still do
+
+        :param target: The queryset the instances were fetched from
+        :param instances: The fetched instances
+        :returns: The snapshot queryset
+        """
+        snapshot = self.pin_queryset(target, [instance.pk for instance in instances])
+        return self._fill_snapshot(snapshot, instances)
+
+    # pylint: disable=protected-access
+    def _fill_snapshot(
+        self, snapshot: models.QuerySet, instances: List[models.Model]
+    ) -> models.QuerySet:
+        if not snapshot.ordered:
+            # the order Django gives unordered querysets on first and last
+            instances = sorted(instances, key=lambda instance: instance.pk)
+        cast(Any, snapshot)._result_cache = instances
+        cast(Any, snapshot)._prefetch_done = True
+        setattr(snapshot, '_watcher_snapshot', True)
+        # first and last read the result cache instead of querying a reordered copy
+        setattr(snapshot, 'first', lambda: instances[0] if instances else None)
+        setattr(snapshot, 'last', lambda: instances[-1] if instances else None)
+        return snapshot
+
+    def is_native(self, target: models.QuerySet, operation: str) -> bool:
+        """
+        is_native tells if the unwatched operation of the target queryset is the one of Django's
+        QuerySet, so it can be run by an equivalent statement without skipping an override
+
+        :param target: The queryset
+        :param operation: The operation name, e.g. 'update'
+        """
+        return getattr(type(target), f'UNWATCHED_{operation}', None) is getattr(
+            models.QuerySet, operation
+        )
+
+    def skips_instance(self, target: TargetType, queryset: models.QuerySet) -> bool:
+        """
+        skips_instance tells if the instance target is missing from the snapshot of the locked
+        rows, as skip_locked leaves out rows locked by other transactions. Operations skip these
+        instances, so they only affect the locked rows.
+
+        :param target: Instance or queryset of the operation
+        :param queryset: The queryset given by to_pre_queryset
+        """
+        return (
+            not self.is_queryset(target)
+            and self.is_snapshot(queryset)
+            and not cast(Any, queryset)._result_cache
+        )
+
+    def is_snapshot(self, target: TargetType) -> bool:
+        return getattr(target, '_watcher_snapshot', False)
+
+    def refetch(self, target: TargetType) -> TargetType:
+        """
+        refetch returns a lazy copy of snapshots, for post hooks to see the rows as they are after
+        the operation. Other targets are returned as they are.
+        """
+        return cast(models.QuerySet, target).all() if self.is_snapshot(target) else target
+
+    def project(self, hook: str, target: models.QuerySet) -> models.QuerySet:
+        """
+        project restricts the columns loaded by target to the `hook_fields` of the hook.
+        Snapshots are already loaded, so they are returned as they are.
+
+        :param hook: The hook name
+        :param target: The queryset given to the hook
+        :returns: The projected queryset
+        """
+        fields = self.hook_fields.get(hook)
+        if not fields or self.is_snapshot(target):
+            return target
+        return target.only(*fields)
+
+    def lock_target(self, target: TargetType) -> models.QuerySet:
+        """
+        lock_target fetches the target rows once with select_for_update, using the
+        `select_for_update` attribute as its params
+
+        :param target: Instance or queryset to be locked
+        :returns: A snapshot of the locked rows
+        """
+        params = self.select_for_update if isinstance(self.select_for_update, dict) else {}
+        queryset = self.to_queryset(target)
+        return self.to_snapshot(queryset, list(queryset.select_for_update(**params)))
+
+    def to_post_queryset(self, instance: models.Model) -> models.QuerySet:
+        """
+        to_post_queryset returns the queryset given to post hooks of instance operations, a snapshot
+        of the instance just written, so reading it doesn't fetch the row again
+
+        :param instance: The saved instance
+        :returns: The snapshot queryset
+        """
+        return self._fill_snapshot(self.to_queryset(instance), [instance])
+
+    def to_pre_queryset(self, target: TargetType) -> models.QuerySet:
+        """
+        to_pre_queryset returns the queryset given to pre hooks, which is the snapshot of the locked
+        rows when `select_for_update` is set
+
+        :param target: Instance, queryset or snapshot of the operation
+        :returns: The queryset
+        """
+        if self.select_for_update and not self.is_snapshot(target):
+            return self.lock_target(target)
+        return self.to_queryset(target)
+
     def _run_inside_transaction(
         self, func: Callable, target: TargetType, *args: Any, **kwargs: Any
     ) -> Any:
-        hooks_params = {}
-        keys = list(kwargs.keys())
-        for k in keys:
-            if k.startswith('hooks__') and len(k) > 7:
-                hooks_params[k[7:]] = kwargs.pop(k)
-        return func(target, *args, hooks_params=hooks_params, **kwargs)
+        self.using = self.get_db_alias(target, kwargs.get('using'))
+        if self.slow_operation_ms is None:
+            return self._run_atomic(func, target, *args, **kwargs)
+
+        recorder = profiling.QueryRecorder()
+        start = perf_counter()
+        # django-stubs types execute_wrapper as the generator under its contextmanager decorator
+        wrapper = cast(ContextManager, connections[self.using].execute_wrapper(recorder))
+        with wrapper:
+            result = self._run_atomic(func, target, *args, **kwargs)
+        duration = perf_counter() - start
+        if duration * 1000 >= self.slow_operation_ms:
+            profiling.log_slow_operation(self, duration, recorder.queries)
+        return result
+
+    def _run_atomic(self, func: Callable, target: TargetType, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            with transaction.atomic(using=self.using):
+                hooks_params = {}
+                keys = list(kwargs.keys())
+                for k in keys:
+                    if k.startswith('hooks__') and len(k) > 7:
+                        hooks_params[k[7:]] = kwargs.pop(k)
+                return func(target, *args, hooks_params=hooks_params, **kwargs)
+        finally:
+            self.transaction_time = (self.transaction_time or 0) + perf_counter() - start
+
+    def call_hook(self, hook: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        call_hook calls the hook, recording its time. Mixins call every hook through it.
+
+        :param hook: The hook name
+        :returns: The hook return
+        """
+        start = perf_counter()
+        try:
+            with tracing.span(f'django_watcher.{hook}', self.model, self.operation, hook=hook):
+                return getattr(self, hook)(*args, **kwargs)
+        finally:
+            self.hook_times.setdefault(hook, []).append(perf_counter() - start)
+
+    def call_unwatched(self, operation: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        call_unwatched calls the unwatched operation func. Mixins call every UNWATCHED_ operation
+        through it.
+
+        :param operation: The operation name
+        :param func: The UNWATCHED_ operation
+        :returns: The operation return
+        """
+        with tracing.span(f'django_watcher.UNWATCHED_{operation}', self.model, self.operation):
+            return func(*args, **kwargs)
 
     def run(
         self, operation: str, target: TargetType, *args: Any, _ignore_hooks=False, **kwargs: Any
     ):
-        if _ignore_hooks:
-            return getattr(target, f'UNWATCHED_{operation}')(*args, **kwargs)
-        return getattr(self, f'_{operation}')(target, *args, **kwargs)
+        self.operation = operation
+        source = _QUERY_SET if self.is_queryset(target) else _INSTANCE
+        with tracing.span(
+            f'django_watcher.{operation}', self.model, operation, source=source
+        ) as span:
+            if _ignore_hooks:
+                result = getattr(target, f'UNWATCHED_{operation}')(*args, **kwargs)
+            else:
+                result = getattr(self, f'_{operation}')(target, *args, **kwargs)
+            span.set_attribute('django_watcher.rows', stats.count_rows(result))
+
+        if self.model is not None:
+            stats.registry.record(
+                self.model._meta.label,  # pylint: disable=protected-access
+                operation,
+                stats.count_rows(result),
+                self.transaction_time,
+                self.hook_times,
+            )
+        return result
 
     def is_overriden(self, method_name: str) -> bool:
         cls = type(self)
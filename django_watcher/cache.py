@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from django.db import connections, transaction
+
+
+_MISSING = object()
+
+
+class HookCache:
+    """
+    HookCache is a size bounded LRU mapping, hooks use it to memoize lookups shared by the
+    operations of a transaction
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._on_commit: Optional[Callable[[], None]] = None
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, default: Callable[[], Any]) -> Any:
+        """
+        get_or_set returns the cached value of key, calling default to compute and cache it on
+        misses
+
+        :param key: The cache key
+        :param default: Callable returning the value
+        :returns: The value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _is_alive(connection: Any, on_commit: Optional[Callable[[], None]]) -> bool:
+    # Django drops the on_commit callbacks of rolled back transactions and savepoints
+    return any(entry[1] is on_commit for entry in connection.run_on_commit)
+
+
+# pylint: disable=protected-access
+def get_hook_cache(using: str, key: Hashable, maxsize: int) -> HookCache:
+    """
+    get_hook_cache returns the cache of key for the current transaction on the database using.
+    The cache is discarded when the transaction commits, or when the transaction or the savepoint
+    it was created in rolls back.
+
+    :param using: The database alias
+    :param key: The cache owner, e.g. the watcher class and the model
+    :param maxsize: Max number of entries of a new cache
+    :returns: The cache
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        return HookCache(maxsize)
+
+    caches: Dict[Hashable, HookCache] = connection.__dict__.setdefault('_watcher_hook_caches', {})
+    cache = caches.get(key)
+    if cache is not None and _is_alive(connection, cache._on_commit):
+        return cache
+
+    cache = HookCache(maxsize)
+
+    def discard() -> None:
+        if caches.get(key) is cache:
+            del caches[key]
+
+    cache._on_commit = discard
+    caches[key] = cache
+    transaction.on_commit(discard, using=using)
+    return cache
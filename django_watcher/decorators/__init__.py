@@ -6,11 +6,12 @@ from django_watcher.mixins import (
     CreateWatcherMixin,
     DeleteWatcherMixin,
     SaveWatcherMixin,
+    SoftDeleteWatcherMixin,
     UpdateWatcherMixin,
 )
 
 from .model import set_watched_model
-from .querytools import set_watched_manager
+from .querytools import set_soft_delete_managers, set_watched_manager
 
 
 if TYPE_CHECKING:
@@ -37,9 +38,33 @@ def _import_watcher(casual_path: str) -> Type[AbstractWatcher]:
 
 
 _map_operations_by_watcher: Dict[Type[AbstractWatcher], Tuple[str, Tuple[str, ...]]] = {
-    SaveWatcherMixin: ('save', ('create', 'update')),
-    UpdateWatcherMixin: ('save', ('update',)),
-    CreateWatcherMixin: ('save', ('create',)),
+    SaveWatcherMixin: (
+        'save',
+        (
+            'create',
+            'update',
+            'save_many',
+            'get_or_create',
+            'update_or_create',
+            'bulk_update_or_create',
+            'upsert',
+        ),
+    ),
+    UpdateWatcherMixin: (
+        'save',
+        ('update', 'save_many', 'update_or_create', 'bulk_update_or_create', 'upsert'),
+    ),
+    CreateWatcherMixin: (
+        'save',
+        (
+            'create',
+            'save_many',
+            'get_or_create',
+            'update_or_create',
+            'bulk_update_or_create',
+            'upsert',
+        ),
+    ),
     DeleteWatcherMixin: ('delete', ('delete',)),
 }
 
@@ -86,6 +111,14 @@ def watched(
             for manager_attr in watched_managers:
                 set_watched_manager(model_cls, manager_attr, objects_operations)
 
+        if issubclass(watcher_cls, SoftDeleteWatcherMixin):
+            set_soft_delete_managers(
+                model_cls,
+                watched_managers or ['objects'],
+                watcher_cls.deleted_field,
+                objects_operations,
+            )
+
         return model_cls
 
     return decorator
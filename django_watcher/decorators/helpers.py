@@ -1,8 +1,11 @@
-from typing import Callable, List
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from django.db import IntegrityError, connections, models, transaction
 
 from typing_extensions import Literal
 
 from django_watcher.abstract_watcher import T
+from django_watcher.utils import match_existing, resolve_callables, retry_on_conflict
 
 
 def get_watched_functions(cls: type, operation_names: List[str]) -> List[Callable]:
@@ -27,20 +30,195 @@ def get_watched_functions(cls: type, operation_names: List[str]) -> List[Callabl
     return watched_functions
 
 
-def unwatched_create(self, **kwargs) -> T:
+def unwatched_create(self, _instance: T = None, **kwargs) -> T:
     """
     unwatched_create is a function to be injected on the watched Manager
     the usual save will call models create which trigger the hooks twice
     this function will replace the Manager create in order to call the UNWATCHED_save
 
+    :param _instance: An already built instance to be saved, so the watched create doesn't
+    build it twice
     :param kwargs: The params passed to the function to create the model
     :returns: The model
     """
-    instance = self.model(**kwargs)
-    instance.UNWATCHED_save(force_insert=True)
+    self._for_write = True  # pylint: disable=protected-access
+    instance = self.model(**kwargs) if _instance is None else _instance
+    instance.UNWATCHED_save(force_insert=True, using=self.db)
     return instance
 
 
+# pylint: disable=protected-access
+def unwatched_save_many(
+    self,
+    instances: List[T],
+    batch_size: Optional[int] = None,
+    update_fields: Optional[List[str]] = None,
+) -> List[T]:
+    """
+    unwatched_save_many is a function to be injected on the watched QuerySet, it inserts the
+    instances not saved yet, as told by _state.adding, and updates the others, in batches
+
+    :param instances: The instances to be saved
+    :param batch_size: Max number of instances per statement
+    :param update_fields: The fields written on updated instances, all concrete fields by default
+    :returns: The instances
+    """
+    self._for_write = True
+    using = self.db
+    # Plain querysets, so the writes below don't trigger the watched update
+    queryset = models.QuerySet(model=self.model, using=using, hints=self._hints)
+    created = [instance for instance in instances if instance._state.adding]
+    updated = [instance for instance in instances if not instance._state.adding]
+
+    # can_return_rows_from_bulk_insert is missing from django-stubs
+    features: Any = connections[using].features
+    if created and features.can_return_rows_from_bulk_insert:
+        queryset.bulk_create(created, batch_size=batch_size)
+    else:
+        for instance in created:
+            cast(Any, instance).UNWATCHED_save(force_insert=True, using=using)
+
+    if updated:
+        fields = update_fields or [
+            field.name for field in self.model._meta.concrete_fields if not field.primary_key
+        ]
+        queryset.bulk_update(updated, fields, batch_size=batch_size)
+
+    return instances
+
+
+# pylint: disable=protected-access
+def unwatched_get_or_create(
+    self, defaults: Optional[Dict[str, Any]] = None, **kwargs
+) -> Tuple[T, bool]:
+    """
+    unwatched_get_or_create is a function to be injected on the watched QuerySet, it works as
+    Django's get_or_create but saves with UNWATCHED_save, so no hooks are triggered
+
+    :param defaults: Values used only on creation
+    :param kwargs: The lookup of the instance
+    :returns: The instance and whether it was created
+    """
+    self._for_write = True
+    try:
+        return self.get(**kwargs), False
+    except self.model.DoesNotExist:
+        params = resolve_callables(self._extract_model_params(defaults, **kwargs))
+    try:
+        with transaction.atomic(using=self.db):
+            return unwatched_create(self, **params), True
+    except IntegrityError:
+        try:
+            return self.get(**kwargs), False
+        except self.model.DoesNotExist:
+            pass
+        raise
+
+
+# pylint: disable=protected-access
+def unwatched_update_or_create(
+    self, defaults: Optional[Dict[str, Any]] = None, **kwargs
+) -> Tuple[T, bool]:
+    """
+    unwatched_update_or_create is a function to be injected on the watched QuerySet, it works as
+    Django's update_or_create but saves with UNWATCHED_save, so no hooks are triggered
+
+    :param defaults: Values to be set on the instance
+    :param kwargs: The lookup of the instance
+    :returns: The instance and whether it was created
+    """
+    self._for_write = True
+    instance: Any
+    with transaction.atomic(using=self.db):
+        instance, created = unwatched_get_or_create(
+            self.select_for_update(), defaults=defaults, **kwargs
+        )
+        if created:
+            return instance, created
+        for k, v in resolve_callables(defaults or {}).items():
+            setattr(instance, k, v)
+        instance.UNWATCHED_save(using=self.db)
+    return instance, False
+
+
+# pylint: disable=protected-access
+def unwatched_bulk_update_or_create(
+    self,
+    instances: List[T],
+    match_fields: List[str],
+    batch_size: Optional[int] = None,
+    update_fields: Optional[List[str]] = None,
+) -> List[T]:
+    """
+    unwatched_bulk_update_or_create is a function to be injected on the watched QuerySet,
+    it's unwatched_upsert with match_fields as the unique_fields
+
+    :param instances: The instances to be saved
+    :param match_fields: Names of the fields which identify a row, usually a unique constraint
+    :param batch_size: Max number of instances per statement
+    :param update_fields: The fields written on updated instances, see unwatched_upsert
+    :returns: The instances
+    """
+    return unwatched_upsert(
+        self, instances, match_fields, update_fields=update_fields, batch_size=batch_size
+    )
+
+
+# pylint: disable=protected-access
+def unwatched_upsert(
+    self,
+    instances: List[T],
+    unique_fields: List[str],
+    update_fields: Optional[List[str]] = None,
+    batch_size: Optional[int] = None,
+    _matched: bool = False,
+) -> List[T]:
+    """
+    unwatched_upsert is a function to be injected on the watched QuerySet, it inserts the instances
+    and updates the rows which already have their unique_fields values: the instances are matched
+    with the existing rows and saved as save_many does, matching them again if a concurrent
+    transaction inserts one of their keys in between.
+
+    :param instances: The instances to be saved
+    :param unique_fields: Names of the fields of the unique constraint identifying a row
+    :param update_fields: The fields written on conflicts, all concrete fields by default
+    :param batch_size: Max number of instances per statement
+    :param _matched: Whether the instances were already matched with the existing rows
+    :returns: The instances
+    """
+    self._for_write = True
+    using = self.db
+    fields = update_fields or [
+        field.name
+        for field in self.model._meta.concrete_fields
+        if not field.primary_key and field.name not in unique_fields
+    ]
+
+    def save() -> List[T]:
+        with transaction.atomic(using=using):
+            if not _matched:
+                match_existing(self, instances, unique_fields)
+            return unwatched_save_many(self, instances, batch_size=batch_size, update_fields=fields)
+
+    # Already matched instances are retried by the watched upsert, which matches them
+    return save() if _matched else retry_on_conflict(instances, save)
+
+
+# Native operations calling other watched operations, they're replaced by these unwatched functions
+unwatched_operations: Dict[str, Callable] = {
+    'create': unwatched_create,
+    'get_or_create': unwatched_get_or_create,
+    'update_or_create': unwatched_update_or_create,
+}
+
+# Operations that querysets don't have, they're added with these unwatched functions
+extra_operations: Dict[str, Callable] = {
+    'save_many': unwatched_save_many,
+    'bulk_update_or_create': unwatched_bulk_update_or_create,
+    'upsert': unwatched_upsert,
+}
+
+
 def generate_settable(
     cls: type, for_type: Literal['model', 'queryset', 'manager']
 ) -> Callable[[str], None]:
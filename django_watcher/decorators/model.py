@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Callable, List, Type
 
 from django_watcher.abstract_watcher import AbstractWatcher, TargetType
+from django_watcher.utils import track_loaded
 
 from .helpers import generate_settable, get_watched_functions
 
@@ -38,18 +39,30 @@ def _watched_operation(cls, operation: str, target: TargetType, *args: Any, **kw
 
 
 def _generate_get_watcher(watcher_cls: Type[AbstractWatcher]) -> Callable[[Any], AbstractWatcher]:
-    # pylint: disable=unused-argument
     def _get_watcher(cls):
-        return watcher_cls()
+        watcher = watcher_cls()
+        watcher.model = cls
+        return watcher
 
     return _get_watcher
 
 
+def _generate_from_db(from_db: Callable) -> Callable:
+    def _from_db(cls, db, field_names, values):
+        instance = from_db(cls, db, field_names, values)
+        track_loaded(instance, field_names, values)
+        return instance
+
+    return _from_db
+
+
 def set_watched_model(cls: type, watcher_cls: type, watched_operations: List[str]) -> type:
     watched_operations = watched_operations.copy()
 
     setattr(cls, 'watched_operation', classmethod(_watched_operation))
     setattr(cls, '_get_watcher', classmethod(_generate_get_watcher(watcher_cls)))
+    if getattr(watcher_cls, 'track_changes', False):
+        setattr(cls, 'from_db', classmethod(_generate_from_db(getattr(cls, 'from_db').__func__)))
 
     for func in get_watched_functions(cls, watched_operations):
         setattr(cls, f'UNWATCHED_{func.__name__}', func)
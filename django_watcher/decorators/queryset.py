@@ -1,6 +1,11 @@
 from typing import TYPE_CHECKING, List, Type
 
-from .helpers import generate_settable, get_watched_functions, unwatched_create
+from .helpers import (
+    extra_operations,
+    generate_settable,
+    get_watched_functions,
+    unwatched_operations,
+)
 
 
 if TYPE_CHECKING:
@@ -18,13 +23,18 @@ def get_qs_cls(qs: 'models.QuerySet', watched_operations: List[str]) -> Type['mo
 
     new_qs_cls = type(qs_name, (qs_cls,), {})
 
-    for func in get_watched_functions(new_qs_cls, watched_operations):
+    native_operations = [op for op in watched_operations if op not in extra_operations]
+    for func in get_watched_functions(new_qs_cls, native_operations):
         setattr(
             new_qs_cls,
             f'UNWATCHED_{func.__name__}',
-            func if func.__name__ != 'create' else unwatched_create,
+            unwatched_operations.get(func.__name__, func),
         )
 
+    for operation in watched_operations:
+        if operation in extra_operations:
+            setattr(new_qs_cls, f'UNWATCHED_{operation}', extra_operations[operation])
+
     settable = generate_settable(new_qs_cls, 'queryset')
     for operation in watched_operations:
         settable(operation)
@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING, List, Type, no_type_check
 
-from .helpers import generate_settable, get_watched_functions, unwatched_create
+from django.db.models import Manager
+from django.db.models.manager import BaseManager
+
+from .helpers import extra_operations, generate_settable, get_watched_functions, unwatched_create
 from .queryset import get_qs_cls
 
 
@@ -57,6 +60,27 @@ def _get_manager_cls(manager: 'models.Manager') -> Type['models.Manager']:
     return type(manager_name, (manager_cls,), {})  # type: ignore
 
 
+def _builds_queryset_cls(
+    manager: 'models.Manager', manager_cls: Type['models.Manager'], qs_cls: type
+) -> bool:
+    # pylint: disable=protected-access
+    """
+    _builds_queryset_cls tells if the get_queryset of manager_cls builds its `_queryset_class`,
+    qs_cls, as get_queryset overrides may build querysets without calling super
+
+    :param manager: The original manager instance
+    :param manager_cls: The watched manager class, with qs_cls as its `_queryset_class`
+    :param qs_cls: The watched queryset class
+    :returns: True when the managers of manager_cls return qs_cls instances
+    """
+    if type(manager).get_queryset is BaseManager.get_queryset:
+        return True
+    probe = manager_cls()
+    probe.model = manager.model
+    probe._db = manager._db
+    return isinstance(probe.get_queryset(), qs_cls)
+
+
 def _get_watched_manager_cls(manager: 'models.Manager', watched_operations: List[str]) -> type:
     manager_cls = _get_manager_cls(manager)
     qs = manager.get_queryset()
@@ -67,15 +91,21 @@ def _get_watched_manager_cls(manager: 'models.Manager', watched_operations: List
     if 'delete' in watched_operations_copy:
         watched_operations_copy.remove('delete')
 
-    for func in get_watched_functions(manager_cls, watched_operations_copy):
+    native_operations = [op for op in watched_operations_copy if op not in extra_operations]
+    for func in get_watched_functions(manager_cls, native_operations):
         setattr(
             manager_cls,
             f'UNWATCHED_{func.__name__}',
             func if func.__name__ != 'create' else unwatched_create,
         )
 
-    new_qs_instance = _clone_queryset_in_new_cls(qs, qs_cls)
-    setattr(manager_cls, 'get_queryset', lambda self: new_qs_instance.all())
+    # Same as Manager.from_queryset: BaseManager.get_queryset (and any get_queryset override
+    # calling super) builds the watched queryset directly, without cloning
+    setattr(manager_cls, '_queryset_class', qs_cls)
+    if not _builds_queryset_cls(manager, manager_cls, qs_cls):
+        delattr(manager_cls, '_queryset_class')
+        new_qs_instance = _clone_queryset_in_new_cls(qs, qs_cls)
+        setattr(manager_cls, 'get_queryset', lambda self: new_qs_instance.all())
 
     settable = generate_settable(manager_cls, 'manager')
     for operation in watched_operations_copy:
@@ -102,3 +132,33 @@ def set_watched_manager(model_cls: type, manager_attr: str, watched_operations:
 
     #     pdb.set_trace()
     # manager.contribute_to_class(model_cls, manager_attr)
+
+
+def set_soft_delete_managers(
+    model_cls: type, manager_attrs: List[str], deleted_field: str, watched_operations: List[str]
+) -> None:
+    """
+    set_soft_delete_managers makes the watched managers exclude the soft deleted rows, with a
+    `deleted_field IS NULL` condition that partial indexes can serve, and adds the watched
+    `all_objects` manager, which keeps them, when the model doesn't declare it
+
+    :param model_cls: The model class
+    :param manager_attrs: The watched managers' attributes
+    :param deleted_field: The field set on soft deleted rows
+    :param watched_operations: The operations watched on all_objects
+    """
+    if not hasattr(model_cls, 'all_objects'):
+        Manager().contribute_to_class(model_cls, 'all_objects')
+        set_watched_manager(model_cls, 'all_objects', watched_operations)
+
+    for manager_attr in manager_attrs:
+        if manager_attr == 'all_objects':
+            continue
+        # Watched managers have their own class, built by _get_manager_cls
+        manager_cls = type(getattr(model_cls, manager_attr))
+        get_queryset = manager_cls.get_queryset
+
+        def _get_queryset(self, get_queryset=get_queryset):
+            return get_queryset(self).filter(**{f'{deleted_field}__isnull': True})
+
+        setattr(manager_cls, 'get_queryset', _get_queryset)
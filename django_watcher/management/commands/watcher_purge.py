@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from django_watcher.mixins import SoftDeleteWatcherMixin
+
+
+class Command(BaseCommand):
+    help = (
+        'Hard deletes the rows soft deleted by the SoftDeleteWatcherMixin of a model, in batches, '
+        'without running the hooks.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help='The model label, e.g. my_app.MyModel')
+        parser.add_argument(
+            '--days', type=int, help='Purge only the rows soft deleted more than DAYS days ago'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, help='Number of rows deleted by each transaction'
+        )
+        parser.add_argument('--database', help='The database alias')
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e)) from e
+        watcher = model._get_watcher() if hasattr(model, '_get_watcher') else None
+        if not isinstance(watcher, SoftDeleteWatcherMixin):
+            raise CommandError(f'{options["model"]} is not watched by a SoftDeleteWatcherMixin')
+
+        if options['batch_size']:
+            watcher.purge_batch_size = options['batch_size']
+        before = None
+        if options['days'] is not None:
+            before = timezone.now() - timedelta(days=options['days'])
+        purged = watcher.purge(before=before, using=options['database'])
+        self.stdout.write(f'Purged {purged} rows of {model._meta.label}')
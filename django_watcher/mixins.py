@@ -1,10 +1,46 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, TypeVar, Union, cast
-
-from django.db import models
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from django.apps import apps
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, connections, models, router, transaction
+from django.utils import timezone
 
 from typing_extensions import TypedDict
 
-from .abstract_watcher import AbstractWatcher
+from .abstract_watcher import _INSTANCE, _QUERY_SET, AbstractWatcher
+from .cache import _is_alive
+from .search import SearchBackend, queue_pks
+from .utils import (
+    can_delete_returning,
+    can_update_returning,
+    delete_returning,
+    get_changed_fields,
+    insert_select,
+    match_existing,
+    resolve_callables,
+    retry_on_conflict,
+    track_saved,
+    update_returning,
+)
 
 
 class _MetaParams(TypedDict):
@@ -14,11 +50,10 @@ class _MetaParams(TypedDict):
 
 class MetaParams(_MetaParams, total=False):
     instance_ref: models.Model
+    returning: List[Dict[str, Any]]
+    changed_fields: Set[str]
 
 
-_INSTANCE = 'instance'
-_QUERY_SET = 'query_set'
-
 if TYPE_CHECKING:
 
     class WatchedDeleteModel(models.Model):
@@ -36,6 +71,12 @@ if TYPE_CHECKING:
         def UNWATCHED_create(self, *args: Any, **kwargs: Any) -> S:  # nopep8
             pass
 
+        def UNWATCHED_save_many(self, instances: List[S], **kwargs: Any) -> List[S]:  # nopep8
+            pass
+
+        def UNWATCHED_upsert(self, instances: List[S], **kwargs: Any) -> List[S]:  # nopep8
+            pass
+
     class WatchedDeleteQuerySet(models.QuerySet):
         def UNWATCHED_delete(self, *args, **kwargs) -> Tuple[int, Dict[str, int]]:  # nopep8
             pass
@@ -44,13 +85,162 @@ if TYPE_CHECKING:
         def UNWATCHED_update(self, **kwargs: Any) -> int:  # nopep8
             pass
 
+        def UNWATCHED_save_many(self, instances: List[S], **kwargs: Any) -> List[S]:  # nopep8
+            pass
+
+        def UNWATCHED_upsert(self, instances: List[S], **kwargs: Any) -> List[S]:  # nopep8
+            pass
+
     class WatchedSaveQuerySet(WatchedCreateQuerySet, WatchedUpdateQuerySet):
         ...
 
     TargetDelete = Union['D', 'WatchedDeleteQuerySet']
+    TargetMany = Union['WatchedCreateQuerySet', 'WatchedUpdateQuerySet']
+
+
+# Hooks of instance and queryset updates, which watch_fields may skip
+_UPDATE_HOOKS = ('pre_save', 'pre_update', 'post_update', 'post_save')
+_POST_UPDATE_HOOKS = ('post_update', 'post_save')
+
+
+def _without_hooks_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in kwargs.items() if not k.startswith('hooks__')}
+
+
+def _target_pks(
+    watcher: AbstractWatcher, target: models.QuerySet, meta_params: 'MetaParams'
+) -> List[Any]:
+    # Instances and snapshots have their pks in memory, querysets select them
+    if 'instance_ref' in meta_params:
+        return [meta_params['instance_ref'].pk]
+    if watcher.is_snapshot(target):
+        return [instance.pk for instance in target]
+    return list(target.values_list('pk', flat=True))
+
+
+# pylint: disable=protected-access
+class _CreateOrUpdateWatcherMixin(AbstractWatcher):
+    """
+    _CreateOrUpdateWatcherMixin implements the watched get_or_create, update_or_create and upsert,
+    which bulk_update_or_create is an alias of, each one inside a single transaction. Rows are
+    created and updated with _create_instance and _update_instance, or _watched_save_many for
+    lists, which the create and update mixins override to trigger their hooks.
+    """
 
+    # The watched save_many, implemented by the create and update mixins
+    _watched_save_many: Callable[..., List['S']]
 
-class CreateWatcherMixin(AbstractWatcher):
+    def _create_instance(
+        self, target: models.QuerySet, params: Dict[str, Any], *_, hooks_params
+    ) -> 'S':
+        instance = target.model(**params)
+        self.call_unwatched('save', instance.UNWATCHED_save, force_insert=True, using=self.using)
+        return instance
+
+    def _update_instance(self, target: 'S', *_, hooks_params) -> None:
+        self.call_unwatched('save', target.UNWATCHED_save, using=self.using)
+
+    def _get_or_create(
+        self, target: models.QuerySet, defaults: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Tuple['S', bool]:
+        hooks_kwargs = {k: kwargs.pop(k) for k in list(kwargs) if k.startswith('hooks__')}
+        cast(Any, target)._for_write = True
+        try:
+            return target.get(**kwargs), False
+        except target.model.DoesNotExist:
+            params = resolve_callables(cast(Any, target)._extract_model_params(defaults, **kwargs))
+        try:
+            instance = self._run_inside_transaction(
+                self._create_instance, target, params, **hooks_kwargs
+            )
+            return instance, True
+        except IntegrityError:
+            try:
+                return target.get(**kwargs), False
+            except target.model.DoesNotExist:
+                pass
+            raise
+
+    def _watched_update_or_create(
+        self,
+        target: models.QuerySet,
+        defaults: Dict[str, Any],
+        lookup: Dict[str, Any],
+        *_,
+        hooks_params,
+    ) -> Tuple['S', bool]:
+        try:
+            instance = target.select_for_update().get(**lookup)
+        except target.model.DoesNotExist:
+            params = resolve_callables(cast(Any, target)._extract_model_params(defaults, **lookup))
+            return self._create_instance(target, params, hooks_params=hooks_params), True
+
+        for k, v in resolve_callables(defaults).items():
+            setattr(instance, k, v)
+        self._update_instance(instance, hooks_params=hooks_params)
+        return instance, False
+
+    def _update_or_create(
+        self, target: models.QuerySet, defaults: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Tuple['S', bool]:
+        hooks_kwargs = {k: kwargs.pop(k) for k in list(kwargs) if k.startswith('hooks__')}
+        cast(Any, target)._for_write = True
+        args = (self._watched_update_or_create, target, defaults or {}, kwargs)
+        try:
+            return self._run_inside_transaction(*args, **hooks_kwargs)
+        except IntegrityError:
+            if not target.filter(**kwargs).exists():
+                raise
+            # A concurrent transaction created the row first, so it's updated instead
+            return self._run_inside_transaction(*args, **hooks_kwargs)
+
+    def _bulk_update_or_create(
+        self, target: 'TargetMany', instances: List['S'], match_fields: List[str], *args, **kwargs
+    ) -> List['S']:
+        # The positional params of bulk_update_or_create, which upsert takes in another order
+        kwargs.update(zip(('batch_size', 'update_fields'), args))
+        return self._upsert(target, instances, match_fields, **kwargs)
+
+    def _watched_upsert(
+        self,
+        target: 'TargetMany',
+        instances: List['S'],
+        unique_fields: List[str],
+        *_,
+        hooks_params,
+        **kwargs,
+    ) -> List['S']:
+        match_existing(target, instances, unique_fields)
+        return self._watched_save_many(
+            target,
+            instances,
+            hooks_params=hooks_params,
+            _upsert=True,
+            unique_fields=unique_fields,
+            **kwargs,
+        )
+
+    def _upsert(self, target: 'TargetMany', instances: List['S'], *args, **kwargs) -> List['S']:
+        cast(Any, target)._for_write = True
+        return retry_on_conflict(
+            instances,
+            lambda: self._run_inside_transaction(
+                self._watched_upsert, target, instances, *args, **kwargs
+            ),
+        )
+
+    def _write_many(
+        self, target: 'TargetMany', instances: List['S'], upsert: bool, **kwargs
+    ) -> None:
+        if upsert:
+            self.call_unwatched(
+                'upsert', target.UNWATCHED_upsert, instances, _matched=True, **kwargs
+            )
+        else:
+            self.call_unwatched('save_many', target.UNWATCHED_save_many, instances, **kwargs)
+
+
+class CreateWatcherMixin(_CreateOrUpdateWatcherMixin):
     """
     CreateWatcherMixin is a DataWatcher for create operations
     Implement the methods you need choosing one or more of the following
@@ -71,17 +261,29 @@ class CreateWatcherMixin(AbstractWatcher):
     def _watched_create(self, target: 'WatchedCreateQuerySet', *_, hooks_params, **kwargs) -> 'S':
         meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
 
+        instance = target.model(**kwargs)
         if self.is_overriden('pre_create'):
-            instance = target.model(**kwargs)
-            self.pre_create([instance], meta_params, **hooks_params)
-        instance = target.UNWATCHED_create(**kwargs)
+            self.call_hook('pre_create', [instance], meta_params, **hooks_params)
+        self.call_unwatched('create', target.UNWATCHED_create, _instance=instance)
         if self.is_overriden('post_create'):
-            self.post_create(self.to_queryset(instance), meta_params, **hooks_params)
+            self.call_hook(
+                'post_create',
+                self.project('post_create', self.to_post_queryset(instance)),
+                meta_params,
+                **hooks_params,
+            )
         return instance
 
     def _create(self, target: 'WatchedCreateQuerySet', *args, **kwargs) -> 'S':
         return self._run_inside_transaction(self._watched_create, target, *args, **kwargs)
 
+    def _create_instance(
+        self, target: models.QuerySet, params: Dict[str, Any], *_, hooks_params
+    ) -> 'S':
+        return self._watched_create(
+            cast('WatchedCreateQuerySet', target), hooks_params=hooks_params, **params
+        )
+
     def _watched_save(self, target: 'S', *_, hooks_params, **kwargs) -> None:
         meta_params: MetaParams = {
             'source': _INSTANCE,
@@ -89,17 +291,47 @@ class CreateWatcherMixin(AbstractWatcher):
             'instance_ref': target,
         }
 
-        self.pre_create([target], meta_params, **hooks_params)
-        target.UNWATCHED_save(**kwargs)
+        self.call_hook('pre_create', [target], meta_params, **hooks_params)
+        self.call_unwatched('save', target.UNWATCHED_save, **kwargs)
         if self.is_overriden('post_create'):
-            self.post_create(self.to_queryset(target), meta_params, **hooks_params)
+            self.call_hook(
+                'post_create',
+                self.project('post_create', self.to_post_queryset(target)),
+                meta_params,
+                **hooks_params,
+            )
 
     def _save(self, target: 'S', **kwargs) -> None:
         create = not target.pk
         if create:
             self._run_inside_transaction(self._watched_save, target, **kwargs)
         else:
-            target.UNWATCHED_save(**kwargs)
+            self.call_unwatched('save', target.UNWATCHED_save, **kwargs)
+
+    def _watched_save_many(
+        self,
+        target: 'TargetMany',
+        instances: List['S'],
+        *_,
+        hooks_params,
+        _upsert: bool = False,
+        **kwargs,
+    ) -> List['S']:
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
+
+        created = [instance for instance in instances if instance._state.adding]
+        if created and self.is_overriden('pre_create'):
+            self.call_hook('pre_create', created, meta_params, **hooks_params)
+        self._write_many(target, instances, _upsert, **kwargs)
+        if created and self.is_overriden('post_create'):
+            qs = self.pin_queryset(target, [instance.pk for instance in created])
+            self.call_hook(
+                'post_create', self.project('post_create', qs), meta_params, **hooks_params
+            )
+        return instances
+
+    def _save_many(self, target: 'TargetMany', *args, **kwargs) -> List['S']:
+        return self._run_inside_transaction(self._watched_save_many, target, *args, **kwargs)
 
 
 class DeleteWatcherMixin(AbstractWatcher):
@@ -114,6 +346,10 @@ class DeleteWatcherMixin(AbstractWatcher):
         ...
     """
 
+    # Set to True to delete querysets with a single DELETE ... RETURNING, which loads the instances
+    # given to post_delete, where the database supports it and the rows have no cascades or signals
+    delete_returning = False
+
     def pre_delete(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
         pass
 
@@ -122,26 +358,55 @@ class DeleteWatcherMixin(AbstractWatcher):
     ) -> None:
         pass
 
+    def _delete_meta_params(self, target: 'TargetDelete', kwargs: Dict[str, Any]) -> MetaParams:
+        if self.is_queryset(target):
+            return {'source': _QUERY_SET, 'operation_params': kwargs}
+        return {
+            'source': _INSTANCE,
+            'operation_params': kwargs,
+            'instance_ref': cast('WatchedDeleteModel', target),
+        }
+
     def _watched_delete(
         self, target: 'TargetDelete', *args: Any, hooks_params, **kwargs: Any
     ) -> Tuple[int, Dict[str, int]]:
-        meta_params: MetaParams = (
-            {
-                'source': _QUERY_SET,
-                'operation_params': kwargs,
-            }
-            if self.is_queryset(target)
-            else {
-                'source': _INSTANCE,
-                'operation_params': kwargs,
-                'instance_ref': cast('WatchedDeleteModel', target),
-            }
-        )
+        meta_params = self._delete_meta_params(target, kwargs)
 
-        self.pre_delete(self.to_queryset(target), meta_params, **hooks_params)
-        instances = list(self.to_queryset(target)) if self.is_overriden('post_delete') else []
-        res = target.UNWATCHED_delete(*args, **kwargs)
-        self.post_delete(instances, meta_params, **hooks_params)
+        queryset = self.to_pre_queryset(target)
+        if self.skips_instance(target, queryset):
+            return 0, {queryset.model._meta.label: 0}  # pylint: disable=protected-access
+        if self.is_queryset(target):
+            target = queryset
+
+        self.call_hook(
+            'pre_delete', self.project('pre_delete', queryset), meta_params, **hooks_params
+        )
+        if (
+            self.delete_returning
+            and self.is_queryset(target)
+            and not self.is_snapshot(target)
+            and self.is_native(target, 'delete')
+            and not args
+            and not kwargs
+            and self.is_overriden('post_delete')
+            and can_delete_returning(target, cast(str, self.using))
+        ):
+            count, instances = self.call_unwatched(
+                'delete', delete_returning, target, self.using, self.hook_fields.get('post_delete')
+            )
+            res = (count, {target.model._meta.label: count})  # pylint: disable=protected-access
+        else:
+            instances = (
+                list(
+                    queryset
+                    if self.is_snapshot(queryset)
+                    else self.project('post_delete', self.to_queryset(target))
+                )
+                if self.is_overriden('post_delete')
+                else []
+            )
+            res = self.call_unwatched('delete', target.UNWATCHED_delete, *args, **kwargs)
+        self.call_hook('post_delete', instances, meta_params, **hooks_params)
         return res
 
     def _delete(
@@ -150,7 +415,167 @@ class DeleteWatcherMixin(AbstractWatcher):
         return self._run_inside_transaction(self._watched_delete, target, *args, **kwargs)
 
 
-class UpdateWatcherMixin(AbstractWatcher):
+# pylint: disable=protected-access
+class ArchiveWatcherMixin(DeleteWatcherMixin):
+    """
+    ArchiveWatcherMixin is a DeleteWatcherMixin which copies the deleted rows into the table of
+    `archive_model`, with a single INSERT ... SELECT in the transaction of the delete, before
+    running it. Rows deleted by cascades aren't archived.
+    Implement the hooks of DeleteWatcherMixin
+    """
+
+    # The model the deleted rows are copied to, or its 'app_label.ModelName'
+    archive_model: Optional[Union[Type[models.Model], str]] = None
+    # The fields of archive_model and the field names of the watched model, or the expressions,
+    # they are filled with, e.g. {'original_id': 'id', 'archived_at': Now()}.
+    # By default, the fields having the same name on both models, except an archive auto pk
+    archive_fields: Dict[str, Any] = {}
+
+    def get_archive_model(self) -> Type[models.Model]:
+        if self.archive_model is None:
+            raise ImproperlyConfigured(f'{type(self).__name__} has no archive_model')
+        if isinstance(self.archive_model, str):
+            return apps.get_model(self.archive_model)
+        return self.archive_model
+
+    def get_archive_fields(self, model: Type[models.Model]) -> Dict[str, Any]:
+        if self.archive_fields:
+            return self.archive_fields
+        archive_opts = self.get_archive_model()._meta
+        names = {field.name for field in model._meta.concrete_fields}
+        return {
+            field.name: field.name
+            for field in archive_opts.concrete_fields
+            if field.name in names
+            and not (field.primary_key and isinstance(field, models.AutoField))
+        }
+
+    def _watched_delete(
+        self, target: 'TargetDelete', *args: Any, hooks_params, **kwargs: Any
+    ) -> Tuple[int, Dict[str, int]]:
+        # Archive and delete the same rows, the snapshot of the locked ones with select_for_update,
+        # which skip_locked may leave out of target. Other querysets are pinned to the pks of their
+        # rows, so a row committed between the archive and the delete isn't deleted unarchived.
+        queryset = self.to_pre_queryset(target)
+        if self.is_queryset(target):
+            if not self.is_snapshot(queryset):
+                queryset = self.pin_queryset(queryset, queryset.values_list('pk', flat=True))
+            target = queryset
+        self.call_unwatched(
+            'archive',
+            insert_select,
+            queryset,
+            self.get_archive_model(),
+            self.get_archive_fields(queryset.model),
+            self.using,
+        )
+        return super()._watched_delete(target, *args, hooks_params=hooks_params, **kwargs)
+
+
+# pylint: disable=protected-access
+class SoftDeleteWatcherMixin(DeleteWatcherMixin):
+    """
+    SoftDeleteWatcherMixin is a DeleteWatcherMixin which soft deletes rows: delete sets their
+    `deleted_field` with a single UPDATE instead of deleting them. The watched managers exclude
+    soft deleted rows, the `all_objects` manager keeps them, and purge hard deletes them.
+    Implement the hooks of DeleteWatcherMixin, post_delete receives the soft deleted instances.
+    """
+
+    # Nullable DateTimeField of the model, set when rows are soft deleted
+    deleted_field = 'deleted_at'
+    # Number of rows hard deleted by each transaction of purge
+    purge_batch_size = 1000
+
+    def _watched_delete(
+        self, target: 'TargetDelete', *args: Any, hooks_params, **kwargs: Any
+    ) -> Tuple[int, Dict[str, int]]:
+        meta_params = self._delete_meta_params(target, kwargs)
+
+        queryset = self.to_pre_queryset(target)
+        if self.skips_instance(target, queryset):
+            return 0, {queryset.model._meta.label: 0}
+        self.call_hook(
+            'pre_delete', self.project('pre_delete', queryset), meta_params, **hooks_params
+        )
+
+        live = queryset.filter(**{f'{self.deleted_field}__isnull': True})
+        values = {self.deleted_field: timezone.now()}
+        if self.is_overriden('post_delete'):
+            instances = self._soft_delete_returning(live, values)
+            count = len(instances)
+        else:
+            instances = []
+            count = self.call_unwatched('delete', models.QuerySet.update, live, **values)
+        if count and not self.is_queryset(target):
+            setattr(target, self.deleted_field, values[self.deleted_field])
+
+        self.call_hook('post_delete', instances, meta_params, **hooks_params)
+        return count, {live.model._meta.label: count}
+
+    def _soft_delete_returning(
+        self, live: models.QuerySet, values: Dict[str, Any]
+    ) -> List[models.Model]:
+        model = live.model
+        opts = model._meta
+        # Instances are built with their values in model order, as from_db expects
+        fields = opts.concrete_fields
+        names = self.hook_fields.get('post_delete')
+        if names:
+            loaded = {opts.get_field(name).attname for name in names} | {opts.pk.attname}
+            fields = [field for field in fields if field.attname in loaded]
+        # RETURNING reads the model table, fields of parent models are read before the update
+        local = all(field.model._meta.concrete_model is opts.concrete_model for field in fields)
+        if local and can_update_returning(live, cast(str, self.using), values):
+            attnames = [field.attname for field in fields if not field.primary_key]
+            rows = self.call_unwatched(
+                'delete', update_returning, live, self.using, values, attnames
+            )
+            return [
+                model.from_db(
+                    self.using,
+                    [field.attname for field in fields],
+                    [row['pk'] if field.primary_key else row[field.attname] for field in fields],
+                )
+                for row in rows
+            ]
+
+        instances = list(self.project('post_delete', live))
+        pinned = self.pin_queryset(live, [instance.pk for instance in instances])
+        self.call_unwatched('delete', models.QuerySet.update, pinned, **values)
+        attname = opts.get_field(self.deleted_field).attname
+        for instance in instances:
+            if attname not in instance.get_deferred_fields():
+                setattr(instance, attname, values[self.deleted_field])
+        return instances
+
+    def purge(self, before: Optional[datetime] = None, using: Optional[str] = None) -> int:
+        """
+        purge hard deletes the soft deleted rows, in transactions of purge_batch_size rows,
+        without running the hooks
+
+        :param before: Purge only the rows soft deleted before it
+        :param using: The database alias, the one given by the routers by default
+        :returns: The number of purged rows
+        """
+        model = cast(Type[models.Model], self.model)
+        using = using or router.db_for_write(model)
+        filters: Dict[str, Any] = {f'{self.deleted_field}__isnull': False}
+        if before is not None:
+            filters[f'{self.deleted_field}__lt'] = before
+        # Plain querysets, reaching soft deleted rows without triggering the watched delete
+        deleted = models.QuerySet(model=model, using=using).filter(**filters)
+
+        purged = 0
+        while True:
+            pks = list(deleted.values_list('pk', flat=True)[: self.purge_batch_size])
+            if not pks:
+                return purged
+            with transaction.atomic(using=using):
+                models.QuerySet(model=model, using=using).filter(pk__in=pks).delete()
+            purged += len(pks)
+
+
+class UpdateWatcherMixin(_CreateOrUpdateWatcherMixin):
     """
     UpdateWatcherMixin is a DataWatcher for update operations
     Implement the methods you need, choosing one or more of the following
@@ -162,44 +587,256 @@ class UpdateWatcherMixin(AbstractWatcher):
         ...
     """
 
+    # Set to True to update querysets with a single UPDATE ... RETURNING, where the database
+    # supports it, giving post hooks a queryset pinned to the updated pks and the returned rows in
+    # meta_params['returning']. Set to a list of field names to return their values too.
+    # Elsewhere the pks are selected before the update.
+    update_returning: Union[bool, List[str]] = False
+    # Set to True to keep the values instances are loaded with: saves of instances with no changed
+    # field skip the hooks and the write, other saves write only the changed fields, which are
+    # given to the hooks in meta_params['changed_fields']
+    track_changes = False
+    # Fields changed on the instance of the running save, set when track_changes is on
+    changed_fields: Optional[Set[str]] = None
+    # Fields watched by each update hook, e.g. {'post_update': {'status', 'owner'}}. The hook is
+    # skipped when an update doesn't touch them: neither the update() kwargs nor the update_fields,
+    # or the changed fields with track_changes, of an instance save. Without hooks left to run,
+    # the update runs outside a transaction.
+    watch_fields: Dict[str, Set[str]] = {}
+    # Fields written by the running update, None when unknown or without watch_fields
+    touched_fields: Optional[Set[str]] = None
+    # Set to True to exclude from queryset updates the rows already having the update values, so
+    # only rows which change are written and given to the hooks, and update() returns their count.
+    # Used when every update value is a literal, not an expression like F('count') + 1.
+    skip_noop_updates = False
+    # Max number of pks of each pinned queryset given to post hooks, with update_returning or
+    # skip_noop_updates. Post hooks run once per batch of updated rows.
+    post_update_batch_size = 500
+
     def pre_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
         pass
 
     def post_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
         pass
 
+    def _update_target(
+        self, target: 'WatchedUpdateQuerySet', *args, meta_params: MetaParams, **kwargs
+    ) -> Tuple[int, List[Tuple[models.QuerySet, MetaParams]]]:
+        """
+        _update_target runs the update of target, returning its count and the querysets and
+        meta_params given to post hooks, one pair per batch when they're pinned to the updated pks
+        """
+        # rows excluded by skip_noop_updates match the target again after the update
+        pin = (self.update_returning or self.skip_noop_updates) and any(
+            self.is_overriden(hook) and self.watches(hook) for hook in _POST_UPDATE_HOOKS
+        )
+        if not pin or not target.query.can_filter():
+            result = self.call_unwatched('update', target.UNWATCHED_update, *args, **kwargs)
+            return result, [(self.refetch(target), meta_params)]
+
+        fields = self.update_returning if isinstance(self.update_returning, list) else []
+        returned = (
+            self.is_native(target, 'update')
+            and not args
+            and can_update_returning(target, cast(str, self.using), kwargs)
+        )
+        if returned:
+            rows = self.call_unwatched(
+                'update', update_returning, target, self.using, kwargs, fields
+            )
+            result = len(rows)
+        else:
+            rows = [{'pk': pk} for pk in target.values_list('pk', flat=True)]
+            result = self.call_unwatched('update', target.UNWATCHED_update, *args, **kwargs)
+
+        batches = []
+        size = self.post_update_batch_size
+        for i in range(0, max(len(rows), 1), size):
+            batch = rows[i : i + size]
+            queryset = self.pin_queryset(target, [row['pk'] for row in batch])
+            batch_params = meta_params
+            if self.update_returning:
+                if fields and not returned:
+                    batch = list(queryset.values('pk', *fields))
+                batch_params = meta_params.copy()
+                batch_params['returning'] = batch
+            batches.append((queryset, batch_params))
+        return result, batches
+
     def _watched_update(
         self, target: 'WatchedUpdateQuerySet', *args, hooks_params, **kwargs
     ) -> int:
         meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
 
-        self.pre_update(target, meta_params, **hooks_params)
-        result = target.UNWATCHED_update(*args, **kwargs)
-        self.post_update(target, meta_params, **hooks_params)
+        target = cast('WatchedUpdateQuerySet', self.to_pre_queryset(target))
+        self.call_hook(
+            'pre_update', self.project('pre_update', target), meta_params, **hooks_params
+        )
+        result, batches = self._update_target(target, *args, meta_params=meta_params, **kwargs)
+        for queryset, batch_params in batches:
+            self.call_hook(
+                'post_update', self.project('post_update', queryset), batch_params, **hooks_params
+            )
         return result
 
+    def _exclude_noop(
+        self, target: 'WatchedUpdateQuerySet', kwargs: Dict[str, Any]
+    ) -> 'WatchedUpdateQuerySet':
+        values = _without_hooks_params(kwargs)
+        if (
+            not self.skip_noop_updates
+            or not values
+            or not target.query.can_filter()
+            or any(hasattr(value, 'resolve_expression') for value in values.values())
+        ):
+            return target
+        return cast('WatchedUpdateQuerySet', target.exclude(**values))
+
     def _update(self, target: 'WatchedUpdateQuerySet', *update_args, **kwargs) -> int:
+        target = self._exclude_noop(target, kwargs)
+        if not self._watches_update(target, kwargs):
+            return self.call_unwatched(
+                'update', target.UNWATCHED_update, *update_args, **_without_hooks_params(kwargs)
+            )
         return self._run_inside_transaction(self._watched_update, target, *update_args, **kwargs)
 
-    def _watched_save(self, target: 'S', *_, hooks_params, **kwargs) -> None:
+    def watches(self, hook: str) -> bool:
+        """
+        watches tells if the hook runs for the running update, given its watch_fields
+        """
+        fields = self.watch_fields.get(hook)
+        return fields is None or self.touched_fields is None or bool(fields & self.touched_fields)
+
+    def call_hook(self, hook: str, *args: Any, **kwargs: Any) -> Any:
+        if not self.watches(hook):
+            return None
+        return super().call_hook(hook, *args, **kwargs)
+
+    # pylint: disable=protected-access
+    def _watches_update(self, target: Union['S', models.QuerySet], kwargs: Dict[str, Any]) -> bool:
+        """
+        _watches_update sets touched_fields for the update of target, the queryset updated with
+        kwargs or the saved instance, telling if any of its hooks runs
+        """
+        if not self.watch_fields:
+            return True
+
+        names: Optional[Iterable[str]]
+        if self.is_queryset(target):
+            opts = cast(models.QuerySet, target).model._meta
+            names = [name for name in kwargs if not name.startswith('hooks__')]
+        else:
+            opts = cast('S', target)._meta
+            names = kwargs.get('update_fields')
+        if self.changed_fields is not None:
+            self.touched_fields = self.changed_fields
+        elif names is not None:
+            self.touched_fields = {opts.get_field(name).name for name in names}
+        return any(self.is_overriden(hook) and self.watches(hook) for hook in _UPDATE_HOOKS)
+
+    def _update_instance(self, target: 'S', *_, hooks_params) -> None:
+        self._watched_save(target, hooks_params=hooks_params, using=self.using)
+
+    # pylint: disable=protected-access
+    def _get_changed_fields(self, target: 'S', kwargs: Dict[str, Any]) -> Optional[Set[str]]:
+        if not self.track_changes or target._state.adding or kwargs.get('force_insert'):
+            return None
+        changed = get_changed_fields(target)
+        if changed is None or cast(models.Field, target._meta.pk).name in changed:
+            return None
+        if kwargs.get('update_fields') is not None:
+            changed &= {target._meta.get_field(name).name for name in kwargs['update_fields']}
+        return changed
+
+    def _skip_unchanged(self, target: 'S', kwargs: Dict[str, Any]) -> bool:
+        """
+        _skip_unchanged sets changed_fields for the save of target, telling if it has nothing to
+        write
+        """
+        self.changed_fields = self._get_changed_fields(target, kwargs)
+        return self.changed_fields is not None and not self.changed_fields
+
+    def _instance_meta_params(self, target: 'S', kwargs: Dict[str, Any]) -> MetaParams:
         meta_params: MetaParams = {
             'source': _INSTANCE,
             'operation_params': kwargs,
             'instance_ref': target,
         }
+        if self.changed_fields is not None:
+            meta_params['changed_fields'] = self.changed_fields
+        return meta_params
+
+    # pylint: disable=protected-access
+    def _save_instance(self, target: 'S', **kwargs) -> None:
+        # changed fields are taken again, after pre hooks which may have changed the instance
+        changed = self._get_changed_fields(target, kwargs)
+        if changed is not None:
+            kwargs['update_fields'] = [
+                field.name
+                for field in target._meta.concrete_fields
+                if field.name in changed or (changed and getattr(field, 'auto_now', False))
+            ]
+        self.call_unwatched('save', target.UNWATCHED_save, **kwargs)
+        if self.track_changes:
+            track_saved(target, kwargs.get('update_fields'))
 
-        if self.is_overriden('pre_update'):
-            self.pre_update(self.to_queryset(target), meta_params, **hooks_params)
-        target.UNWATCHED_save(**kwargs)
+    def _watched_save(self, target: 'S', *_, hooks_params, **kwargs) -> None:
+        meta_params = self._instance_meta_params(target, kwargs)
+
+        if self.select_for_update or self.is_overriden('pre_update'):
+            queryset = self.to_pre_queryset(target)
+            if self.skips_instance(target, queryset):
+                return
+            self.call_hook(
+                'pre_update', self.project('pre_update', queryset), meta_params, **hooks_params
+            )
+        self._save_instance(target, **kwargs)
         if self.is_overriden('post_update'):
-            self.post_update(self.to_queryset(target), meta_params, **hooks_params)
+            self.call_hook(
+                'post_update',
+                self.project('post_update', self.to_post_queryset(target)),
+                meta_params,
+                **hooks_params,
+            )
 
     def _save(self, target: 'S', **kwargs) -> None:
         update = bool(target.pk)
-        if update:
+        if not update:
+            self._save_instance(target, **kwargs)
+        elif self._skip_unchanged(target, kwargs):
+            return
+        elif self._watches_update(target, kwargs):
             self._run_inside_transaction(self._watched_save, target, **kwargs)
         else:
-            target.UNWATCHED_save(**kwargs)
+            self._save_instance(target, **_without_hooks_params(kwargs))
+
+    def _watched_save_many(
+        self,
+        target: 'TargetMany',
+        instances: List['S'],
+        *_,
+        hooks_params,
+        _upsert: bool = False,
+        **kwargs,
+    ) -> List['S']:
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
+
+        updated = [instance.pk for instance in instances if not instance._state.adding]
+        if updated and (self.select_for_update or self.is_overriden('pre_update')):
+            queryset = self.to_pre_queryset(self.pin_queryset(target, updated))
+            self.call_hook(
+                'pre_update', self.project('pre_update', queryset), meta_params, **hooks_params
+            )
+        self._write_many(target, instances, _upsert, **kwargs)
+        if updated and self.is_overriden('post_update'):
+            queryset = self.pin_queryset(target, updated)
+            self.call_hook(
+                'post_update', self.project('post_update', queryset), meta_params, **hooks_params
+            )
+        return instances
+
+    def _save_many(self, target: 'TargetMany', *args, **kwargs) -> List['S']:
+        return self._run_inside_transaction(self._watched_save_many, target, *args, **kwargs)
 
 
 class SaveWatcherMixin(CreateWatcherMixin, UpdateWatcherMixin):
@@ -240,49 +877,497 @@ class SaveWatcherMixin(CreateWatcherMixin, UpdateWatcherMixin):
     def _watched_save(self, target: 'S', *_, hooks_params, **kwargs) -> None:
         create = not target.pk
 
-        meta_params: MetaParams = {
-            'source': _INSTANCE,
-            'operation_params': kwargs,
-            'instance_ref': target,
-        }
+        meta_params = self._instance_meta_params(target, kwargs)
 
         if create:
-            self.pre_save([target], meta_params, **hooks_params)
-            self.pre_create([target], meta_params, **hooks_params)
+            self.call_hook('pre_save', [target], meta_params, **hooks_params)
+            self.call_hook('pre_create', [target], meta_params, **hooks_params)
         else:
-            qs = self.to_queryset(target)
-            self.pre_save(qs, meta_params, **hooks_params)
-            self.pre_update(qs, meta_params, **hooks_params)
+            qs = self.to_pre_queryset(target)
+            if self.skips_instance(target, qs):
+                return
+            self.call_hook('pre_save', self.project('pre_save', qs), meta_params, **hooks_params)
+            self.call_hook(
+                'pre_update', self.project('pre_update', qs), meta_params, **hooks_params
+            )
 
-        target.UNWATCHED_save(**kwargs)
+        self._save_instance(target, **kwargs)
 
-        qs = self.to_queryset(target)
+        qs = self.to_post_queryset(target)
         if create:
-            self.post_create(qs, meta_params, **hooks_params)
+            self.call_hook(
+                'post_create', self.project('post_create', qs), meta_params, **hooks_params
+            )
         else:
-            self.post_update(qs, meta_params, **hooks_params)
+            self.call_hook(
+                'post_update', self.project('post_update', qs), meta_params, **hooks_params
+            )
 
-        self.post_save(qs, meta_params, **hooks_params)
+        self.call_hook('post_save', self.project('post_save', qs), meta_params, **hooks_params)
 
     def _save(self, target: 'S', **kwargs) -> None:
+        if target.pk:
+            if self._skip_unchanged(target, kwargs):
+                return
+            if not self._watches_update(target, kwargs):
+                self._save_instance(target, **_without_hooks_params(kwargs))
+                return
         self._run_inside_transaction(self._watched_save, target, **kwargs)
 
     def _watched_create(self, target: 'WatchedCreateQuerySet', *_, hooks_params, **kwargs) -> 'S':
         meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
 
-        self.pre_save([target.model(**kwargs)], meta_params, **hooks_params)
-        instance: 'WatchedSaveModel' = super()._watched_create(
-            target, hooks_params=hooks_params, **kwargs
-        )
-        self.post_save(self.to_queryset(instance), meta_params, **hooks_params)
-        return instance  # type: ignore
+        instance = target.model(**kwargs)
+        self.call_hook('pre_save', [instance], meta_params, **hooks_params)
+        self.call_hook('pre_create', [instance], meta_params, **hooks_params)
+
+        self.call_unwatched('create', target.UNWATCHED_create, _instance=instance)
+
+        qs = self.to_post_queryset(instance)
+        self.call_hook('post_create', self.project('post_create', qs), meta_params, **hooks_params)
+        self.call_hook('post_save', self.project('post_save', qs), meta_params, **hooks_params)
+        return instance
 
     def _watched_update(
         self, target: 'WatchedUpdateQuerySet', *args, hooks_params, **kwargs
     ) -> int:
         meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
 
-        self.pre_save(target, meta_params, **hooks_params)
-        res = super()._watched_update(target, *args, hooks_params=hooks_params, **kwargs)
-        self.post_save(target, meta_params, **hooks_params)
-        return res
+        target = cast('WatchedUpdateQuerySet', self.to_pre_queryset(target))
+        self.call_hook('pre_save', self.project('pre_save', target), meta_params, **hooks_params)
+        self.call_hook(
+            'pre_update', self.project('pre_update', target), meta_params, **hooks_params
+        )
+        result, batches = self._update_target(target, *args, meta_params=meta_params, **kwargs)
+        for queryset, batch_params in batches:
+            self.call_hook(
+                'post_update', self.project('post_update', queryset), batch_params, **hooks_params
+            )
+        for queryset, batch_params in batches:
+            self.call_hook(
+                'post_save', self.project('post_save', queryset), batch_params, **hooks_params
+            )
+        return result
+
+    def _watched_save_many(
+        self,
+        target: 'TargetMany',
+        instances: List['S'],
+        *_,
+        hooks_params,
+        _upsert: bool = False,
+        **kwargs,
+    ) -> List['S']:
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': kwargs}
+
+        created = [instance for instance in instances if instance._state.adding]
+        updated = [instance.pk for instance in instances if not instance._state.adding]
+
+        self.call_hook('pre_save', instances, meta_params, **hooks_params)
+        if created:
+            self.call_hook('pre_create', created, meta_params, **hooks_params)
+        if updated:
+            queryset = self.to_pre_queryset(self.pin_queryset(target, updated))
+            self.call_hook(
+                'pre_update', self.project('pre_update', queryset), meta_params, **hooks_params
+            )
+
+        self._write_many(target, instances, _upsert, **kwargs)
+
+        if created:
+            queryset = self.pin_queryset(target, [instance.pk for instance in created])
+            self.call_hook(
+                'post_create', self.project('post_create', queryset), meta_params, **hooks_params
+            )
+        if updated:
+            queryset = self.pin_queryset(target, updated)
+            self.call_hook(
+                'post_update', self.project('post_update', queryset), meta_params, **hooks_params
+            )
+
+        queryset = self.pin_queryset(target, [instance.pk for instance in instances])
+        self.call_hook(
+            'post_save', self.project('post_save', queryset), meta_params, **hooks_params
+        )
+        return instances
+
+
+# pylint: disable=protected-access
+class CounterCacheWatcherMixin(SaveWatcherMixin, DeleteWatcherMixin):
+    """
+    CounterCacheWatcherMixin keeps counter fields of parent models in sync with the number of
+    their watched rows, on creates, deletes and updates reassigning the foreign key. Rows are
+    counted by parent with one GROUP BY query and counters are changed with one UPDATE per
+    batch of parents, without triggering the parent watchers.
+    It implements pre_delete, post_create, pre_update and post_update, overrides must call super.
+    """
+
+    # The foreign keys of the watched model and the counter fields of the models they point to,
+    # e.g. [('parent', 'children_count')]
+    counter_caches: List[Tuple[str, str]] = []
+    # Max number of parents whose counters are changed by each statement
+    counter_batch_size = 500
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Counters decremented by pre_update, by foreign key, applied with the post_update ones
+        self.counter_deltas: Dict[str, Dict[Any, int]] = {}
+        # pks of the rows reassigned by the update, counted again by post_update
+        self.counter_pks: List[Any] = []
+
+    def pre_delete(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_delete(target, meta_params, **hooks_params)
+        for fk, counter in self.counter_caches:
+            deltas = {parent: -count for parent, count in self._count_by_parent(target, fk).items()}
+            self._apply_counter_deltas(target.model, fk, counter, deltas)
+
+    def post_create(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_create(target, meta_params, **hooks_params)
+        for fk, counter in self.counter_caches:
+            self._apply_counter_deltas(target.model, fk, counter, self._count_by_parent(target, fk))
+
+    def pre_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_update(target, meta_params, **hooks_params)
+        for fk, _ in self.counter_caches:
+            if self._reassigns(target.model, fk, meta_params):
+                self.counter_deltas[fk] = {
+                    parent: -count for parent, count in self._count_by_parent(target, fk).items()
+                }
+        if self.counter_deltas:
+            # The updated rows may not match target anymore, post_update counts them by pk
+            self.counter_pks = _target_pks(self, target, meta_params)
+
+    def post_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_update(target, meta_params, **hooks_params)
+        # Post hooks of pinned updates run once per batch, the first call counts every row
+        if not self.counter_deltas:
+            return
+        size = self.post_update_batch_size
+        batches = [
+            self.pin_queryset(target, self.counter_pks[i : i + size])
+            for i in range(0, len(self.counter_pks), size)
+        ]
+        for fk, counter in self.counter_caches:
+            if fk in self.counter_deltas:
+                deltas = self.counter_deltas.pop(fk)
+                for updated in batches:
+                    for parent, count in self._count_by_parent(updated, fk).items():
+                        deltas[parent] = deltas.get(parent, 0) + count
+                self._apply_counter_deltas(target.model, fk, counter, deltas)
+
+    def _reassigns(self, model: Type[models.Model], fk: str, meta_params: MetaParams) -> bool:
+        field = model._meta.get_field(fk)
+        if 'changed_fields' in meta_params:
+            return field.name in meta_params['changed_fields']
+        params = meta_params['operation_params']
+        names = list(params) if self.operation == 'update' else params.get('update_fields') or None
+        return names is None or bool({field.name, field.attname} & set(names))
+
+    def _count_by_parent(self, target: models.QuerySet, fk: str) -> Dict[Any, int]:
+        attname = target.model._meta.get_field(fk).attname
+        rows = (
+            target.order_by()
+            .values(attname)
+            .annotate(_counter_cache=models.Count('pk'))
+            .values_list(attname, '_counter_cache')
+        )
+        return {parent: count for parent, count in rows if parent is not None}
+
+    def _apply_counter_deltas(
+        self, model: Type[models.Model], fk: str, counter: str, deltas: Dict[Any, int]
+    ) -> None:
+        field = cast(models.ForeignKey, model._meta.get_field(fk))
+        to_field = field.target_field.name
+        # Parents sorted, so concurrent operations lock them in the same order
+        parents = sorted(parent for parent, delta in deltas.items() if delta)
+        for i in range(0, len(parents), self.counter_batch_size):
+            batch = parents[i : i + self.counter_batch_size]
+            by_delta: Dict[int, List[Any]] = defaultdict(list)
+            for parent in batch:
+                by_delta[deltas[parent]].append(parent)
+            value = models.Case(
+                *[
+                    models.When(**{f'{to_field}__in': keys}, then=models.F(counter) + delta)
+                    for delta, keys in by_delta.items()
+                ],
+                default=models.F(counter),
+            )
+            # A plain queryset, so the counters update doesn't trigger the parent watcher
+            queryset = models.QuerySet(model=field.related_model, using=self.using)
+            self.call_unwatched(
+                'update',
+                models.QuerySet.update,
+                queryset.filter(**{f'{to_field}__in': batch}),
+                **{counter: value},
+            )
+
+
+# pylint: disable=protected-access
+class CacheInvalidationWatcherMixin(SaveWatcherMixin, DeleteWatcherMixin):
+    """
+    CacheInvalidationWatcherMixin deletes the cache keys of the rows created, updated or deleted
+    by watched operations, built from `cache_key_template`, with one delete_many per operation,
+    after the transaction commits, so readers can't cache the data being changed again.
+    It implements pre_update, pre_delete and post_create, overrides must call super.
+    """
+
+    # Django cache alias the keys are deleted from
+    cache_alias = 'default'
+    # Cache key of each row, formatted with the model label and the row pk
+    cache_key_template = '{model}:{pk}'
+    # Cache key of a counter incremented by every operation, formatted with the model label, for
+    # caches of many rows to be keyed by it, e.g. '{model}:generation'
+    cache_generation_key: Optional[str] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        # pks of the rows changed by the running operation, None until any is collected
+        self.invalidated_pks: Optional[Set[Any]] = None
+        # The on_commit callback deleting their keys, dropped if its savepoint rolls back
+        self.invalidate_on_commit: Optional[Callable[[], None]] = None
+
+    def pre_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_update(target, meta_params, **hooks_params)
+        self._collect_pks(target, meta_params)
+
+    def pre_delete(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_delete(target, meta_params, **hooks_params)
+        self._collect_pks(target, meta_params)
+
+    def post_create(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_create(target, meta_params, **hooks_params)
+        self._collect_pks(target, meta_params)
+
+    def get_cache_keys(self, pks: Set[Any]) -> List[str]:
+        label = cast(Type[models.Model], self.model)._meta.label
+        return [self.cache_key_template.format(model=label, pk=pk) for pk in pks]
+
+    def _collect_pks(self, target: models.QuerySet, meta_params: MetaParams) -> None:
+        pks = _target_pks(self, target, meta_params)
+        # Retried upserts and update_or_create run the hooks again after rolling back the
+        # savepoint the callback was registered in
+        if self.invalidated_pks is None or not _is_alive(
+            connections[cast(str, self.using)], self.invalidate_on_commit
+        ):
+            self.invalidated_pks = set()
+            self.invalidate_on_commit = self._invalidate
+            transaction.on_commit(self.invalidate_on_commit, using=self.using)
+        self.invalidated_pks.update(pks)
+
+    def _invalidate(self) -> None:
+        cache = caches[self.cache_alias]
+        if self.invalidated_pks:
+            cache.delete_many(self.get_cache_keys(self.invalidated_pks))
+        if self.cache_generation_key:
+            key = self.cache_generation_key.format(
+                model=cast(Type[models.Model], self.model)._meta.label
+            )
+            cache.add(key, 0, timeout=None)
+            cache.incr(key)
+
+
+# pylint: disable=protected-access
+class AuditWatcherMixin(SaveWatcherMixin, DeleteWatcherMixin):
+    """
+    AuditWatcherMixin writes an `audit_model` record for every row created, updated or deleted by
+    watched operations, with the JSON of its audited values, or of the changed ones with their
+    old values for updates, using a single bulk_create per operation.
+    It implements pre_update, post_update, pre_delete and post_create, overrides must call super.
+    """
+
+    # The model of the records, or its 'app_label.ModelName'. It must have the CharFields model,
+    # object_id and action, and the TextField changes, unless get_audit_record is overridden
+    audit_model: Optional[Union[Type[models.Model], str]] = None
+    # The audited field names, by default every concrete field but the pk
+    audit_fields: Optional[List[str]] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Audited values of the rows being updated, by pk, read by pre_update
+        self.audit_old_values: Dict[Any, Dict[str, Any]] = {}
+
+    def pre_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_update(target, meta_params, **hooks_params)
+        self.audit_old_values = self._read_audit_values(target)
+
+    def post_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_update(target, meta_params, **hooks_params)
+        old_values, self.audit_old_values = self.audit_old_values, {}
+        new_values = self._updated_audit_values(target, meta_params, old_values)
+        records = []
+        for pk, old in old_values.items():
+            new = new_values.get(pk, old)
+            changes = {
+                name: [value, new[name]] for name, value in old.items() if value != new[name]
+            }
+            if changes:
+                records.append(self.get_audit_record('update', pk, changes))
+        self._write_audit_records(records)
+
+    def pre_delete(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_delete(target, meta_params, **hooks_params)
+        self._write_audit_records(
+            [
+                self.get_audit_record('delete', pk, values)
+                for pk, values in self._read_audit_values(target).items()
+            ]
+        )
+
+    def post_create(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_create(target, meta_params, **hooks_params)
+        self._write_audit_records(
+            [
+                self.get_audit_record('create', pk, values)
+                for pk, values in self._read_audit_values(target).items()
+            ]
+        )
+
+    def get_audit_model(self) -> Type[models.Model]:
+        if self.audit_model is None:
+            raise ImproperlyConfigured(f'{type(self).__name__} has no audit_model')
+        if isinstance(self.audit_model, str):
+            return apps.get_model(self.audit_model)
+        return self.audit_model
+
+    def get_audit_attnames(self) -> List[str]:
+        opts = cast(Type[models.Model], self.model)._meta
+        if self.audit_fields is not None:
+            return [opts.get_field(name).attname for name in self.audit_fields]
+        return [field.attname for field in opts.concrete_fields if not field.primary_key]
+
+    def get_audit_record(self, action: str, pk: Any, changes: Dict[str, Any]) -> models.Model:
+        """
+        get_audit_record builds the unsaved record of a row
+
+        :param action: 'create', 'update' or 'delete'
+        :param pk: The row pk
+        :param changes: The audited values by attname, or the [old, new] values of the changed ones
+        :returns: The audit_model instance
+        """
+        return self.get_audit_model()(
+            model=cast(Type[models.Model], self.model)._meta.label,
+            object_id=str(pk),
+            action=action,
+            changes=self.encode_changes(changes),
+        )
+
+    def encode_changes(self, changes: Dict[str, Any]) -> str:
+        return json.dumps(changes, cls=DjangoJSONEncoder, separators=(',', ':'), sort_keys=True)
+
+    def _instance_audit_values(self, instances: List[models.Model]) -> Dict[Any, Dict[str, Any]]:
+        attnames = self.get_audit_attnames()
+        return {
+            instance.pk: {attname: getattr(instance, attname) for attname in attnames}
+            for instance in instances
+        }
+
+    def _read_audit_values(self, target: models.QuerySet) -> Dict[Any, Dict[str, Any]]:
+        if self.is_snapshot(target):
+            return self._instance_audit_values(list(target))
+        rows = target.order_by().values_list('pk', *self.get_audit_attnames())
+        return {row[0]: dict(zip(self.get_audit_attnames(), row[1:])) for row in rows}
+
+    def _updated_audit_values(
+        self,
+        target: models.QuerySet,
+        meta_params: MetaParams,
+        old_values: Dict[Any, Dict[str, Any]],
+    ) -> Dict[Any, Dict[str, Any]]:
+        if 'instance_ref' in meta_params:
+            return self._instance_audit_values([meta_params['instance_ref']])
+        if not old_values:
+            return {}
+
+        params = meta_params['operation_params']
+        if self.operation == 'update' and not any(
+            hasattr(value, 'resolve_expression') for value in params.values()
+        ):
+            # Literal update values are the new values, without reading the rows again
+            opts = cast(Type[models.Model], self.model)._meta
+            values = {
+                opts.get_field(name).attname: value.pk if isinstance(value, models.Model) else value
+                for name, value in params.items()
+            }
+            return {
+                pk: {name: values.get(name, value) for name, value in old.items()}
+                for pk, old in old_values.items()
+            }
+        # The updated rows are read by pk, as they may not match target anymore
+        queryset = models.QuerySet(model=self.model, using=self.using)
+        return self._read_audit_values(queryset.filter(pk__in=list(old_values)))
+
+    def _write_audit_records(self, records: List[models.Model]) -> None:
+        if not records:
+            return
+        # A plain queryset, so the records don't trigger a watcher of audit_model
+        queryset = models.QuerySet(model=self.get_audit_model(), using=self.using)
+        self.call_unwatched('audit', models.QuerySet.bulk_create, queryset, records)
+
+
+# pylint: disable=protected-access
+class SearchIndexWatcherMixin(SaveWatcherMixin, DeleteWatcherMixin):
+    """
+    SearchIndexWatcherMixin syncs the rows created, updated or deleted by watched operations to
+    `search_backend`. Their pks are deduplicated over the transaction and, once it commits, the
+    rows are read with values() of `search_fields`, sending one request per `search_batch_size`
+    pks which upserts the documents of the found rows and deletes the missing ones.
+    It implements pre_update, pre_delete and post_create, overrides must call super.
+    """
+
+    # The SearchBackend instance the documents are sent to
+    search_backend: Optional[SearchBackend] = None
+    # The index name, by default the model label
+    search_index: Optional[str] = None
+    # The fields of the documents, besides 'pk'
+    search_fields: List[str] = []
+    # Max number of pks of each request
+    search_batch_size = 500
+
+    def pre_update(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_update(target, meta_params, **hooks_params)
+        self._queue_search_pks(target, meta_params)
+
+    def pre_delete(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().pre_delete(target, meta_params, **hooks_params)
+        self._queue_search_pks(target, meta_params)
+
+    def post_create(self, target: models.QuerySet, meta_params: MetaParams, **hooks_params) -> None:
+        super().post_create(target, meta_params, **hooks_params)
+        self._queue_search_pks(target, meta_params)
+
+    def get_search_backend(self) -> SearchBackend:
+        if self.search_backend is None:
+            raise ImproperlyConfigured(f'{type(self).__name__} has no search_backend')
+        return self.search_backend
+
+    def get_search_index(self) -> str:
+        return self.search_index or cast(Type[models.Model], self.model)._meta.label
+
+    def get_search_queryset(self) -> models.QuerySet:
+        """
+        get_search_queryset returns the indexed rows, the other ones are deleted from the index
+        """
+        model = cast(Type[models.Model], self.model)
+        return model._default_manager.db_manager(self.using).all()
+
+    def flush_search_index(self, pks: Set[Any]) -> None:
+        backend = self.get_search_backend()
+        index = self.get_search_index()
+        queryset = self.get_search_queryset()
+        pks_list = sorted(pks)
+        for i in range(0, len(pks_list), self.search_batch_size):
+            batch = pks_list[i : i + self.search_batch_size]
+            documents = list(
+                queryset.filter(pk__in=batch).order_by('pk').values('pk', *self.search_fields)
+            )
+            found = {document['pk'] for document in documents}
+            deleted = [pk for pk in batch if pk not in found]
+            self.call_unwatched('search_index', backend.bulk, index, documents, deleted)
+
+    def _queue_search_pks(self, target: models.QuerySet, meta_params: MetaParams) -> None:
+        queue_pks(
+            cast(str, self.using),
+            (type(self), self.model),
+            _target_pks(self, target, meta_params),
+            self.flush_search_index,
+        )
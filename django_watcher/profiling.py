@@ -0,0 +1,67 @@
+import logging
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
+
+
+if TYPE_CHECKING:
+    from .abstract_watcher import AbstractWatcher
+
+
+logger = logging.getLogger('django_watcher.slow')
+
+# Number of queries included in slow operation records, the slowest ones
+SLOWEST_QUERIES = 5
+
+
+class QueryRecorder:
+    """
+    QueryRecorder is a database execute wrapper recording the time and SQL of each query
+    """
+
+    def __init__(self) -> None:
+        self.queries: List[Tuple[float, str]] = []
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Any) -> Any:
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((perf_counter() - start, sql))
+
+
+def _to_ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+# pylint: disable=protected-access
+def log_slow_operation(
+    watcher: 'AbstractWatcher', duration: float, queries: List[Tuple[float, str]]
+) -> None:
+    """
+    log_slow_operation logs a warning on `django_watcher.slow` with the breakdown of a slow
+    operation, given as the record attributes model, operation, duration_ms, hook_times_ms,
+    query_count and slowest_queries
+
+    :param watcher: The watcher of the operation
+    :param duration: The operation time, in seconds
+    :param queries: The time and SQL of the operation queries
+    """
+    model = watcher.model._meta.label if watcher.model else None
+    slowest = sorted(queries, key=lambda query: query[0], reverse=True)[:SLOWEST_QUERIES]
+    logger.warning(
+        'Slow watched operation %s on %s: %sms, %s queries',
+        watcher.operation,
+        model,
+        _to_ms(duration),
+        len(queries),
+        extra={
+            'model': model,
+            'operation': watcher.operation,
+            'duration_ms': _to_ms(duration),
+            'hook_times_ms': {
+                hook: _to_ms(sum(times)) for hook, times in watcher.hook_times.items()
+            },
+            'query_count': len(queries),
+            'slowest_queries': [{'sql': sql, 'duration_ms': _to_ms(time)} for time, sql in slowest],
+        },
+    )
@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from django.db import connections, transaction
+
+from .cache import _is_alive
+
+
+class SearchBackend(ABC):
+    """
+    SearchBackend is the interface of the search engines SearchIndexWatcherMixin sends the
+    documents of the watched rows to
+    """
+
+    @abstractmethod
+    def bulk(self, index: str, documents: List[Dict[str, Any]], deleted: List[Any]) -> None:
+        """
+        bulk upserts documents and deletes the documents of the deleted pks, in a single request
+
+        :param index: The index name
+        :param documents: The documents, the 'pk' key is their id
+        :param deleted: The pks of the documents to delete
+        """
+
+
+class InMemorySearchBackend(SearchBackend):
+    """
+    InMemorySearchBackend keeps the indexes in dicts and the requests in a list, for tests
+    """
+
+    def __init__(self) -> None:
+        self.indexes: Dict[str, Dict[Any, Dict[str, Any]]] = defaultdict(dict)
+        self.requests: List[Tuple[str, List[Dict[str, Any]], List[Any]]] = []
+
+    def bulk(self, index: str, documents: List[Dict[str, Any]], deleted: List[Any]) -> None:
+        self.requests.append((index, documents, deleted))
+        for document in documents:
+            self.indexes[index][document['pk']] = document
+        for pk in deleted:
+            self.indexes[index].pop(pk, None)
+
+    def clear(self) -> None:
+        self.indexes.clear()
+        self.requests.clear()
+
+
+def queue_pks(
+    using: str, key: Hashable, pks: Iterable[Any], flush: Callable[[Set[Any]], None]
+) -> None:
+    """
+    queue_pks adds pks to the set of key for the current transaction on the database using, which
+    is given to flush once the transaction commits. The set is discarded when the transaction or
+    the savepoint it was created in rolls back. Outside transactions, pks are flushed at once.
+
+    :param using: The database alias
+    :param key: The set owner, e.g. the watcher class and the model
+    :param pks: The pks to add
+    :param flush: Callable receiving the pks
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        flush(set(pks))
+        return
+
+    queues: Dict[Hashable, Tuple[Set[Any], Callable[[], None]]] = connection.__dict__.setdefault(
+        '_watcher_search_pks', {}
+    )
+    queue = queues.get(key)
+    if queue is None or not _is_alive(connection, queue[1]):
+        queued: Set[Any] = set()
+
+        def on_commit() -> None:
+            if queues.get(key, (None,))[0] is queued:
+                del queues[key]
+            flush(queued)
+
+        queue = (queued, on_commit)
+        queues[key] = queue
+        transaction.on_commit(on_commit, using=using)
+    queue[0].update(pks)
@@ -0,0 +1,129 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+# Number of latest timings kept by each series to compute its percentiles
+SAMPLE_SIZE = 1024
+
+
+class _Series:
+    __slots__ = ('count', 'total', 'samples')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.samples.append(value)
+
+    def summary(self) -> Dict[str, float]:
+        samples = sorted(self.samples)
+
+        def percentile(p: int) -> float:
+            return round(samples[max(0, -(-len(samples) * p // 100) - 1)] * 1000, 3)
+
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3),
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'p99_ms': percentile(99),
+            'max_ms': round(samples[-1] * 1000, 3),
+        }
+
+
+class _OperationStats:
+    __slots__ = ('calls', 'rows', 'transaction', 'hooks')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.rows = 0
+        self.transaction = _Series()
+        self.hooks: Dict[str, _Series] = {}
+
+
+class StatsRegistry:
+    """
+    StatsRegistry keeps the counters of the watched operations run by this process, by model and
+    operation: calls, rows affected, transaction time and the time of each hook
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _OperationStats] = {}
+
+    def record(
+        self,
+        model: str,
+        operation: str,
+        rows: int,
+        transaction_time: Optional[float],
+        hook_times: Dict[str, List[float]],
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get((model, operation))
+            if stats is None:
+                stats = self._stats[(model, operation)] = _OperationStats()
+            stats.calls += 1
+            stats.rows += rows
+            if transaction_time is not None:
+                stats.transaction.add(transaction_time)
+            for hook, times in hook_times.items():
+                series = stats.hooks.get(hook)
+                if series is None:
+                    series = stats.hooks[hook] = _Series()
+                for time in times:
+                    series.add(time)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        snapshot returns the counters as {model: {operation: stats}}, with times in milliseconds
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for (model, operation), stats in sorted(self._stats.items()):
+                result.setdefault(model, {})[operation] = {
+                    'calls': stats.calls,
+                    'rows': stats.rows,
+                    'transaction': stats.transaction.summary() if stats.transaction.count else None,
+                    'hooks': {hook: series.summary() for hook, series in stats.hooks.items()},
+                }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+registry = StatsRegistry()
+
+
+def get_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    get_stats returns the statistics of the watched operations run by this process, as
+    {model label: {operation: {'calls', 'rows', 'transaction', 'hooks'}}}
+    """
+    return registry.snapshot()
+
+
+def reset_stats() -> None:
+    registry.reset()
+
+
+def count_rows(result: Any) -> int:
+    """
+    count_rows returns the number of rows affected by an operation from its return value
+
+    :param result: The return of the operation, instance operations count as one row
+    """
+    if isinstance(result, int):
+        return result
+    if isinstance(result, tuple) and result and isinstance(result[0], int):
+        return result[0]
+    if isinstance(result, list):
+        return len(result)
+    return 1
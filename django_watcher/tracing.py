@@ -0,0 +1,56 @@
+from typing import Any, ContextManager, Optional, Type
+
+from django.db import models
+
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+
+class _NoSpan:
+    """
+    _NoSpan is used in place of spans when OpenTelemetry isn't installed
+    """
+
+    def __enter__(self) -> '_NoSpan':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+# A proxy tracer, it uses the tracer provider configured by the application, even if later
+_tracer = trace.get_tracer('django_watcher') if trace is not None else None
+
+
+# pylint: disable=protected-access
+def span(
+    name: str, model: Optional[Type[models.Model]], operation: Optional[str], **attributes: Any
+) -> ContextManager:
+    """
+    span starts an OpenTelemetry span as the current one, or does nothing when OpenTelemetry
+    isn't installed
+
+    :param name: The span name
+    :param model: The watched model
+    :param operation: The watched operation
+    :param attributes: Other span attributes, prefixed with `django_watcher.`
+    :returns: A context manager giving the span
+    """
+    if _tracer is None:
+        return _NO_SPAN
+
+    span_attributes = {
+        'django_watcher.model': model._meta.label if model else '',
+        'django_watcher.operation': operation or '',
+    }
+    for key, value in attributes.items():
+        span_attributes[f'django_watcher.{key}'] = value
+    return _tracer.start_as_current_span(name, attributes=span_attributes)
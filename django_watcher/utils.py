@@ -0,0 +1,334 @@
+from functools import reduce
+from operator import or_
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from django.db import IntegrityError, connections, models
+from django.db.models.deletion import Collector
+from django.db.models.sql import DeleteQuery, UpdateQuery
+
+
+# Instance attribute keeping the field attnames and values instances were loaded or saved with
+_LOADED_ATTR = '_watcher_loaded'
+# Values which may be changed in place, so they can't be compared with the loaded ones
+_MUTABLE_TYPES = (dict, list, set, bytearray)
+
+
+def resolve_callables(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    resolve_callables returns a copy of mapping with its callable values evaluated, as Django does
+    for get_or_create and update_or_create defaults
+
+    :param mapping: The mapping
+    :returns: The resolved dict
+    """
+    return {k: v() if callable(v) else v for k, v in mapping.items()}
+
+
+# pylint: disable=protected-access
+def match_existing(
+    queryset: models.QuerySet, instances: Sequence[models.Model], match_fields: List[str]
+) -> None:
+    """
+    match_existing sets the pk of the instances not saved yet, as told by _state.adding, to the pk
+    of the row having the same values on match_fields, so they are updated instead of inserted
+    when saved.
+    All instances are matched with a single query.
+
+    :param queryset: The queryset of the instances model, its database is used
+    :param instances: The instances to be matched
+    :param match_fields: Names of the fields which identify a row, usually a unique constraint
+    """
+    model = queryset.model
+    attnames = [model._meta.get_field(name).attname for name in match_fields]
+    pending = [instance for instance in instances if instance._state.adding]
+    if not pending:
+        return
+
+    keys = {tuple(getattr(instance, attname) for attname in attnames) for instance in pending}
+    if len(attnames) == 1:
+        condition = models.Q(**{f'{attnames[0]}__in': [key[0] for key in keys]})
+    else:
+        condition = reduce(or_, (models.Q(**dict(zip(attnames, key))) for key in keys))
+
+    rows = model._base_manager.db_manager(queryset.db).filter(condition)
+    existing = {tuple(row[1:]): row[0] for row in rows.values_list('pk', *attnames)}
+    for instance in pending:
+        pk = existing.get(tuple(getattr(instance, attname) for attname in attnames))
+        if pk is not None:
+            instance.pk = pk
+            instance._state.adding = False
+
+
+R = TypeVar('R')
+
+
+# pylint: disable=protected-access
+def retry_on_conflict(instances: Sequence[models.Model], func: Callable[[], R]) -> R:
+    """
+    retry_on_conflict calls func, which matches the instances with the existing rows and saves
+    them inside a transaction, once more if it raises IntegrityError, as a concurrent transaction
+    may have inserted one of their keys after they were matched. The pks and adding states the
+    first call gave the instances are reset before retrying.
+
+    :param instances: The instances saved by func
+    :param func: Callable matching and saving the instances
+    :returns: The func return
+    """
+    states = [(instance.pk, instance._state.adding) for instance in instances]
+    try:
+        return func()
+    except IntegrityError:
+        for instance, (pk, adding) in zip(instances, states):
+            instance.pk = pk
+            instance._state.adding = adding
+        return func()
+
+
+def supports_returning(using: str) -> bool:
+    """
+    supports_returning tells if the database supports RETURNING on UPDATE and DELETE statements
+
+    :param using: The database alias
+    """
+    connection: Any = connections[using]
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 35)
+
+
+# pylint: disable=protected-access
+def can_delete_returning(queryset: models.QuerySet, using: str) -> bool:
+    """
+    can_delete_returning tells if the queryset rows can be deleted by a single
+    DELETE ... RETURNING, which needs the database support and a queryset Django would delete
+    without collecting related objects: no cascades, no parents and no delete signals receivers
+
+    :param queryset: The queryset to be deleted
+    :param using: The database alias
+    """
+    query = queryset.query
+    return (
+        supports_returning(using)
+        and query.can_filter()
+        and not query.distinct
+        and not query.combinator
+        and cast(Any, queryset)._fields is None
+        and Collector(using=using).can_fast_delete(queryset)
+    )
+
+
+# pylint: disable=protected-access
+def delete_returning(
+    queryset: models.QuerySet, using: str, field_names: Optional[List[str]] = None
+) -> Tuple[int, List[models.Model]]:
+    """
+    delete_returning deletes the queryset rows with a single DELETE ... RETURNING statement,
+    check can_delete_returning
+
+    :param queryset: The queryset to be deleted
+    :param using: The database alias
+    :param field_names: The fields loaded on the returned instances, all concrete fields by default
+    :returns: The number of deleted rows and the deleted instances
+    """
+    model = queryset.model
+    opts = model._meta
+    fields = opts.concrete_fields
+    if field_names:
+        loaded = {opts.get_field(name).attname for name in field_names} | {opts.pk.attname}
+        fields = [field for field in fields if field.attname in loaded]
+
+    query = queryset.query.chain(DeleteQuery)
+    query.select_for_update = False
+    query.select_related = False
+    query.clear_ordering(True)
+    rows = _execute_returning(query, using, fields)
+    attnames = [field.attname for field in fields]
+    return len(rows), [model.from_db(using, attnames, row) for row in rows]
+
+
+# pylint: disable=protected-access
+def can_update_returning(queryset: models.QuerySet, using: str, values: Dict[str, Any]) -> bool:
+    """
+    can_update_returning tells if the queryset rows can be updated by a single
+    UPDATE ... RETURNING, which needs the database support and values only of fields in the model
+    table, not of parents tables
+
+    :param queryset: The queryset to be updated
+    :param using: The database alias
+    :param values: The update values
+    """
+    opts = queryset.model._meta
+    query = queryset.query
+    return (
+        supports_returning(using)
+        and query.can_filter()
+        and not query.combinator
+        and all(
+            opts.get_field(name).model._meta.concrete_model is opts.concrete_model
+            for name in values
+        )
+    )
+
+
+# pylint: disable=protected-access
+def update_returning(
+    queryset: models.QuerySet, using: str, values: Dict[str, Any], field_names: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    update_returning updates the queryset rows with a single UPDATE ... RETURNING statement,
+    check can_update_returning
+
+    :param queryset: The queryset to be updated
+    :param using: The database alias
+    :param values: The update values
+    :param field_names: The fields returned for each row, besides the pk
+    :returns: A dict for each updated row, with the pk and field_names values
+    """
+    opts = queryset.model._meta
+    fields = [opts.pk] + [opts.get_field(name) for name in field_names]
+    query: Any = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    query.annotations = {}
+    keys = ['pk'] + field_names
+    return [dict(zip(keys, row)) for row in _execute_returning(query, using, fields)]
+
+
+# pylint: disable=protected-access
+def _execute_returning(query: Any, using: str, fields: List[models.Field]) -> List[List[Any]]:
+    connection = connections[using]
+    sql, params = query.get_compiler(using).as_sql()
+    if not sql:
+        return []
+    returning = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f'{sql} RETURNING {returning}', params)
+        rows = cursor.fetchall()
+
+    columns = [field.get_col(query.get_meta().db_table) for field in fields]
+    converters = [
+        connection.ops.get_db_converters(column) + column.get_db_converters(connection)
+        for column in columns
+    ]
+    result = []
+    for row in rows:
+        values = list(row)
+        for i, column in enumerate(columns):
+            for converter in converters[i]:
+                values[i] = converter(values[i], column, connection)
+        result.append(values)
+    return result
+
+
+def track_loaded(instance: models.Model, attnames: Sequence[str], values: Sequence[Any]) -> None:
+    """
+    track_loaded keeps the values an instance was loaded with, for get_changed_fields
+
+    :param instance: The loaded instance
+    :param attnames: The attnames of the loaded fields, shared by the instances of a query
+    :param values: The loaded values
+    """
+    instance.__dict__[_LOADED_ATTR] = (attnames, tuple(values))
+
+
+# pylint: disable=protected-access
+def track_saved(instance: models.Model, field_names: Optional[Sequence[str]] = None) -> None:
+    """
+    track_saved keeps the current values of the instance saved fields, the other ones keep their
+    tracked values
+
+    :param instance: The saved instance
+    :param field_names: The saved fields, the `update_fields` of the save, all loaded ones if None
+    """
+    opts = instance._meta
+    loaded = instance.__dict__.get(_LOADED_ATTR)
+    previous = dict(zip(*loaded)) if loaded is not None and field_names is not None else {}
+    saved = None if field_names is None else {opts.get_field(name).attname for name in field_names}
+    deferred = instance.get_deferred_fields()
+    values = {}
+    for field in opts.concrete_fields:
+        if field.attname in deferred:
+            continue
+        if saved is None or field.attname in saved:
+            values[field.attname] = getattr(instance, field.attname)
+        elif field.attname in previous:
+            values[field.attname] = previous[field.attname]
+    track_loaded(instance, list(values), list(values.values()))
+
+
+# pylint: disable=protected-access
+def get_changed_fields(instance: models.Model) -> Optional[Set[str]]:
+    """
+    get_changed_fields returns the names of the instance loaded fields changed since it was loaded
+    or saved, or None if the instance isn't tracked. Mutable values, like the ones of JSON fields,
+    are always changed.
+
+    :param instance: The instance
+    """
+    loaded = instance.__dict__.get(_LOADED_ATTR)
+    if loaded is None:
+        return None
+
+    previous = dict(zip(*loaded))
+    deferred = instance.get_deferred_fields()
+    changed = set()
+    for field in instance._meta.concrete_fields:
+        if field.attname in deferred:
+            continue
+        value = getattr(instance, field.attname)
+        if (
+            field.attname not in previous
+            or isinstance(value, _MUTABLE_TYPES)
+            or value != previous[field.attname]
+        ):
+            changed.add(field.name)
+    return changed
+
+
+# pylint: disable=protected-access
+def insert_select(
+    queryset: models.QuerySet, model: Type[models.Model], columns: Dict[str, Any], using: str
+) -> int:
+    """
+    insert_select copies the queryset rows into the table of model with a single
+    INSERT ... SELECT statement, so they aren't loaded
+
+    :param queryset: The rows to be copied
+    :param model: The model of the table the rows are inserted into
+    :param columns: The fields of model and the field names of the queryset model, or the
+    expressions, they are filled with
+    :param using: The database alias
+    :returns: The number of inserted rows
+    """
+    names = [name for name in columns.values() if isinstance(name, str)]
+    expressions = {
+        f'_insert_{i}': value
+        for i, value in enumerate(columns.values())
+        if not isinstance(value, str)
+    }
+    # values selects the field names first, then the expressions
+    targets = [field for field, value in columns.items() if isinstance(value, str)] + [
+        field for field, value in columns.items() if not isinstance(value, str)
+    ]
+    select = queryset.order_by().values(*names, **expressions)
+    sql, params = select.query.get_compiler(using).as_sql()
+
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    opts = model._meta
+    fields = ', '.join(quote_name(opts.get_field(name).column) for name in targets)
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {quote_name(opts.db_table)} ({fields}) {sql}', params)
+        return cursor.rowcount
@@ -14,7 +14,7 @@ class StubQuerySet(QuerySet):
             (
                 self.model == __o.model
                 and self.query.chain().__str__() == __o.query.chain().__str__()
-                and self._db == __o._db
+                and self.db == __o.db
                 and self._hints == __o._hints
             )
             if isinstance(__o, QuerySet)
@@ -43,3 +43,13 @@ class SpyableManager(Manager.from_queryset(SpyableQuerySet)):
 
 class SubSpyableManager(SpyableManager):
     pass
+
+
+class VisibleManager(Manager.from_queryset(StubQuerySet)):
+    def get_queryset(self) -> QuerySet:
+        return super().get_queryset().exclude(text='hidden')
+
+
+class DetachedManager(Manager):
+    def get_queryset(self) -> QuerySet:
+        return QuerySet(self.model, using=self._db).exclude(text='hidden')
@@ -1,3 +1,4 @@
+import uuid
 from typing import no_type_check
 
 from django.db import models
@@ -5,7 +6,13 @@ from django.db import models
 from django_watcher import watched
 
 from . import watchers
-from .managers import SpyableManager, StubQuerySet, SubSpyableManager  # type: ignore
+from .managers import (  # type: ignore
+    DetachedManager,
+    SpyableManager,
+    StubQuerySet,
+    SubSpyableManager,
+    VisibleManager,
+)
 
 
 class WatcherModel(models.Model):
@@ -43,6 +50,16 @@ class SaveModel(WatcherModel):
     pass
 
 
+@watched(watchers.StubSaveWatcher)
+class UUIDModel(WatcherModel):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+
+
+@watched(watchers.StubSaveWatcher)
+class UniqueCodeModel(WatcherModel):
+    code = models.CharField(max_length=10, unique=True)
+
+
 @watched(watchers.StubUpdateWatcher)
 class UpdateModel(WatcherModel):
     pass
@@ -94,6 +111,98 @@ class CustomManagerModel2(WatcherModel):
     objects = SpyableManager()
 
 
+@watched(watchers.StubSaveDeleteWatcher)
+class FilteredManagerModel(WatcherModel):
+    objects = VisibleManager()
+
+
+@watched(watchers.StubSaveDeleteWatcher)
+class DetachedManagerModel(WatcherModel):
+    objects = DetachedManager()
+
+
+@watched(watchers.StubLockingWatcher)
+class LockingModel(WatcherModel):
+    pass
+
+
+@watched(watchers.StubProjectingWatcher)
+class ProjectingModel(WatcherModel):
+    pass
+
+
+@watched(watchers.StubTrackingWatcher)
+class TrackingModel(WatcherModel):
+    number = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+@watched(watchers.StubTrackingUpdateWatcher)
+class TrackingUpdateModel(WatcherModel):
+    number = models.IntegerField(default=0)
+
+
+@watched(watchers.StubSoftDeleteWatcher)
+class SoftDeleteModel(WatcherModel):
+    deleted_at = models.DateTimeField(null=True)
+
+
+class SoftDeleteParentModel(WatcherModel):
+    pass
+
+
+@watched(watchers.StubSoftDeleteWatcher)
+class SoftDeleteChildModel(SoftDeleteParentModel):
+    deleted_at = models.DateTimeField(null=True)
+
+
+@watched(watchers.StubArchiveWatcher)
+class ArchiveModel(WatcherModel):
+    pass
+
+
+class ArchivedModel(WatcherModel):
+    original_id = models.IntegerField(null=True)
+    archived_at = models.DateTimeField(null=True)
+
+
+class CounterParentModel(WatcherModel):
+    children_count = models.IntegerField(default=0)
+
+
+@watched(watchers.StubCounterCacheWatcher)
+class CounterChildModel(WatcherModel):
+    parent = models.ForeignKey(CounterParentModel, null=True, on_delete=models.CASCADE)
+
+
+@watched(watchers.StubCacheInvalidationWatcher)
+class CachedModel(WatcherModel):
+    pass
+
+
+@watched(watchers.StubCachedCounterCacheWatcher)
+class CachedCounterChildModel(WatcherModel):
+    parent = models.ForeignKey(CounterParentModel, null=True, on_delete=models.CASCADE)
+
+
+@watched(watchers.StubAuditWatcher)
+class AuditModel(WatcherModel):
+    number = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class AuditRecord(models.Model):
+    model = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=100)
+    action = models.CharField(max_length=10)
+    changes = models.TextField()
+
+
+@watched(watchers.StubSearchIndexWatcher)
+class IndexedModel(WatcherModel):
+    number = models.IntegerField(default=0)
+
+
 @watched(watchers.DeleteWatcher)
 class RelationDeleteModel(WatcherModel):
     pass
@@ -102,3 +211,26 @@ class RelationDeleteModel(WatcherModel):
 @watched(watchers.DeleteWatcher2)
 class RelationDeleteModel2(WatcherModel):
     delete_model = models.ForeignKey(RelationDeleteModel, on_delete=models.DO_NOTHING)
+
+
+# region testReadPath
+# Same name lengths, so both models issue SQL of the same size
+class ReadIgnoredModel(WatcherModel):
+    pass
+
+
+class ReadIgnoredChildModel(WatcherModel):
+    parent = models.ForeignKey(ReadIgnoredModel, on_delete=models.CASCADE, related_name='children')
+
+
+@watched(watchers.StubSaveDeleteWatcher)
+class ReadWatchedModel(WatcherModel):
+    pass
+
+
+@watched(watchers.StubSaveDeleteWatcher)
+class ReadWatchedChildModel(WatcherModel):
+    parent = models.ForeignKey(ReadWatchedModel, on_delete=models.CASCADE, related_name='children')
+
+
+# endregion
@@ -1,4 +1,7 @@
+import timeit
+import tracemalloc
 from copy import deepcopy
+from typing import Callable
 from unittest.mock import MagicMock
 
 
@@ -7,3 +10,30 @@ class CopyingMock(MagicMock):
         args = deepcopy(args)
         kwargs = deepcopy(kwargs)
         return super().__call__(*args, **kwargs)
+
+
+def spy(mock: MagicMock, func: Callable) -> Callable:
+    """
+    spy records the calls on mock, which may copy its args, while func runs with the originals
+    """
+
+    def wrapper(*args, **kwargs):
+        mock(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def best_time_per_call(func: Callable, number: int = 200, repeat: int = 7) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def peak_memory(func: Callable, number: int = 50) -> int:
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
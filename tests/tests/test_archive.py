@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.functions import Now
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_watcher.utils import insert_select
+from tests.models import ArchivedModel, ArchiveModel
+from tests.watchers import StubArchiveWatcher
+
+
+class ArchiveTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubArchiveWatcher.set_hooks(('pre_delete', self.mock.pre_delete))
+        ArchiveModel.objects.bulk_create(
+            [ArchiveModel(text='text1'), ArchiveModel(text='text2'), ArchiveModel(text='kept')]
+        )
+
+    def test_copies_rows_with_insert_select(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = ArchiveModel.objects.exclude(text='kept').delete()
+
+        inserts = [q['sql'] for q in ctx if q['sql'].startswith('INSERT')]
+        self.assertEqual(1, len(inserts))
+        self.assertIn('SELECT', inserts[0])
+        self.assertEqual((2, {'tests.ArchiveModel': 2}), result)
+        self.assertEqual(
+            ['text1', 'text2'], sorted(ArchivedModel.objects.values_list('text', flat=True))
+        )
+        self.assertEqual(['kept'], list(ArchiveModel.objects.values_list('text', flat=True)))
+        self.mock.pre_delete.assert_called_once()
+
+    def test_archives_locked_rows_only(self):
+        def select_for_update(queryset, **kwargs):
+            # text2 is locked by another transaction
+            return QuerySet.select_for_update(queryset, **kwargs).exclude(text='text2')
+
+        qs_cls = getattr(ArchiveModel.objects, '_queryset_class')
+        with patch.object(StubArchiveWatcher, 'select_for_update', {'skip_locked': True}):
+            with patch.object(qs_cls, 'select_for_update', select_for_update):
+                result = ArchiveModel.objects.exclude(text='kept').delete()
+
+        self.assertEqual((1, {'tests.ArchiveModel': 1}), result)
+        self.assertEqual(['text1'], list(ArchivedModel.objects.values_list('text', flat=True)))
+        self.assertEqual(
+            ['kept', 'text2'], sorted(ArchiveModel.objects.values_list('text', flat=True))
+        )
+
+    def test_deletes_only_the_archived_rows(self):
+        def insert_then_commit(*args):
+            count = insert_select(*args)
+            # text3 is committed by another transaction between the archive and the delete
+            ArchiveModel.objects.bulk_create([ArchiveModel(text='text3')])
+            return count
+
+        with patch('django_watcher.mixins.insert_select', insert_then_commit):
+            result = ArchiveModel.objects.exclude(text='kept').delete()
+
+        self.assertEqual((2, {'tests.ArchiveModel': 2}), result)
+        self.assertEqual(
+            ['text1', 'text2'], sorted(ArchivedModel.objects.values_list('text', flat=True))
+        )
+        self.assertEqual(
+            ['kept', 'text3'], sorted(ArchiveModel.objects.values_list('text', flat=True))
+        )
+
+    def test_archive_fields(self):
+        instance = ArchiveModel.objects.get(text='text1')
+        pk = instance.pk
+        fields = {'original_id': 'id', 'text': 'text', 'archived_at': Now()}
+
+        with patch.object(StubArchiveWatcher, 'archive_fields', fields):
+            instance.delete()
+
+        archived = ArchivedModel.objects.get()
+        self.assertEqual(pk, archived.original_id)
+        self.assertEqual('text1', archived.text)
+        self.assertIsNotNone(archived.archived_at)
+
+    def test_archive_is_rolled_back_with_the_delete(self):
+        self.mock.pre_delete.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            ArchiveModel.objects.all().delete()
+
+        self.assertEqual(0, ArchivedModel.objects.count())
+        self.assertEqual(3, ArchiveModel.objects.count())
+
+    def test_requires_archive_model(self):
+        with patch.object(StubArchiveWatcher, 'archive_model', None):
+            with self.assertRaises(ImproperlyConfigured):
+                ArchiveModel.objects.all().delete()
+
+        self.assertEqual(3, ArchiveModel.objects.count())
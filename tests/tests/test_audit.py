@@ -0,0 +1,81 @@
+import json
+
+from django.db import connection, models
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import AuditModel, AuditRecord
+
+
+class AuditTests(TestCase):
+    def setUp(self) -> None:
+        AuditModel.objects.bulk_create([AuditModel(text='text1'), AuditModel(text='text2')])
+        self.pks = list(AuditModel.objects.order_by('pk').values_list('pk', flat=True))
+
+    def get_records(self):
+        return [
+            (record.object_id, record.action, json.loads(record.changes))
+            for record in AuditRecord.objects.order_by('object_id', 'pk')
+        ]
+
+    def get_inserts(self, ctx):
+        return [q['sql'] for q in ctx if q['sql'].startswith('INSERT INTO "tests_auditrecord"')]
+
+    def test_create(self):
+        instance = AuditModel.objects.create(text='text3', number=3)
+
+        self.assertEqual(
+            [(str(instance.pk), 'create', {'number': 3, 'text': 'text3'})], self.get_records()
+        )
+
+    def test_save_many_writes_records_at_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            AuditModel.objects.save_many([AuditModel(text='text3'), AuditModel(text='text4')])
+
+        self.assertEqual(1, len(self.get_inserts(ctx)))
+        self.assertEqual(['create', 'create'], [record[1] for record in self.get_records()])
+
+    def test_update_writes_changed_fields_at_once(self):
+        AuditModel.objects.filter(pk=self.pks[0]).update(number=1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            AuditModel.objects.all().update(number=1, text='text1')
+
+        self.assertEqual(1, len(self.get_inserts(ctx)))
+        self.assertEqual(
+            [
+                (str(self.pks[0]), 'update', {'number': [0, 1]}),
+                (str(self.pks[1]), 'update', {'number': [0, 1], 'text': ['text2', 'text1']}),
+            ],
+            self.get_records(),
+        )
+
+    def test_update_with_expressions(self):
+        AuditModel.objects.filter(text='text1').update(
+            number=models.F('number') + 2, text=models.Value('new_text')
+        )
+
+        self.assertEqual(
+            [(str(self.pks[0]), 'update', {'number': [0, 2], 'text': ['text1', 'new_text']})],
+            self.get_records(),
+        )
+
+    def test_instance_save(self):
+        instance = AuditModel.objects.get(pk=self.pks[0])
+        instance.save()
+        self.assertEqual([], self.get_records())
+
+        instance.number = 5
+        instance.save()
+        self.assertEqual([(str(self.pks[0]), 'update', {'number': [0, 5]})], self.get_records())
+
+    def test_delete(self):
+        AuditModel.objects.all().delete()
+
+        self.assertEqual(
+            [
+                (str(self.pks[0]), 'delete', {'number': 0, 'text': 'text1'}),
+                (str(self.pks[1]), 'delete', {'number': 0, 'text': 'text2'}),
+            ],
+            self.get_records(),
+        )
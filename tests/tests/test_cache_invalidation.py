@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test.testcases import TestCase
+
+from tests.models import CachedModel
+from tests.watchers import StubCacheInvalidationWatcher
+
+
+class CacheInvalidationTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubCacheInvalidationWatcher.set_hooks(('post_save', self.mock.post_save))
+        CachedModel.objects.bulk_create([CachedModel(text='text1'), CachedModel(text='text2')])
+        self.pks = list(CachedModel.objects.order_by('pk').values_list('pk', flat=True))
+        cache.set_many({self.get_key(pk): 'cached' for pk in self.pks})
+        self.addCleanup(cache.clear)
+
+    def get_key(self, pk):
+        return f'test:tests.CachedModel:{pk}'
+
+    def get_cached(self):
+        return [cache.get(self.get_key(pk)) for pk in self.pks]
+
+    def get_generation(self):
+        return cache.get('test:tests.CachedModel:generation')
+
+    def test_update(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            CachedModel.objects.filter(text='text1').update(text='new_text')
+            self.assertEqual(['cached', 'cached'], self.get_cached())
+
+        self.assertEqual(1, len(callbacks))
+        self.assertEqual([None, 'cached'], self.get_cached())
+        self.assertEqual(1, self.get_generation())
+
+    def test_delete_many_called_once(self):
+        with patch.object(cache, 'delete_many', wraps=cache.delete_many) as delete_many:
+            with self.captureOnCommitCallbacks(execute=True):
+                CachedModel.objects.all().delete()
+
+        delete_many.assert_called_once()
+        self.assertEqual([None, None], self.get_cached())
+
+    def test_instance_save_and_delete(self):
+        instance = CachedModel.objects.get(pk=self.pks[1])
+        instance.text = 'new_text'
+
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+        self.assertEqual(['cached', None], self.get_cached())
+
+        cache.set(self.get_key(self.pks[1]), 'cached')
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.delete()
+        self.assertEqual(['cached', None], self.get_cached())
+        self.assertEqual(2, self.get_generation())
+
+    def test_create(self):
+        cache.set(self.get_key(self.pks[1] + 1), 'missing')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CachedModel.objects.create(text='text3')
+
+        self.assertIsNone(cache.get(self.get_key(self.pks[1] + 1)))
+        self.assertEqual(1, self.get_generation())
+
+    def test_rollback_keeps_cache(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(ValueError), transaction.atomic():
+                CachedModel.objects.all().update(text='new_text')
+                raise ValueError()
+
+        self.assertEqual([], callbacks)
+        self.assertEqual(['cached', 'cached'], self.get_cached())
+        self.assertIsNone(self.get_generation())
+
+    def test_without_generation_key(self):
+        with patch.object(StubCacheInvalidationWatcher, 'cache_generation_key', None):
+            with self.captureOnCommitCallbacks(execute=True):
+                CachedModel.objects.all().update(text='new_text')
+
+        self.assertEqual([None, None], self.get_cached())
+        self.assertIsNone(self.get_generation())
+
+    def test_retried_upsert(self):
+        # The first attempt conflicts after its hooks ran, its savepoint is rolled back
+        self.mock.post_save.side_effect = [IntegrityError, None]
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            CachedModel.objects.upsert([CachedModel(text='text1')], ['text'])
+
+        self.assertEqual(2, self.mock.post_save.call_count)
+        self.assertEqual(1, len(callbacks))
+        self.assertEqual([None, 'cached'], self.get_cached())
+        self.assertEqual(1, self.get_generation())
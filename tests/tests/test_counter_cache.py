@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import CachedCounterChildModel, CounterChildModel, CounterParentModel
+from tests.watchers import StubCounterCacheWatcher
+
+
+class CounterCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.parent1 = CounterParentModel.objects.create(text='parent1')
+        self.parent2 = CounterParentModel.objects.create(text='parent2')
+
+    def get_counts(self):
+        return list(
+            CounterParentModel.objects.order_by('pk').values_list('children_count', flat=True)
+        )
+
+    def create_children(self, *parents):
+        CounterChildModel.objects.save_many(
+            [CounterChildModel(text='child', parent=parent) for parent in parents]
+        )
+
+    def test_create(self):
+        CounterChildModel.objects.create(text='child', parent=self.parent1)
+        CounterChildModel(text='child', parent=self.parent2).save()
+        CounterChildModel.objects.create(text='orphan')
+
+        self.assertEqual([1, 1], self.get_counts())
+
+    def test_save_many_in_one_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.create_children(self.parent1, self.parent1, self.parent2)
+
+        updates = [q['sql'] for q in ctx if q['sql'].startswith('UPDATE')]
+        self.assertEqual(1, len(updates))
+        self.assertIn('CASE', updates[0])
+        self.assertEqual([2, 1], self.get_counts())
+
+    def test_delete(self):
+        self.create_children(self.parent1, self.parent1, self.parent2)
+
+        CounterChildModel.objects.filter(parent=self.parent1).delete()
+        self.assertEqual([0, 1], self.get_counts())
+
+        CounterChildModel.objects.get().delete()
+        self.assertEqual([0, 0], self.get_counts())
+
+    def test_queryset_update_reassigning(self):
+        self.create_children(self.parent1, self.parent1, self.parent2)
+
+        CounterChildModel.objects.filter(parent=self.parent1).update(parent=self.parent2)
+
+        self.assertEqual([0, 3], self.get_counts())
+
+    def test_queryset_update_reassigning_without_returning(self):
+        self.create_children(self.parent1, self.parent1)
+
+        with patch('django_watcher.utils.supports_returning', return_value=False):
+            CounterChildModel.objects.filter(parent=self.parent1).update(parent=None)
+
+        self.assertEqual([0, 0], self.get_counts())
+
+    def test_instance_update_reassigning(self):
+        self.create_children(self.parent1)
+        child = CounterChildModel.objects.get()
+
+        child.parent = self.parent2
+        child.save()
+
+        self.assertEqual([0, 1], self.get_counts())
+
+    def test_updates_of_other_fields_keep_counters(self):
+        self.create_children(self.parent1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            CounterChildModel.objects.all().update(text='new_text')
+            CounterChildModel.objects.get().save(update_fields=['text'])
+
+        self.assertEqual(2, len([q for q in ctx if q['sql'].startswith('UPDATE')]))
+        self.assertEqual([1, 0], self.get_counts())
+
+    def test_batches(self):
+        self.create_children(self.parent1, self.parent2)
+
+        with patch.object(StubCounterCacheWatcher, 'counter_batch_size', 1):
+            with CaptureQueriesContext(connection) as ctx:
+                CounterChildModel.objects.all().delete()
+
+        self.assertEqual(2, len([q for q in ctx if q['sql'].startswith('UPDATE')]))
+        self.assertEqual([0, 0], self.get_counts())
+
+    def test_combined_with_other_mixins(self):
+        CachedCounterChildModel.objects.create(text='child1', parent=self.parent1)
+        CachedCounterChildModel.objects.create(text='child2', parent=self.parent1)
+        pks = list(CachedCounterChildModel.objects.order_by('pk').values_list('pk', flat=True))
+        keys = [f'test:tests.CachedCounterChildModel:{pk}' for pk in pks]
+        cache.set_many({key: 'cached' for key in keys})
+        self.addCleanup(cache.clear)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CachedCounterChildModel.objects.filter(text='child1').update(parent=self.parent2)
+
+        self.assertEqual([1, 1], self.get_counts())
+        self.assertEqual([None, 'cached'], [cache.get(key) for key in keys])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CachedCounterChildModel.objects.filter(text='child2').delete()
+
+        self.assertEqual([0, 1], self.get_counts())
+        self.assertEqual([None, None], [cache.get(key) for key in keys])
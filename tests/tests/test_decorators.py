@@ -9,6 +9,8 @@ from tests.models import (
     CasualStringWatcherModel2,
     CustomManagerModel,
     CustomManagerModel2,
+    DetachedManagerModel,
+    FilteredManagerModel,
     StringWatcherModel,
     StringWatcherModel2,
 )
@@ -19,7 +21,7 @@ from tests.watchers import (
     StubSaveDeleteWatcher2,
 )
 
-from .helpers import CopyingMock
+from .helpers import CopyingMock, spy
 
 
 class ImportWatcherTests(TestCase):
@@ -64,8 +66,7 @@ class CustomAndSubManagerTests(TestCase):
 
     def test_create_hooks_order(self):
         qs = CustomManagerModel.objects.get_queryset()
-        self.mock.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(CustomManagerModel.objects, 'get_queryset', lambda: qs):
             instance = CustomManagerModel.objects.create('fake_param', text='fake')
 
@@ -79,7 +80,7 @@ class CustomAndSubManagerTests(TestCase):
                     [CustomManagerModel(text='fake')],
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake'}},
                 ),
-                call.UNWATCHED_create(text='fake'),
+                call.UNWATCHED_create(_instance=CustomManagerModel(text='fake')),
                 call.post_create(
                     CustomManagerModel.objects.filter(pk=instance.pk),
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake'}},
@@ -236,14 +237,12 @@ class SameCustomManagerOnDifferentClassesTests(TestCase):
 
     def test_create_hooks_order(self):
         qs = CustomManagerModel.objects.get_queryset()
-        self.mock.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(CustomManagerModel.objects, 'get_queryset', lambda: qs):
             instance = CustomManagerModel.objects.create('fake_param', text='fake')
 
         qs = CustomManagerModel2.objects.get_queryset()
-        self.mock2.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock2.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock2.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(CustomManagerModel2.objects, 'get_queryset', lambda: qs):
             instance2 = CustomManagerModel2.objects.create('fake_param_2', text='fake_2')
 
@@ -257,7 +256,7 @@ class SameCustomManagerOnDifferentClassesTests(TestCase):
                     [CustomManagerModel(text='fake')],
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake'}},
                 ),
-                call.UNWATCHED_create(text='fake'),
+                call.UNWATCHED_create(_instance=CustomManagerModel(text='fake')),
                 call.post_create(
                     CustomManagerModel.objects.filter(pk=instance.pk),
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake'}},
@@ -281,7 +280,7 @@ class SameCustomManagerOnDifferentClassesTests(TestCase):
                     [CustomManagerModel2(text='fake_2')],
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake_2'}},
                 ),
-                call.UNWATCHED_create(text='fake_2'),
+                call.UNWATCHED_create(_instance=CustomManagerModel2(text='fake_2')),
                 call.post_create(
                     CustomManagerModel2.objects.filter(pk=instance2.pk),
                     {'source': _QUERY_SET, 'operation_params': {'text': 'fake_2'}},
@@ -399,3 +398,50 @@ class SameCustomManagerOnDifferentClassesTests(TestCase):
         self.assertEqual(4, CustomManagerModel.objects.count())
         self.assertEqual(len(self.mock2.mock_calls), 3)
         self.assertEqual(4, CustomManagerModel2.objects.count())
+
+
+class WatchedManagerQuerySetTests(TestCase):
+    def test_get_queryset_builds_watched_queryset(self):
+        qs_cls = getattr(CustomManagerModel.objects, '_queryset_class')
+
+        self.assertIs(qs_cls, type(CustomManagerModel.objects.all()))
+        self.assertIs(qs_cls, type(CustomManagerModel.objects.filter(text='text')))
+        self.assertTrue(hasattr(qs_cls, 'UNWATCHED_update'))
+        self.assertTrue(hasattr(qs_cls, 'UNWATCHED_delete'))
+
+    @patch('django_watcher.decorators.querytools._clone_queryset_in_new_cls')
+    def test_get_queryset_does_not_clone(self, mocked_clone):
+        CustomManagerModel.objects.filter(text='text').count()
+        CustomManagerModel.other_objects.all().exists()
+
+        mocked_clone.assert_not_called()
+
+    def test_get_queryset_keeps_custom_manager_filters(self):
+        FilteredManagerModel.objects.bulk_create(
+            [FilteredManagerModel(text='hidden'), FilteredManagerModel(text='visible')]
+        )
+
+        texts = FilteredManagerModel.objects.values_list('text', flat=True)
+        self.assertEqual(['visible'], list(texts))
+        self.assertTrue(hasattr(FilteredManagerModel.objects.all(), 'UNWATCHED_update'))
+
+    def test_get_queryset_not_calling_super_is_watched(self):
+        mock = MagicMock()
+        StubSaveDeleteWatcher.set_hooks(
+            ('pre_update', mock.pre_update), ('pre_delete', mock.pre_delete)
+        )
+        DetachedManagerModel.objects.bulk_create(
+            [DetachedManagerModel(text='hidden'), DetachedManagerModel(text='visible')]
+        )
+
+        self.assertEqual(
+            ['visible'], list(DetachedManagerModel.objects.values_list('text', flat=True))
+        )
+        self.assertTrue(hasattr(DetachedManagerModel.objects.all(), 'UNWATCHED_update'))
+
+        DetachedManagerModel.objects.filter(text='visible').update(text='updated')
+        DetachedManagerModel.objects.all().delete()
+
+        mock.pre_update.assert_called_once()
+        mock.pre_delete.assert_called_once()
+        self.assertEqual(['hidden'], [i.text for i in DetachedManagerModel._base_manager.all()])
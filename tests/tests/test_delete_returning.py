@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.db.models.signals import pre_delete
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import CustomManagerModel, DeleteModel, ProjectingModel
+from tests.watchers import StubDeleteWatcher, StubProjectingWatcher, StubSaveDeleteWatcher
+
+
+class DeleteReturningTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        for watcher in (StubDeleteWatcher, StubProjectingWatcher, StubSaveDeleteWatcher):
+            watcher.set_hooks(('post_delete', self.mock.post_delete))
+            patcher = patch.object(watcher, 'delete_returning', True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_statements(self, ctx):
+        return [q['sql'].split(' ')[0] for q in ctx if 'SAVEPOINT' not in q['sql']]
+
+    def test_deletes_and_loads_rows_in_one_statement(self):
+        DeleteModel.objects.bulk_create([DeleteModel(text='text1'), DeleteModel(text='text2')])
+        expected = list(DeleteModel.objects.order_by('pk'))
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = DeleteModel.objects.all().delete()
+
+        self.assertEqual(['DELETE'], self.get_statements(ctx))
+        self.assertIn('RETURNING', [q['sql'] for q in ctx if q['sql'].startswith('DELETE')][0])
+        self.assertEqual((2, {'tests.DeleteModel': 2}), result)
+        instances = sorted(self.mock.post_delete.call_args[0][0], key=lambda i: i.pk)
+        self.assertEqual(expected, instances)
+        self.assertEqual(['text1', 'text2'], [instance.text for instance in instances])
+        self.assertEqual(0, DeleteModel.objects.count())
+
+    def test_loads_only_hook_fields(self):
+        ProjectingModel.objects.bulk_create([ProjectingModel(text='text1')])
+
+        ProjectingModel.objects.all().delete()
+
+        instance = self.mock.post_delete.call_args[0][0][0]
+        self.assertEqual({'text'}, instance.get_deferred_fields())
+
+    def test_falls_back_when_there_are_signal_receivers(self):
+        DeleteModel.objects.bulk_create([DeleteModel(text='text1')])
+        receiver = MagicMock()
+        pre_delete.connect(receiver, sender=DeleteModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=DeleteModel)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = DeleteModel.objects.all().delete()
+
+        self.assertEqual('SELECT', self.get_statements(ctx)[0])
+        self.assertEqual((1, {'tests.DeleteModel': 1}), result)
+        self.assertEqual(1, len(self.mock.post_delete.call_args[0][0]))
+
+    @patch('tests.managers.watched')
+    def test_custom_delete_is_called(self, mocked_watched):
+        CustomManagerModel.objects.bulk_create(
+            [CustomManagerModel(text='text1'), CustomManagerModel(text='text2')]
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            CustomManagerModel.objects.filter(text='text1').delete('fake_param')
+
+        mocked_watched.assert_called_once_with('fake_param')
+        self.assertEqual('SELECT', self.get_statements(ctx)[0])
+        self.assertEqual(['text1'], [i.text for i in self.mock.post_delete.call_args[0][0]])
+        self.assertEqual(['text2'], [i.text for i in CustomManagerModel.objects.all()])
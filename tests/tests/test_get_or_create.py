@@ -0,0 +1,201 @@
+from unittest.mock import MagicMock, call, patch
+
+from django.db import connection, transaction
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_watcher import MetaParams
+from django_watcher.mixins import _INSTANCE, _QUERY_SET
+from tests.models import CreateModel, SaveModel, UpdateModel, UUIDModel
+from tests.watchers import StubCreateWatcher, StubSaveWatcher, StubUpdateWatcher
+
+from .helpers import CopyingMock
+
+
+class GetOrCreateTests(TestCase):
+    def setUp(self) -> None:
+        self.mock: MagicMock = CopyingMock()
+        hooks = ('pre_create', 'post_create', 'pre_update', 'post_update', 'pre_save', 'post_save')
+        for watcher in (StubCreateWatcher, StubUpdateWatcher, StubSaveWatcher):
+            watcher.set_hooks(*[(hook, getattr(self.mock, hook)) for hook in hooks])
+
+    def test_get_or_create_creates(self):
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            instance, created = SaveModel.objects.get_or_create(text='text')
+
+        self.assertTrue(created)
+        mocked.atomic.assert_called_once_with(using='default')
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': {'text': 'text'}}
+        qs = SaveModel.objects.filter(pk=instance.pk)
+        self.mock.assert_has_calls(
+            [
+                call.pre_save([SaveModel(text='text')], meta_params),
+                call.pre_create([SaveModel(text='text')], meta_params),
+                call.post_create(qs, meta_params),
+                call.post_save(qs, meta_params),
+            ]
+        )
+        self.assertEqual(4, len(self.mock.mock_calls))
+
+    def test_get_or_create_gets_without_hooks_or_transaction(self):
+        existing = SaveModel.objects.create(text='text', _ignore_hooks=True)
+
+        with self.assertNumQueries(1):
+            instance, created = SaveModel.objects.get_or_create(text='text')
+
+        self.assertFalse(created)
+        self.assertEqual(existing, instance)
+        self.assertEqual(0, len(self.mock.mock_calls))
+
+    def test_get_or_create_with_defaults_and_hooks_params(self):
+        _, created = CreateModel.objects.get_or_create(
+            text='text', defaults={'text': lambda: 'default'}, hooks__flag=True
+        )
+
+        self.assertTrue(created)
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': {'text': 'default'}}
+        self.mock.pre_create.assert_called_once_with(
+            [CreateModel(text='default')], meta_params, flag=True
+        )
+        self.assertEqual(1, CreateModel.objects.filter(text='default').count())
+
+    def test_get_or_create_exception_on_post_create_dont_create(self):
+        self.mock.post_create.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            SaveModel.objects.get_or_create(text='text')
+
+        self.assertEqual(0, SaveModel.objects.count())
+
+    def test_get_or_create_not_watched_for_update_watchers(self):
+        _, created = UpdateModel.objects.get_or_create(text='text')
+
+        self.assertTrue(created)
+        self.assertEqual(0, len(self.mock.mock_calls))
+
+    def test_update_or_create_updates(self):
+        existing = SaveModel.objects.create(text='text', _ignore_hooks=True)
+
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            instance, created = SaveModel.objects.update_or_create(
+                text='text', defaults={'text': 'new_text'}
+            )
+
+        self.assertFalse(created)
+        mocked.atomic.assert_called_once_with(using='default')
+        meta_params: MetaParams = {
+            'source': _INSTANCE,
+            'operation_params': {'using': 'default'},
+            'instance_ref': SaveModel(id=existing.pk, text='new_text'),
+        }
+        qs = SaveModel.objects.filter(pk=existing.pk)
+        self.mock.assert_has_calls(
+            [
+                call.pre_save(qs, meta_params),
+                call.pre_update(qs, meta_params),
+                call.post_update(qs, meta_params),
+                call.post_save(qs, meta_params),
+            ]
+        )
+        self.assertEqual(4, len(self.mock.mock_calls))
+        self.assertEqual('new_text', SaveModel.objects.get(pk=instance.pk).text)
+
+    def test_update_or_create_creates(self):
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            _, created = SaveModel.objects.update_or_create(
+                text='text', defaults={'text': 'new_text'}
+            )
+
+        self.assertTrue(created)
+        mocked.atomic.assert_called_once_with(using='default')
+        self.assertEqual(
+            ['pre_save', 'pre_create', 'post_create', 'post_save'],
+            [name for name, _, _ in self.mock.mock_calls],
+        )
+        self.assertEqual(1, SaveModel.objects.filter(text='new_text').count())
+
+    def test_update_or_create_only_triggers_watched_hooks(self):
+        CreateModel.objects.create(text='text', _ignore_hooks=True)
+        UpdateModel.objects.create(text='text')
+
+        CreateModel.objects.update_or_create(text='text', defaults={'text': 'new_text'})
+        UpdateModel.objects.update_or_create(text='text', defaults={'text': 'new_text'})
+        UpdateModel.objects.update_or_create(text='other')
+
+        self.assertEqual(
+            ['pre_update', 'post_update'], [name for name, _, _ in self.mock.mock_calls]
+        )
+        self.assertEqual(1, CreateModel.objects.filter(text='new_text').count())
+        self.assertEqual(2, UpdateModel.objects.count())
+
+    def test_ignore_hooks(self):
+        SaveModel.objects.get_or_create(text='text', _ignore_hooks=True)
+        SaveModel.objects.update_or_create(
+            text='text', defaults={'text': 'new_text'}, _ignore_hooks=True
+        )
+        SaveModel.objects.update_or_create(text='other', _ignore_hooks=True)
+
+        self.assertEqual(0, len(self.mock.mock_calls))
+        self.assertEqual(
+            ['new_text', 'other'],
+            list(SaveModel.objects.order_by('pk').values_list('text', flat=True)),
+        )
+
+
+class BulkUpdateOrCreateTests(TestCase):
+    def setUp(self) -> None:
+        self.mock: MagicMock = CopyingMock()
+        StubSaveWatcher.set_hooks(
+            ('pre_create', self.mock.pre_create),
+            ('post_create', self.mock.post_create),
+            ('pre_update', self.mock.pre_update),
+            ('post_update', self.mock.post_update),
+        )
+        SaveModel.objects.bulk_create([SaveModel(text='text1'), SaveModel(text='text2')])
+        self.existing_pk = SaveModel.objects.get(text='text1').pk
+
+    def test_matches_existing_rows(self):
+        instances = [SaveModel(text='text1'), SaveModel(text='text3')]
+
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            result = SaveModel.objects.bulk_update_or_create(instances, ['text'])
+
+        self.assertIs(instances, result)
+        mocked.atomic.assert_called_once_with(using='default')
+        self.assertEqual(self.existing_pk, instances[0].pk)
+        meta_params: MetaParams = {
+            'source': _QUERY_SET,
+            'operation_params': {'unique_fields': ['text']},
+        }
+        self.mock.assert_has_calls(
+            [
+                call.pre_create([SaveModel(text='text3')], meta_params),
+                call.pre_update(SaveModel.objects.filter(pk__in=[self.existing_pk]), meta_params),
+                call.post_create(SaveModel.objects.filter(pk__in=[instances[1].pk]), meta_params),
+                call.post_update(SaveModel.objects.filter(pk__in=[self.existing_pk]), meta_params),
+            ]
+        )
+        self.assertEqual(3, SaveModel.objects.count())
+
+    def test_matches_instances_with_default_pk(self):
+        UUIDModel.objects.bulk_create([UUIDModel(text='text1')])
+        existing_pk = UUIDModel.objects.get().pk
+        instances = [UUIDModel(text='text1'), UUIDModel(text='text2')]
+
+        UUIDModel.objects.bulk_update_or_create(instances, ['text'])
+
+        self.assertEqual(existing_pk, instances[0].pk)
+        self.assertEqual(2, UUIDModel.objects.count())
+        self.mock.pre_create.assert_called_once()
+        self.mock.pre_update.assert_called_once()
+
+    def test_matches_with_one_select(self):
+        instances = [SaveModel(text='text1'), SaveModel(text='text2')]
+
+        with CaptureQueriesContext(connection) as ctx:
+            SaveModel.objects.bulk_update_or_create(instances, ['text'], _ignore_hooks=True)
+
+        selects = [q['sql'] for q in ctx if q['sql'].startswith('SELECT')]
+        self.assertEqual(1, len(selects))
+        self.assertEqual(0, len(self.mock.mock_calls))
+        self.assertEqual(2, SaveModel.objects.count())
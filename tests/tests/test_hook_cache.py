@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from django.db import transaction
+from django.test.testcases import TestCase
+
+from django_watcher.cache import HookCache
+from tests.models import CreateModel, SaveModel
+from tests.watchers import StubCreateWatcher, StubSaveWatcher
+
+
+class HookCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.loader = MagicMock(return_value='config')
+
+        def pre_create(watcher, target, meta_params, **hooks_params):
+            watcher.cache.get_or_set('config', self.loader)
+
+        StubSaveWatcher.set_hooks(('pre_create', pre_create))
+        StubCreateWatcher.set_hooks(('pre_create', pre_create))
+
+    def test_shared_by_operations_of_a_transaction(self):
+        with transaction.atomic():
+            for i in range(3):
+                SaveModel.objects.create(text=f'text{i}')
+
+        self.loader.assert_called_once_with()
+
+    def test_discarded_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                SaveModel.objects.create(text='text1')
+        SaveModel.objects.create(text='text2')
+
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_discarded_on_rollback(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                SaveModel.objects.create(text='text1')
+                raise ValueError
+        SaveModel.objects.create(text='text2')
+
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_scoped_by_watcher_and_model(self):
+        with transaction.atomic():
+            SaveModel.objects.create(text='text1')
+            CreateModel.objects.create(text='text1')
+            SaveModel.objects.create(text='text2')
+
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_evicts_least_recently_used(self):
+        cache = HookCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(3, cache.get('c'))
@@ -0,0 +1,59 @@
+from typing import Dict, List, Set
+from unittest.mock import MagicMock
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import ProjectingModel
+from tests.watchers import StubProjectingWatcher
+
+
+class HookFieldsTests(TestCase):
+    def setUp(self) -> None:
+        ProjectingModel.objects.bulk_create(
+            [ProjectingModel(text='text1'), ProjectingModel(text='text2')]
+        )
+        self.deferred_fields: Dict[str, List[Set[str]]] = {}
+        StubProjectingWatcher.set_hooks(
+            *[
+                (hook, self.record_deferred_fields(hook))
+                for hook in ('pre_update', 'post_update', 'pre_save', 'post_save', 'post_delete')
+            ]
+        )
+
+    def record_deferred_fields(self, hook: str) -> MagicMock:
+        def side_effect(target, meta_params, **hooks_params):
+            self.deferred_fields[hook] = [instance.get_deferred_fields() for instance in target]
+
+        return MagicMock(side_effect=side_effect)
+
+    def get_deferred_fields(self, hook: str):
+        return self.deferred_fields[hook]
+
+    def test_update_with_objects(self):
+        instance = ProjectingModel.objects.get(text='text1')
+        ProjectingModel.objects.filter(pk=instance.pk).update(text='new_text')
+
+        self.assertEqual([{'text'}], self.get_deferred_fields('pre_update'))
+        self.assertEqual([set()], self.get_deferred_fields('pre_save'))
+        self.assertEqual([set()], self.get_deferred_fields('post_update'))
+        self.assertEqual([{'text'}], self.get_deferred_fields('post_save'))
+
+    def test_update_with_instance(self):
+        instance = ProjectingModel.objects.get(text='text1')
+        instance.text = 'new_text'
+        instance.save()
+
+        self.assertEqual([{'text'}], self.get_deferred_fields('pre_update'))
+        # post hooks receive the saved instance, already loaded
+        self.assertEqual([set()], self.get_deferred_fields('post_save'))
+
+    def test_post_delete_loads_only_declared_fields(self):
+        with CaptureQueriesContext(connection) as ctx:
+            ProjectingModel.objects.all().delete()
+
+        selects = [q['sql'] for q in ctx if q['sql'].startswith('SELECT')]
+        self.assertEqual(1, len(selects))
+        self.assertNotIn('"text"', selects[0])
+        self.assertEqual([{'text'}, {'text'}], self.get_deferred_fields('post_delete'))
@@ -0,0 +1,69 @@
+from typing import Any, Dict
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import SaveModel, UpdateModel
+from tests.watchers import StubSaveWatcher, StubUpdateWatcher
+
+
+class InstanceSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        self.reads: Dict[str, Any] = {}
+
+        def read(hook):
+            def side_effect(watcher, target, meta_params, **hooks_params):
+                with CaptureQueriesContext(connection) as ctx:
+                    self.reads[hook] = (
+                        list(target),
+                        len(target),
+                        target.count(),
+                        target.exists(),
+                        target.first(),
+                        target.last(),
+                    )
+                self.reads[f'{hook}_queries'] = len(ctx)
+                self.reads[f'{hook}_filtered'] = list(target.filter(text='other'))
+
+            return side_effect
+
+        StubSaveWatcher.set_hooks(
+            *[(hook, read(hook)) for hook in ('post_create', 'post_update', 'post_save')]
+        )
+        StubUpdateWatcher.set_hooks(('post_update', read('post_update')))
+
+    def assert_read_without_queries(self, hook, instance):
+        self.assertEqual(([instance], 1, 1, True, instance, instance), self.reads[hook])
+        self.assertIs(instance, self.reads[hook][0][0])
+        self.assertEqual(0, self.reads[f'{hook}_queries'])
+        self.assertEqual([], self.reads[f'{hook}_filtered'])
+
+    def test_create(self):
+        instance = SaveModel(text='text')
+        instance.save()
+
+        self.assert_read_without_queries('post_create', instance)
+        self.assert_read_without_queries('post_save', instance)
+
+    def test_objects_create(self):
+        instance = SaveModel.objects.create(text='text')
+
+        self.assert_read_without_queries('post_create', instance)
+        self.assert_read_without_queries('post_save', instance)
+
+    def test_update(self):
+        instance = SaveModel.objects.create(text='text')
+        instance.text = 'new_text'
+        instance.save()
+
+        self.assert_read_without_queries('post_update', instance)
+        self.assert_read_without_queries('post_save', instance)
+
+    def test_update_watcher(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text')])
+        instance = UpdateModel.objects.get()
+        instance.text = 'new_text'
+        instance.save()
+
+        self.assert_read_without_queries('post_update', instance)
@@ -17,7 +17,7 @@ from tests.watchers import (
     StubUpdateWatcher,
 )
 
-from .helpers import CopyingMock
+from .helpers import CopyingMock, spy
 
 
 class CreateMixinTests(TestCase):
@@ -107,8 +107,7 @@ class CreateMixinTests(TestCase):
 
     def test_hooks_order_with_objects(self):
         qs = CreateModel.objects.get_queryset()
-        self.mock.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(CreateModel.objects, 'get_queryset', lambda: qs):
             instance = CreateModel.objects.create(text='text')
 
@@ -119,13 +118,29 @@ class CreateMixinTests(TestCase):
         self.mock.assert_has_calls(
             [
                 call.pre_create(*pre_params),
-                call.UNWATCHED_create(text='text'),
+                call.UNWATCHED_create(_instance=CreateModel(text='text')),
                 call.post_create(*post_params),
             ]
         )
         self.assertEqual(len(self.mock.mock_calls), 3)
         self.assertEqual(6, CreateModel.objects.count())
 
+    def test_pre_create_changes_are_saved_with_objects(self):
+        def pre_create(_, target, meta_params, **hooks_params):
+            target[0].text = 'changed_text'
+
+        StubCreateWatcher.set_hooks(('pre_create', pre_create))
+
+        with patch.object(
+            CreateModel, '__init__', autospec=True, side_effect=CreateModel.__init__
+        ) as mocked_init:
+            instance = CreateModel.objects.create(text='text')
+
+        self.assertEqual(1, mocked_init.call_count)
+        self.assertEqual('changed_text', instance.text)
+        instance.refresh_from_db()
+        self.assertEqual('changed_text', instance.text)
+
     def test_exception_on_post_create_dont_save(self):
         self.mock.post_create.side_effect = Exception
 
@@ -714,8 +729,7 @@ class SaveMixinTests(TestCase):
 
     def test_create_hooks_order_with_objects(self):
         qs = SaveModel.objects.get_queryset()
-        self.mock.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(SaveModel.objects, 'get_queryset', lambda: qs):
             instance = SaveModel.objects.create(text='create_with_objects')
 
@@ -727,7 +741,7 @@ class SaveMixinTests(TestCase):
             [
                 call.pre_save(*pre_params),
                 call.pre_create(*pre_params),
-                call.UNWATCHED_create(text='create_with_objects'),
+                call.UNWATCHED_create(_instance=SaveModel(text='create_with_objects')),
                 call.post_create(*post_params),
                 call.post_save(*post_params),
             ]
@@ -781,6 +795,14 @@ class SaveMixinTests(TestCase):
         self.assertEqual(len(self.mock.mock_calls), 5)
         self.assertEqual(5, SaveModel.objects.filter(text='new_text').count())
 
+    def test_create_hooks_share_instance_with_objects(self):
+        with patch.object(
+            SaveModel, '__init__', autospec=True, side_effect=SaveModel.__init__
+        ) as mocked_init:
+            SaveModel.objects.create(text='text')
+
+        self.assertEqual(1, mocked_init.call_count)
+
     def test_exception_on_pre_create_dont_save(self):
         self.mock.pre_create.side_effect = Exception
 
@@ -1124,8 +1146,7 @@ class AllMixinsTests(TestCase):  # noqa
 
     def test_create_hooks_order_with_objects(self):
         qs = SaveDeleteModel.objects.get_queryset()
-        self.mock.UNWATCHED_create.side_effect = qs.UNWATCHED_create
-        setattr(qs, 'UNWATCHED_create', self.mock.UNWATCHED_create)
+        setattr(qs, 'UNWATCHED_create', spy(self.mock.UNWATCHED_create, qs.UNWATCHED_create))
         with patch.object(SaveDeleteModel.objects, 'get_queryset', lambda: qs):
             instance = SaveDeleteModel.objects.create(text='fake')
 
@@ -1137,7 +1158,7 @@ class AllMixinsTests(TestCase):  # noqa
             [
                 call.pre_save(*pre_params),
                 call.pre_create(*pre_params),
-                call.UNWATCHED_create(text='fake'),
+                call.UNWATCHED_create(_instance=SaveDeleteModel(text='fake')),
                 call.post_create(*post_params),
                 call.post_save(*post_params),
             ]
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import transaction
+from django.test.testcases import TestCase
+
+from tests.models import SaveDeleteModel
+from tests.watchers import StubSaveDeleteWatcher
+
+
+class MultiDatabaseTests(TestCase):
+    databases = {'default', 'secondary'}
+
+    def setUp(self) -> None:
+        SaveDeleteModel.objects.using('secondary').bulk_create(
+            [SaveDeleteModel(text='text1'), SaveDeleteModel(text='text2')]
+        )
+        self.mock = MagicMock()
+        StubSaveDeleteWatcher.set_hooks(
+            ('pre_create', self.mock.pre_create),
+            ('post_create', self.mock.post_create),
+            ('pre_update', self.mock.pre_update),
+            ('post_update', self.mock.post_update),
+            ('pre_save', self.mock.pre_save),
+            ('post_save', self.mock.post_save),
+            ('pre_delete', self.mock.pre_delete),
+            ('post_delete', self.mock.post_delete),
+        )
+
+    def get_target_db(self, hook: str) -> str:
+        return getattr(self.mock, hook).call_args[0][0].db
+
+    def test_create_with_instance(self):
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            SaveDeleteModel(text='text').save(using='secondary')
+
+        mocked.atomic.assert_called_once_with(using='secondary')
+        self.assertEqual('secondary', self.get_target_db('post_create'))
+        self.assertEqual('secondary', self.get_target_db('post_save'))
+        self.assertEqual(3, SaveDeleteModel.objects.using('secondary').count())
+        self.assertEqual(0, SaveDeleteModel.objects.count())
+
+    def test_create_with_objects(self):
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            SaveDeleteModel.objects.db_manager('secondary').create(text='text')
+
+        mocked.atomic.assert_called_once_with(using='secondary')
+        self.assertEqual('secondary', self.get_target_db('post_create'))
+        self.assertEqual(3, SaveDeleteModel.objects.using('secondary').count())
+        self.assertEqual(0, SaveDeleteModel.objects.count())
+
+    def test_update_with_instance(self):
+        instance = SaveDeleteModel.objects.using('secondary').get(text='text1')
+        instance.text = 'new_text'
+
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            instance.save()
+
+        mocked.atomic.assert_called_once_with(using='secondary')
+        self.assertEqual('secondary', self.get_target_db('pre_update'))
+        self.assertEqual('secondary', self.get_target_db('post_update'))
+        self.assertTrue(SaveDeleteModel.objects.using('secondary').filter(text='new_text').exists())
+
+    def test_update_with_objects(self):
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            SaveDeleteModel.objects.using('secondary').update(text='new_text')
+
+        mocked.atomic.assert_called_once_with(using='secondary')
+        self.assertEqual('secondary', self.get_target_db('pre_save'))
+        self.assertEqual('secondary', self.get_target_db('post_update'))
+        updated = SaveDeleteModel.objects.using('secondary').filter(text='new_text')
+        self.assertEqual(2, updated.count())
+
+    def test_delete_with_instance(self):
+        instance = SaveDeleteModel.objects.using('secondary').get(text='text1')
+
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            instance.delete()
+
+        mocked.atomic.assert_called_once_with(using='secondary')
+        self.assertEqual('secondary', self.get_target_db('pre_delete'))
+        self.assertEqual(1, SaveDeleteModel.objects.using('secondary').count())
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.testcases import TestCase
+
+from django_watcher import profiling
+from tests.models import SaveModel
+from tests.watchers import StubSaveWatcher
+
+
+class SlowOperationTests(TestCase):
+    def setUp(self) -> None:
+        StubSaveWatcher.set_hooks(('pre_save', lambda *args, **kwargs: None))
+        SaveModel.objects.bulk_create([SaveModel(text='text1'), SaveModel(text='text2')])
+
+    def test_logs_breakdown_of_slow_operations(self):
+        with patch.object(StubSaveWatcher, 'slow_operation_ms', 0), self.assertLogs(
+            'django_watcher.slow', 'WARNING'
+        ) as logs:
+            SaveModel.objects.filter(text='text1').update(text='new_text')
+
+        record = logs.records[0]
+        self.assertTrue(record.getMessage().startswith('Slow watched operation update on tests.'))
+        self.assertEqual('tests.SaveModel', record.model)
+        self.assertEqual('update', record.operation)
+        self.assertEqual(
+            ['pre_save', 'pre_update', 'post_update', 'post_save'], list(record.hook_times_ms)
+        )
+        self.assertEqual(len(record.slowest_queries), min(record.query_count, 5))
+        self.assertTrue(any(q['sql'].startswith('UPDATE') for q in record.slowest_queries))
+        durations = [q['duration_ms'] for q in record.slowest_queries]
+        self.assertEqual(sorted(durations, reverse=True), durations)
+
+    def test_fast_operations_are_not_logged(self):
+        with patch.object(StubSaveWatcher, 'slow_operation_ms', 60_000), patch.object(
+            profiling.logger, 'warning'
+        ) as warning:
+            SaveModel.objects.filter(text='text1').update(text='new_text')
+
+        warning.assert_not_called()
+
+    def test_queries_are_not_recorded_when_disabled(self):
+        with patch.object(connection, 'execute_wrapper') as execute_wrapper:
+            SaveModel.objects.filter(text='text1').update(text='new_text')
+
+        execute_wrapper.assert_not_called()
@@ -0,0 +1,122 @@
+import cProfile
+import pstats
+from typing import Callable, Dict, List, Tuple, Type
+
+from django.db import connection, models
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import (
+    ReadIgnoredChildModel,
+    ReadIgnoredModel,
+    ReadWatchedChildModel,
+    ReadWatchedModel,
+)
+
+from .helpers import best_time_per_call, peak_memory
+
+
+class ReadPathOverheadTests(TestCase):
+    """
+    Watching a model must not make its reads slower: the watched manager and queryset only
+    change write operations, so SELECTs should cost the same as on an unwatched model.
+    Timings are noisy, so each comparison gets a few attempts before failing.
+    """
+
+    time_tolerance = 0.05
+    memory_tolerance = 0.05
+    attempts = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        pairs = (
+            (ReadWatchedModel, ReadWatchedChildModel),
+            (ReadIgnoredModel, ReadIgnoredChildModel),
+        )
+        for model, child_model in pairs:
+            model.objects.bulk_create([model(text=f'text{i}') for i in range(20)])
+            child_model.objects.bulk_create(
+                [
+                    child_model(text=f'child{i}', parent=parent)
+                    for parent in model.objects.all()
+                    for i in range(5)
+                ]
+            )
+
+    def get_read_operations(
+        self, model: Type[models.Model], child_model: Type[models.Model]
+    ) -> Dict[str, Callable]:
+        parent = model.objects.order_by('pk')[0]
+
+        return {
+            'filter_values': lambda: list(
+                model.objects.filter(text__startswith='text1').values('id', 'text')
+            ),
+            'get': lambda: model.objects.get(pk=parent.pk),
+            'count': lambda: model.objects.count(),
+            'related_manager': lambda: list(parent.children.all()),
+            'reverse_filter': lambda: child_model.objects.filter(parent=parent).exists(),
+        }
+
+    def get_operation_pairs(self) -> List[Tuple[str, Callable, Callable]]:
+        watched = self.get_read_operations(ReadWatchedModel, ReadWatchedChildModel)
+        unwatched = self.get_read_operations(ReadIgnoredModel, ReadIgnoredChildModel)
+        return [(name, watched[name], unwatched[name]) for name in watched]
+
+    def capture_sql(self, func: Callable) -> List[str]:
+        with CaptureQueriesContext(connection) as ctx:
+            func()
+        return [q['sql'].replace('readwatched', 'read').replace('readignored', 'read') for q in ctx]
+
+    def count_calls(self, func: Callable) -> int:
+        func()
+        profile = cProfile.Profile()
+        profile.runcall(func)
+        return pstats.Stats(profile).total_calls  # type: ignore
+
+    def assert_not_slower(self, name: str, watched: Callable, unwatched: Callable) -> None:
+        for attempt in range(self.attempts):
+            # alternate which one runs first, so warm up effects don't favor either
+            if attempt % 2:
+                watched_time = best_time_per_call(watched)
+                unwatched_time = best_time_per_call(unwatched)
+            else:
+                unwatched_time = best_time_per_call(unwatched)
+                watched_time = best_time_per_call(watched)
+            if watched_time <= unwatched_time * (1 + self.time_tolerance):
+                return
+
+        self.fail(
+            f'{name}: watched {watched_time * 1e6:.1f}us/call, '
+            f'unwatched {unwatched_time * 1e6:.1f}us/call'
+        )
+
+    def assert_not_bigger(self, name: str, watched: Callable, unwatched: Callable) -> None:
+        watched(), unwatched()  # warm up caches shared by both models
+        for _ in range(self.attempts):
+            unwatched_peak = peak_memory(unwatched)
+            watched_peak = peak_memory(watched)
+            if watched_peak <= unwatched_peak * (1 + self.memory_tolerance):
+                return
+
+        self.fail(f'{name}: watched peak {watched_peak}B, unwatched peak {unwatched_peak}B')
+
+    def test_same_queries(self):
+        for name, watched, unwatched in self.get_operation_pairs():
+            with self.subTest(name):
+                self.assertEqual(self.capture_sql(unwatched), self.capture_sql(watched))
+
+    def test_function_calls(self):
+        for name, watched, unwatched in self.get_operation_pairs():
+            with self.subTest(name):
+                self.assertLessEqual(self.count_calls(watched), self.count_calls(unwatched))
+
+    def test_time_per_call(self):
+        for name, watched, unwatched in self.get_operation_pairs():
+            with self.subTest(name):
+                self.assert_not_slower(name, watched, unwatched)
+
+    def test_allocations(self):
+        for name, watched, unwatched in self.get_operation_pairs():
+            with self.subTest(name):
+                self.assert_not_bigger(name, watched, unwatched)
@@ -0,0 +1,140 @@
+from unittest.mock import MagicMock, call
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_watcher import MetaParams
+from django_watcher.mixins import _QUERY_SET
+from tests.models import CreateModel, DeleteModel, SaveModel, UpdateModel, UUIDModel
+from tests.watchers import StubCreateWatcher, StubSaveWatcher, StubUpdateWatcher
+
+from .helpers import CopyingMock
+
+
+class SaveManyTests(TestCase):
+    def setUp(self) -> None:
+        self.mock: MagicMock = CopyingMock()
+        hooks = ('pre_create', 'post_create', 'pre_update', 'post_update', 'pre_save', 'post_save')
+        for watcher in (StubCreateWatcher, StubUpdateWatcher, StubSaveWatcher):
+            watcher.set_hooks(*[(hook, getattr(self.mock, hook)) for hook in hooks])
+
+        self.meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': {}}
+
+    def get_instances(self, model):
+        model.objects.bulk_create([model(text='text1'), model(text='text2')])
+        existing = list(model.objects.order_by('pk'))
+        for instance in existing:
+            instance.text = f'new_{instance.text}'
+        return existing, [model(text='text3'), model(text='text4')]
+
+    def test_save_hooks(self):
+        existing, new = self.get_instances(SaveModel)
+        existing_pks = [instance.pk for instance in existing]
+
+        SaveModel.objects.save_many(existing + new)
+
+        new_pks = [instance.pk for instance in new]
+        self.assertTrue(all(new_pks))
+        self.mock.assert_has_calls(
+            [
+                call.pre_save(
+                    existing + [SaveModel(text='text3'), SaveModel(text='text4')],
+                    self.meta_params,
+                ),
+                call.pre_create(
+                    [SaveModel(text='text3'), SaveModel(text='text4')], self.meta_params
+                ),
+                call.pre_update(SaveModel.objects.filter(pk__in=existing_pks), self.meta_params),
+                call.post_create(SaveModel.objects.filter(pk__in=new_pks), self.meta_params),
+                call.post_update(SaveModel.objects.filter(pk__in=existing_pks), self.meta_params),
+                call.post_save(
+                    SaveModel.objects.filter(pk__in=existing_pks + new_pks), self.meta_params
+                ),
+            ]
+        )
+        self.assertEqual(6, len(self.mock.mock_calls))
+        self.assertEqual(
+            ['new_text1', 'new_text2', 'text3', 'text4'],
+            list(SaveModel.objects.order_by('pk').values_list('text', flat=True)),
+        )
+
+    def test_create_hooks(self):
+        existing, new = self.get_instances(CreateModel)
+
+        CreateModel.objects.save_many(existing + new, batch_size=10)
+
+        meta_params: MetaParams = {'source': _QUERY_SET, 'operation_params': {'batch_size': 10}}
+        new_pks = [instance.pk for instance in new]
+        self.mock.assert_has_calls(
+            [
+                call.pre_create(
+                    [CreateModel(text='text3'), CreateModel(text='text4')], meta_params
+                ),
+                call.post_create(CreateModel.objects.filter(pk__in=new_pks), meta_params),
+            ]
+        )
+        self.assertEqual(2, len(self.mock.mock_calls))
+        self.assertEqual(4, CreateModel.objects.count())
+        self.assertEqual(2, CreateModel.objects.filter(text__startswith='new_').count())
+
+    def test_update_hooks(self):
+        existing, new = self.get_instances(UpdateModel)
+        existing_pks = [instance.pk for instance in existing]
+
+        UpdateModel.objects.save_many(existing + new)
+
+        self.mock.assert_has_calls(
+            [
+                call.pre_update(UpdateModel.objects.filter(pk__in=existing_pks), self.meta_params),
+                call.post_update(UpdateModel.objects.filter(pk__in=existing_pks), self.meta_params),
+            ]
+        )
+        self.assertEqual(2, len(self.mock.mock_calls))
+        self.assertEqual(4, UpdateModel.objects.count())
+
+    def test_new_instances_with_default_pk_are_created(self):
+        UUIDModel.objects.bulk_create([UUIDModel(text='text1')])
+        existing = UUIDModel.objects.get()
+        existing.text = 'new_text1'
+        new = [UUIDModel(text='text2'), UUIDModel(text='text3')]
+
+        UUIDModel.objects.save_many([existing] + new)
+
+        self.mock.pre_create.assert_called_once_with(new, self.meta_params)
+        self.mock.post_update.assert_called_once()
+        self.assertEqual(
+            ['new_text1', 'text2', 'text3'],
+            sorted(UUIDModel.objects.values_list('text', flat=True)),
+        )
+
+    def test_updates_in_one_statement(self):
+        existing, _ = self.get_instances(SaveModel)
+
+        with CaptureQueriesContext(connection) as ctx:
+            SaveModel.objects.save_many(existing, update_fields=['text'])
+
+        updates = [q['sql'] for q in ctx if q['sql'].startswith('UPDATE')]
+        self.assertEqual(1, len(updates))
+        self.assertEqual(2, SaveModel.objects.filter(text__startswith='new_').count())
+
+    def test_ignore_hooks(self):
+        existing, new = self.get_instances(SaveModel)
+
+        SaveModel.objects.save_many(existing + new, _ignore_hooks=True)
+
+        self.assertEqual(0, len(self.mock.mock_calls))
+        self.assertEqual(4, SaveModel.objects.count())
+
+    def test_exception_on_post_save_dont_save(self):
+        existing, new = self.get_instances(SaveModel)
+        self.mock.post_save.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            SaveModel.objects.save_many(existing + new)
+
+        self.assertEqual(2, SaveModel.objects.count())
+        self.assertEqual(0, SaveModel.objects.filter(text__startswith='new_').count())
+
+    def test_not_available_for_delete_watchers(self):
+        self.assertFalse(hasattr(DeleteModel.objects, 'save_many'))
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test.testcases import TestCase
+
+from django_watcher.search import SearchBackend
+from tests.models import IndexedModel
+from tests.watchers import StubSearchIndexWatcher
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self) -> None:
+        self.backend = StubSearchIndexWatcher.search_backend
+        IndexedModel.objects.bulk_create([IndexedModel(text='text1'), IndexedModel(text='text2')])
+        self.pks = list(IndexedModel.objects.order_by('pk').values_list('pk', flat=True))
+        self.backend.clear()
+        self.addCleanup(self.backend.clear)
+
+    def get_index(self):
+        return self.backend.indexes['tests.IndexedModel']
+
+    def test_operations_of_a_transaction_send_one_request(self):
+        with self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+            instance = IndexedModel.objects.create(text='text3')
+            instance.number = 3
+            instance.save()
+            IndexedModel.objects.filter(pk=self.pks[0]).update(text='new_text')
+            IndexedModel.objects.filter(pk=self.pks[1]).delete()
+            self.assertEqual([], self.backend.requests)
+
+        self.assertEqual(1, len(self.backend.requests))
+        _, documents, deleted = self.backend.requests[0]
+        self.assertEqual(
+            [
+                {'pk': self.pks[0], 'text': 'new_text', 'number': 0},
+                {'pk': instance.pk, 'text': 'text3', 'number': 3},
+            ],
+            documents,
+        )
+        self.assertEqual([self.pks[1]], deleted)
+        self.assertEqual({self.pks[0], instance.pk}, set(self.get_index()))
+
+    def test_batches(self):
+        with patch.object(StubSearchIndexWatcher, 'search_batch_size', 2):
+            with self.captureOnCommitCallbacks(execute=True):
+                IndexedModel.objects.save_many([IndexedModel(text=f'new{i}') for i in range(3)])
+
+        self.assertEqual([2, 1], [len(request[1]) for request in self.backend.requests])
+        self.assertEqual(3, len(self.get_index()))
+
+    def test_rollback_sends_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(ValueError), transaction.atomic():
+                IndexedModel.objects.all().update(text='new_text')
+                raise ValueError()
+
+        self.assertEqual([], callbacks)
+        self.assertEqual([], self.backend.requests)
+
+    def test_rolled_back_savepoint_is_not_reused(self):
+        with self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+            with self.assertRaises(ValueError), transaction.atomic():
+                IndexedModel.objects.filter(pk=self.pks[0]).update(text='new_text')
+                raise ValueError()
+            IndexedModel.objects.filter(pk=self.pks[1]).update(number=2)
+
+        self.assertEqual(
+            [('tests.IndexedModel', [{'pk': self.pks[1], 'text': 'text2', 'number': 2}], [])],
+            self.backend.requests,
+        )
+
+    def test_backend_requires_bulk(self):
+        class IncompleteBackend(SearchBackend):  # pylint: disable=abstract-method
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteBackend()  # type: ignore[abstract]
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, patch
+
+from django.db.models import QuerySet
+from django.test.testcases import TestCase
+
+from tests.models import LockingModel
+from tests.watchers import StubLockingWatcher
+
+
+class SelectForUpdateTests(TestCase):
+    def setUp(self) -> None:
+        LockingModel.objects.bulk_create(
+            [
+                LockingModel(text='text1'),
+                LockingModel(text='text2'),
+                LockingModel(text='text3'),
+                LockingModel(text='other'),
+            ]
+        )
+        self.mock = MagicMock()
+        StubLockingWatcher.set_hooks(
+            ('pre_update', self.mock.pre_update),
+            ('post_update', self.mock.post_update),
+            ('pre_save', self.mock.pre_save),
+            ('post_save', self.mock.post_save),
+            ('pre_delete', self.mock.pre_delete),
+            ('post_delete', self.mock.post_delete),
+        )
+
+    def test_update_locks_target_once(self):
+        qs_cls = getattr(LockingModel.objects, '_queryset_class')
+        with patch.object(
+            qs_cls, 'select_for_update', autospec=True, side_effect=QuerySet.select_for_update
+        ) as mocked_select_for_update:
+            LockingModel.objects.filter(text__startswith='text').update(text='new_text')
+
+        mocked_select_for_update.assert_called_once()
+        self.assertEqual({'skip_locked': True}, mocked_select_for_update.call_args[1])
+        self.assertEqual(3, LockingModel.objects.filter(text='new_text').count())
+
+    def test_update_hooks_share_snapshot(self):
+        def pre_update(target, meta_params, **hooks_params):
+            with self.assertNumQueries(0):
+                self.assertEqual(['text1', 'text2', 'text3'], sorted(i.text for i in target))
+
+        self.mock.pre_update.side_effect = pre_update
+
+        # savepoint, select, update and savepoint release
+        with self.assertNumQueries(4):
+            LockingModel.objects.filter(text__startswith='text').update(text='new_text')
+
+        pre_target = self.mock.pre_update.call_args[0][0]
+        post_target = self.mock.post_update.call_args[0][0]
+        self.assertIs(pre_target, self.mock.pre_save.call_args[0][0])
+        self.assertEqual(['new_text'] * 3, [i.text for i in post_target])
+
+    def test_update_only_changes_locked_rows(self):
+        def pre_update(target, meta_params, **hooks_params):
+            LockingModel.objects.bulk_create([LockingModel(text='text4')])
+
+        self.mock.pre_update.side_effect = pre_update
+
+        result = LockingModel.objects.filter(text__startswith='text').update(text='new_text')
+
+        self.assertEqual(3, result)
+        self.assertTrue(LockingModel.objects.filter(text='text4').exists())
+
+    def test_delete_hooks_share_snapshot(self):
+        instances = list(LockingModel.objects.filter(text__startswith='text'))
+
+        # savepoint, select, delete and savepoint release
+        with self.assertNumQueries(4):
+            LockingModel.objects.filter(text__startswith='text').delete()
+
+        self.assertEqual(instances, self.mock.post_delete.call_args[0][0])
+        self.assertEqual(['other'], list(LockingModel.objects.values_list('text', flat=True)))
+
+    def test_instance_hooks_get_locked_row(self):
+        instance = LockingModel.objects.get(text='text1')
+        instance.text = 'new_text'
+        instance.save()
+
+        pre_target = self.mock.pre_update.call_args[0][0]
+        self.assertTrue(StubLockingWatcher().is_snapshot(pre_target))
+        with self.assertNumQueries(0):
+            self.assertEqual(['text1'], [i.text for i in pre_target])
+        self.assertEqual(['new_text'], [i.text for i in self.mock.post_update.call_args[0][0]])
+
+    def lock_elsewhere(self, text):
+        def select_for_update(queryset, **kwargs):
+            return QuerySet.select_for_update(queryset, **kwargs).exclude(text=text)
+
+        qs_cls = getattr(LockingModel.objects, '_queryset_class')
+        return patch.object(qs_cls, 'select_for_update', select_for_update)
+
+    def test_instance_delete_skips_row_locked_elsewhere(self):
+        instance = LockingModel.objects.get(text='text1')
+
+        with self.lock_elsewhere('text1'):
+            result = instance.delete()
+
+        self.assertEqual((0, {'tests.LockingModel': 0}), result)
+        self.assertTrue(LockingModel.objects.filter(text='text1').exists())
+        self.mock.pre_delete.assert_not_called()
+        self.mock.post_delete.assert_not_called()
+
+    def test_instance_save_skips_row_locked_elsewhere(self):
+        instance = LockingModel.objects.get(text='text1')
+        instance.text = 'new_text'
+
+        with self.lock_elsewhere('text1'):
+            instance.save()
+
+        self.assertTrue(LockingModel.objects.filter(text='text1').exists())
+        self.mock.pre_update.assert_not_called()
+        self.mock.post_update.assert_not_called()
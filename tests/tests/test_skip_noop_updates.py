@@ -0,0 +1,101 @@
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.db.models import F
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import TrackingUpdateModel
+from tests.watchers import StubTrackingUpdateWatcher
+
+
+class SkipNoopUpdatesTests(TestCase):
+    def setUp(self) -> None:
+        self.pks: Dict[str, List[int]] = {}
+
+        def record(hook):
+            def side_effect(target, meta_params, **hooks_params):
+                self.pks[hook] = self.pks.get(hook, []) + sorted(i.pk for i in target)
+
+            return MagicMock(side_effect=side_effect)
+
+        StubTrackingUpdateWatcher.set_hooks(
+            *[(hook, record(hook)) for hook in ('pre_update', 'post_update')]
+        )
+        patcher = patch.object(StubTrackingUpdateWatcher, 'skip_noop_updates', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        TrackingUpdateModel.objects.bulk_create(
+            [
+                TrackingUpdateModel(text='done', number=1),
+                TrackingUpdateModel(text='done', number=2),
+                TrackingUpdateModel(text='todo', number=1),
+            ]
+        )
+
+    def test_excludes_rows_already_updated(self):
+        todo = TrackingUpdateModel.objects.get(text='todo').pk
+
+        result = TrackingUpdateModel.objects.all().update(text='done')
+
+        self.assertEqual(1, result)
+        self.assertEqual({'pre_update': [todo], 'post_update': [todo]}, self.pks)
+        self.assertEqual(3, TrackingUpdateModel.objects.filter(text='done').count())
+
+    def test_rows_equal_on_every_value_only(self):
+        result = TrackingUpdateModel.objects.all().update(text='done', number=1)
+
+        self.assertEqual(2, result)
+        self.assertEqual(3, TrackingUpdateModel.objects.filter(text='done', number=1).count())
+
+    def test_expressions_update_every_row(self):
+        result = TrackingUpdateModel.objects.all().update(text='done', number=F('number') + 1)
+
+        self.assertEqual(3, result)
+        self.assertEqual(3, len(self.pks['post_update']))
+
+    def test_disabled_by_default(self):
+        with patch.object(StubTrackingUpdateWatcher, 'skip_noop_updates', False):
+            result = TrackingUpdateModel.objects.all().update(text='done')
+
+        self.assertEqual(3, result)
+
+    def get_statements(self, ctx):
+        return [q['sql'] for q in ctx if 'SAVEPOINT' not in q['sql']]
+
+    def test_updates_the_excluded_queryset(self):
+        with patch('django_watcher.utils.supports_returning', return_value=False):
+            with CaptureQueriesContext(connection) as ctx:
+                result = TrackingUpdateModel.objects.all().update(text='done')
+
+        self.assertEqual(1, result)
+        update = [sql for sql in self.get_statements(ctx) if sql.startswith('UPDATE')][0]
+        self.assertIn('NOT', update)
+        self.assertNotIn(' IN (', update)
+        self.assertEqual(1, len(self.pks['post_update']))
+
+    def test_no_pks_are_selected_without_post_hooks(self):
+        is_overriden = MagicMock(side_effect=lambda hook: hook == 'pre_update')
+        with patch.object(StubTrackingUpdateWatcher, 'is_overriden', is_overriden):
+            with patch('django_watcher.utils.supports_returning', return_value=False):
+                with CaptureQueriesContext(connection) as ctx:
+                    result = TrackingUpdateModel.objects.all().update(text='done')
+
+        self.assertEqual(1, result)
+        # only the read of pre_update comes before the update
+        statements = [sql.split(' ')[0] for sql in self.get_statements(ctx)]
+        self.assertEqual(['SELECT', 'UPDATE'], statements[:2])
+
+    def test_post_hooks_run_once_per_batch(self):
+        TrackingUpdateModel.objects.bulk_create(
+            [TrackingUpdateModel(text='todo', number=i) for i in range(4)]
+        )
+        todo = sorted(TrackingUpdateModel.objects.filter(text='todo').values_list('pk', flat=True))
+
+        with patch.object(StubTrackingUpdateWatcher, 'post_update_batch_size', 2):
+            result = TrackingUpdateModel.objects.all().update(text='done')
+
+        self.assertEqual(5, result)
+        self.assertEqual(3, StubTrackingUpdateWatcher.post_update.call_count)
+        self.assertEqual(todo, sorted(self.pks['post_update']))
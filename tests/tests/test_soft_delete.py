@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.models import SoftDeleteChildModel, SoftDeleteModel
+from tests.watchers import StubSoftDeleteWatcher
+
+
+class SoftDeleteTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubSoftDeleteWatcher.set_hooks(
+            ('pre_delete', self.mock.pre_delete), ('post_delete', self.mock.post_delete)
+        )
+        SoftDeleteModel.objects.bulk_create(
+            [SoftDeleteModel(text='text1'), SoftDeleteModel(text='text2')]
+        )
+
+    def get_statements(self, ctx):
+        return [q['sql'] for q in ctx if 'SAVEPOINT' not in q['sql']]
+
+    def test_managers(self):
+        SoftDeleteModel.all_objects.filter(text='text1').update(deleted_at=timezone.now())
+
+        self.assertEqual(['text2'], [i.text for i in SoftDeleteModel.objects.all()])
+        self.assertEqual(2, SoftDeleteModel.all_objects.count())
+        self.assertIn('"deleted_at" IS NULL', str(SoftDeleteModel.objects.all().query))
+
+    def test_default_and_base_managers(self):
+        SoftDeleteModel.objects.filter(text='text1').delete()
+
+        self.assertEqual(['text2'], [i.text for i in SoftDeleteModel._default_manager.all()])
+        self.assertEqual(2, SoftDeleteModel._base_manager.count())
+
+    def test_queryset_delete_is_a_single_update(self):
+        with patch.object(StubSoftDeleteWatcher, 'is_overriden', MagicMock(return_value=False)):
+            with CaptureQueriesContext(connection) as ctx:
+                result = SoftDeleteModel.objects.filter(text='text1').delete()
+
+        statements = self.get_statements(ctx)
+        self.assertEqual(1, len(statements))
+        self.assertTrue(statements[0].startswith('UPDATE'))
+        self.assertEqual((1, {'tests.SoftDeleteModel': 1}), result)
+        self.assertEqual(['text2'], [i.text for i in SoftDeleteModel.objects.all()])
+        self.assertIsNotNone(SoftDeleteModel.all_objects.get(text='text1').deleted_at)
+
+    def test_post_delete_receives_soft_deleted_instances(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = SoftDeleteModel.objects.all().delete()
+
+        statements = self.get_statements(ctx)
+        self.assertEqual(1, len(statements))
+        self.assertIn('RETURNING', statements[0])
+        self.assertEqual((2, {'tests.SoftDeleteModel': 2}), result)
+        instances = sorted(self.mock.post_delete.call_args[0][0], key=lambda i: i.pk)
+        self.assertEqual(list(SoftDeleteModel.all_objects.order_by('pk')), instances)
+        self.assertEqual(['text1', 'text2'], [i.text for i in instances])
+        self.assertTrue(all(i.deleted_at for i in instances))
+        self.mock.pre_delete.assert_called_once()
+
+    def test_post_delete_hook_fields_out_of_model_order(self):
+        fields = {'post_delete': ['deleted_at', 'text']}
+        with patch.object(StubSoftDeleteWatcher, 'hook_fields', fields):
+            SoftDeleteModel.objects.filter(text='text1').delete()
+
+        instance = self.mock.post_delete.call_args[0][0][0]
+        self.assertEqual('text1', instance.text)
+        self.assertIsInstance(instance.deleted_at, datetime)
+        self.assertEqual(set(), instance.get_deferred_fields())
+
+    def test_post_delete_of_multi_table_child(self):
+        child = SoftDeleteChildModel.objects.create(text='child')
+
+        for fields in ({}, {'post_delete': ['deleted_at']}):
+            with self.subTest(hook_fields=fields):
+                getattr(SoftDeleteChildModel, 'all_objects').update(deleted_at=None)
+                with patch.object(StubSoftDeleteWatcher, 'hook_fields', fields):
+                    with CaptureQueriesContext(connection) as ctx:
+                        SoftDeleteChildModel.objects.all().delete()
+
+                instance = self.mock.post_delete.call_args[0][0][0]
+                self.assertEqual(child.pk, instance.pk)
+                self.assertIsInstance(instance.deleted_at, datetime)
+                if fields:
+                    self.assertEqual(1, len(self.get_statements(ctx)))
+                else:
+                    self.assertEqual('child', instance.text)
+
+    def test_post_delete_without_returning(self):
+        with patch('django_watcher.utils.supports_returning', return_value=False):
+            result = SoftDeleteModel.objects.all().delete()
+
+        self.assertEqual((2, {'tests.SoftDeleteModel': 2}), result)
+        instances = self.mock.post_delete.call_args[0][0]
+        self.assertEqual(2, len(instances))
+        self.assertTrue(all(i.deleted_at for i in instances))
+        self.assertEqual(0, SoftDeleteModel.objects.count())
+
+    def test_soft_deleted_rows_are_not_deleted_again(self):
+        SoftDeleteModel.objects.filter(text='text1').delete()
+
+        result = SoftDeleteModel.all_objects.all().delete()
+
+        self.assertEqual((1, {'tests.SoftDeleteModel': 1}), result)
+        self.assertEqual(['text2'], [i.text for i in self.mock.post_delete.call_args[0][0]])
+
+    def test_instance_delete(self):
+        instance = SoftDeleteModel.objects.get(text='text1')
+
+        self.assertEqual((1, {'tests.SoftDeleteModel': 1}), instance.delete())
+        self.assertIsNotNone(instance.deleted_at)
+        self.assertEqual((0, {'tests.SoftDeleteModel': 0}), instance.delete())
+        self.assertEqual(2, SoftDeleteModel.all_objects.count())
+
+
+class PurgeTests(TestCase):
+    def setUp(self) -> None:
+        now = timezone.now()
+        getattr(SoftDeleteModel, 'all_objects').bulk_create(
+            [
+                SoftDeleteModel(text='old1', deleted_at=now - timedelta(days=10)),
+                SoftDeleteModel(text='old2', deleted_at=now - timedelta(days=10)),
+                SoftDeleteModel(text='recent', deleted_at=now),
+                SoftDeleteModel(text='live'),
+            ]
+        )
+        self.watcher = getattr(SoftDeleteModel, '_get_watcher')()
+
+    def get_texts(self):
+        return sorted(SoftDeleteModel.all_objects.values_list('text', flat=True))
+
+    def test_purge_in_batches(self):
+        self.watcher.purge_batch_size = 2
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(3, self.watcher.purge())
+
+        self.assertEqual(2, len([q for q in ctx if q['sql'].startswith('DELETE')]))
+        self.assertEqual(['live'], self.get_texts())
+
+    def test_purge_before(self):
+        self.assertEqual(2, self.watcher.purge(before=timezone.now() - timedelta(days=1)))
+
+        self.assertEqual(['live', 'recent'], self.get_texts())
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command('watcher_purge', 'tests.SoftDeleteModel', '--days', '1', stdout=out)
+
+        self.assertEqual('Purged 2 rows of tests.SoftDeleteModel\n', out.getvalue())
+        self.assertEqual(['live', 'recent'], self.get_texts())
+
+    def test_command_requires_soft_delete_watcher(self):
+        with self.assertRaises(CommandError):
+            call_command('watcher_purge', 'tests.DeleteModel')
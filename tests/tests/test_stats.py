@@ -0,0 +1,53 @@
+from django.test.testcases import TestCase
+
+from django_watcher.stats import get_stats, reset_stats
+from tests.models import DeleteModel, SaveModel
+from tests.watchers import StubDeleteWatcher, StubSaveWatcher
+
+from .helpers import CopyingMock
+
+
+class StatsTests(TestCase):
+    def setUp(self) -> None:
+        reset_stats()
+        self.mock = CopyingMock()
+        StubSaveWatcher.set_hooks(('pre_save', self.mock.pre_save))
+        StubDeleteWatcher.set_hooks(('pre_delete', self.mock.pre_delete))
+
+    def tearDown(self) -> None:
+        reset_stats()
+
+    def test_counts_calls_and_rows(self):
+        for i in range(3):
+            SaveModel.objects.create(text=f'text{i}')
+        SaveModel.objects.filter(text__in=['text0', 'text1']).update(text='new_text')
+        DeleteModel.objects.bulk_create([DeleteModel(text='text'), DeleteModel(text='text')])
+        DeleteModel.objects.all().delete()
+
+        stats = get_stats()
+        self.assertEqual(3, stats['tests.SaveModel']['create']['calls'])
+        self.assertEqual(3, stats['tests.SaveModel']['create']['rows'])
+        self.assertEqual(1, stats['tests.SaveModel']['update']['calls'])
+        self.assertEqual(2, stats['tests.SaveModel']['update']['rows'])
+        self.assertEqual(2, stats['tests.DeleteModel']['delete']['rows'])
+
+    def test_times_hooks_and_transactions(self):
+        SaveModel.objects.create(text='text1')
+        SaveModel.objects.create(text='text2', _ignore_hooks=True)
+
+        create = get_stats()['tests.SaveModel']['create']
+        self.assertEqual(2, create['calls'])
+        self.assertEqual(1, create['transaction']['count'])
+        self.assertEqual(1, create['hooks']['pre_save']['count'])
+        self.assertEqual(
+            ['count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'],
+            list(create['hooks']['pre_save']),
+        )
+
+    def test_reset(self):
+        SaveModel.objects.create(text='text')
+        self.assertEqual(1, get_stats()['tests.SaveModel']['create']['calls'])
+
+        reset_stats()
+
+        self.assertEqual({}, get_stats())
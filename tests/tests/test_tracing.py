@@ -0,0 +1,74 @@
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.test.testcases import TestCase
+
+from django_watcher import tracing
+from tests.models import SaveModel
+from tests.watchers import StubSaveWatcher
+
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:  # pragma: no cover
+    TracerProvider = None
+
+
+@skipIf(TracerProvider is None, 'opentelemetry-sdk is not installed')
+class TracingTests(TestCase):
+    def setUp(self) -> None:
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        patcher = patch.object(tracing, '_tracer', provider.get_tracer('django_watcher'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        StubSaveWatcher.set_hooks(('pre_save', lambda *args, **kwargs: None))
+
+    def get_spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def test_operation_hooks_and_unwatched_spans(self):
+        SaveModel.objects.bulk_create([SaveModel(text='text1'), SaveModel(text='text2')])
+
+        SaveModel.objects.all().update(text='new_text')
+
+        spans = self.get_spans()
+        run = spans['django_watcher.update']
+        self.assertEqual(
+            {
+                'django_watcher.model': 'tests.SaveModel',
+                'django_watcher.operation': 'update',
+                'django_watcher.source': 'query_set',
+                'django_watcher.rows': 2,
+            },
+            dict(run.attributes),
+        )
+        for name in (
+            'django_watcher.pre_save',
+            'django_watcher.pre_update',
+            'django_watcher.UNWATCHED_update',
+            'django_watcher.post_update',
+            'django_watcher.post_save',
+        ):
+            self.assertEqual(run.context.span_id, spans[name].parent.span_id)
+        hook = spans['django_watcher.pre_save']
+        self.assertEqual('pre_save', hook.attributes['django_watcher.hook'])
+
+    def test_instance_source(self):
+        SaveModel(text='text').save()
+
+        run = self.get_spans()['django_watcher.save']
+        self.assertEqual('instance', run.attributes['django_watcher.source'])
+        self.assertEqual(1, run.attributes['django_watcher.rows'])
+
+
+class NoTracerTests(TestCase):
+    def test_operations_run_without_tracer(self):
+        with patch.object(tracing, '_tracer', None):
+            self.assertIs(tracing._NO_SPAN, tracing.span('name', SaveModel, 'save'))
+            SaveModel.objects.create(text='text')
+
+        self.assertEqual(1, SaveModel.objects.count())
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import TrackingModel, TrackingUpdateModel
+from tests.watchers import StubTrackingUpdateWatcher, StubTrackingWatcher
+
+
+class TrackChangesTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubTrackingWatcher.set_hooks(
+            ('pre_save', self.mock.pre_save), ('post_save', self.mock.post_save)
+        )
+        StubTrackingUpdateWatcher.set_hooks(('pre_update', self.mock.pre_update))
+        TrackingModel.objects.create(text='text', number=1)
+        self.mock.reset_mock()
+
+    def get_updates(self, ctx):
+        return [q['sql'] for q in ctx if q['sql'].startswith('UPDATE')]
+
+    def test_unchanged_save_skips_hooks_and_write(self):
+        instance = TrackingModel.objects.get()
+
+        with CaptureQueriesContext(connection) as ctx:
+            instance.save()
+
+        self.assertEqual(0, len(ctx))
+        self.mock.pre_save.assert_not_called()
+        self.mock.post_save.assert_not_called()
+
+    def test_changed_save_writes_changed_fields(self):
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+
+        with CaptureQueriesContext(connection) as ctx:
+            instance.save()
+
+        updates = self.get_updates(ctx)
+        self.assertEqual(1, len(updates))
+        self.assertIn('"number"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"text"', updates[0])
+        meta_params = self.mock.pre_save.call_args[0][1]
+        self.assertEqual({'number'}, meta_params['changed_fields'])
+        self.assertEqual(2, TrackingModel.objects.get().number)
+
+    def test_saved_values_are_tracked(self):
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+        instance.save()
+        self.mock.reset_mock()
+
+        instance.save()
+
+        self.mock.pre_save.assert_not_called()
+
+    def test_created_instances_are_tracked(self):
+        instance = TrackingModel(text='text2')
+        instance.save()
+        self.mock.reset_mock()
+
+        instance.save()
+
+        self.mock.pre_save.assert_not_called()
+
+    def test_changes_made_by_pre_hooks_are_written(self):
+        def pre_save(watcher, target, meta_params, **hooks_params):
+            meta_params['instance_ref'].text = 'hooked'
+
+        StubTrackingWatcher.set_hooks(('pre_save', pre_save))
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+        instance.save()
+
+        self.assertEqual('hooked', TrackingModel.objects.get().text)
+
+    def test_update_fields_narrowed_to_changed(self):
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+
+        instance.save(update_fields=['text'])
+
+        self.mock.pre_save.assert_not_called()
+        self.assertEqual(1, TrackingModel.objects.get().number)
+
+    def test_untracked_instances_are_saved(self):
+        instance = TrackingModel(pk=TrackingModel.objects.get().pk, text='text', number=1)
+
+        instance.save()
+
+        self.assertNotIn('changed_fields', self.mock.pre_save.call_args[0][1])
+
+    def test_update_watcher(self):
+        TrackingUpdateModel.objects.create(text='text')
+        instance = TrackingUpdateModel.objects.get()
+
+        instance.save()
+        self.mock.pre_update.assert_not_called()
+
+        instance.number = 2
+        instance.save()
+        self.assertEqual({'number'}, self.mock.pre_update.call_args[0][1]['changed_fields'])
+
+    def test_fields_left_out_of_update_fields_stay_changed(self):
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+        instance.text = 'new_text'
+        instance.save(update_fields=['number'])
+
+        instance.save()
+
+        self.assertEqual({'text'}, self.mock.pre_save.call_args[0][1]['changed_fields'])
+        self.assertEqual('new_text', TrackingModel.objects.get().text)
@@ -0,0 +1,125 @@
+from typing import Tuple, Type
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import CustomManagerModel, SaveModel, UpdateModel
+from tests.watchers import StubSaveDeleteWatcher, StubSaveWatcher, StubUpdateWatcher, WatchInspector
+
+
+class UpdateReturningTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubUpdateWatcher.set_hooks(('post_update', self.mock.post_update))
+        watchers: Tuple[Type[WatchInspector], ...] = (StubSaveWatcher, StubSaveDeleteWatcher)
+        for watcher in watchers:
+            watcher.set_hooks(
+                ('post_update', self.mock.post_update), ('post_save', self.mock.post_save)
+            )
+        for watcher in watchers + (StubUpdateWatcher,):
+            patcher = patch.object(watcher, 'update_returning', ['text'])
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_statements(self, ctx):
+        return [q['sql'].split(' ')[0] for q in ctx if 'SAVEPOINT' not in q['sql']]
+
+    def test_updates_and_returns_rows_in_one_statement(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text1'), UpdateModel(text='text2')])
+        pks = sorted(UpdateModel.objects.values_list('pk', flat=True))
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = UpdateModel.objects.filter(text__startswith='text').update(text='new_text')
+
+        self.assertEqual(['UPDATE'], self.get_statements(ctx))
+        self.assertIn('RETURNING', [q['sql'] for q in ctx if q['sql'].startswith('UPDATE')][0])
+        self.assertEqual(2, result)
+        queryset, meta_params = self.mock.post_update.call_args[0]
+        self.assertEqual(
+            [{'pk': pk, 'text': 'new_text'} for pk in pks],
+            sorted(meta_params['returning'], key=lambda row: row['pk']),
+        )
+        self.assertEqual(pks, sorted(instance.pk for instance in queryset))
+
+    def test_post_hooks_see_updated_rows_only(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text1'), UpdateModel(text='text2')])
+
+        UpdateModel.objects.filter(text='text1').update(text='text2')
+
+        queryset = self.mock.post_update.call_args[0][0]
+        self.assertEqual(1, len(queryset))
+        self.assertEqual(2, UpdateModel.objects.filter(text='text2').count())
+
+    def test_falls_back_to_selecting_pks(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text1'), UpdateModel(text='other')])
+        pk = UpdateModel.objects.get(text='text1').pk
+
+        with patch('django_watcher.utils.supports_returning', return_value=False):
+            with CaptureQueriesContext(connection) as ctx:
+                result = UpdateModel.objects.filter(text='text1').update(text='new_text')
+
+        self.assertEqual(['SELECT', 'UPDATE', 'SELECT'], self.get_statements(ctx))
+        self.assertEqual(1, result)
+        queryset, meta_params = self.mock.post_update.call_args[0]
+        self.assertEqual([{'pk': pk, 'text': 'new_text'}], meta_params['returning'])
+        self.assertEqual([pk], [instance.pk for instance in queryset])
+
+    def test_save_watcher_post_hooks(self):
+        SaveModel.objects.bulk_create([SaveModel(text='text1')])
+        pk = SaveModel.objects.get().pk
+
+        self.assertEqual(1, SaveModel.objects.all().update(text='new_text'))
+
+        for hook in (self.mock.post_update, self.mock.post_save):
+            queryset, meta_params = hook.call_args[0]
+            self.assertEqual([{'pk': pk, 'text': 'new_text'}], meta_params['returning'])
+            self.assertEqual([pk], [instance.pk for instance in queryset])
+
+    def test_disabled_by_default(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text1')])
+
+        with patch.object(StubUpdateWatcher, 'update_returning', False):
+            UpdateModel.objects.all().update(text='new_text')
+
+        self.assertNotIn('returning', self.mock.post_update.call_args[0][1])
+
+    def test_post_hooks_run_once_per_batch(self):
+        UpdateModel.objects.bulk_create([UpdateModel(text='text1'), UpdateModel(text='text2')])
+        pks = sorted(UpdateModel.objects.values_list('pk', flat=True))
+
+        for supported in (True, False):
+            with self.subTest(supports_returning=supported):
+                self.mock.reset_mock()
+                with patch.object(StubUpdateWatcher, 'post_update_batch_size', 1), patch(
+                    'django_watcher.utils.supports_returning', return_value=supported
+                ):
+                    result = UpdateModel.objects.all().update(text=f'new_text_{supported}')
+
+                self.assertEqual(2, result)
+                calls = self.mock.post_update.call_args_list
+                self.assertEqual(
+                    [[{'pk': pk, 'text': f'new_text_{supported}'}] for pk in pks],
+                    sorted((c[0][1]['returning'] for c in calls), key=lambda rows: rows[0]['pk']),
+                )
+                self.assertEqual(pks, sorted(c[0][0].get().pk for c in calls))
+
+    @patch('tests.managers.watched')
+    def test_custom_update_is_called(self, mocked_watched):
+        CustomManagerModel.objects.bulk_create(
+            [CustomManagerModel(text='text1'), CustomManagerModel(text='text2')]
+        )
+        pk = CustomManagerModel.objects.get(text='text1').pk
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = CustomManagerModel.objects.filter(text='text1').update(
+                'fake_param', text='new_text'
+            )
+
+        mocked_watched.assert_called_once_with('fake_param')
+        self.assertEqual(['SELECT', 'UPDATE', 'SELECT'], self.get_statements(ctx))
+        self.assertEqual(1, result)
+        queryset, meta_params = self.mock.post_update.call_args[0]
+        self.assertEqual([{'pk': pk, 'text': 'new_text'}], meta_params['returning'])
+        self.assertEqual([pk], [instance.pk for instance in queryset])
@@ -0,0 +1,139 @@
+from typing import Tuple, Type
+from unittest.mock import MagicMock, call, patch
+
+from django.db import connection, transaction
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_watcher import MetaParams
+from django_watcher.mixins import _QUERY_SET
+from django_watcher.utils import match_existing
+from tests.models import CreateModel, SaveModel, UniqueCodeModel
+from tests.watchers import StubCreateWatcher, StubSaveWatcher, WatchInspector
+
+from .helpers import CopyingMock
+
+
+class UpsertTests(TestCase):
+    def setUp(self) -> None:
+        self.mock: MagicMock = CopyingMock()
+        hooks = ('pre_create', 'post_create', 'pre_update', 'post_update')
+        watchers: Tuple[Type[WatchInspector], ...] = (StubCreateWatcher, StubSaveWatcher)
+        for watcher in watchers:
+            watcher.set_hooks(*[(hook, getattr(self.mock, hook)) for hook in hooks])
+
+        self.meta_params: MetaParams = {
+            'source': _QUERY_SET,
+            'operation_params': {'unique_fields': ['text'], 'update_fields': ['text']},
+        }
+
+    def get_instances(self, model):
+        model.objects.bulk_create([model(text='text1'), model(text='text2')])
+        self.existing_pk = model.objects.get(text='text1').pk
+        return [model(text='text1'), model(text='text3')]
+
+    def test_hooks(self):
+        instances = self.get_instances(SaveModel)
+
+        with patch('django_watcher.abstract_watcher.transaction', wraps=transaction) as mocked:
+            result = SaveModel.objects.upsert(instances, ['text'], update_fields=['text'])
+
+        self.assertIs(instances, result)
+        mocked.atomic.assert_called_once_with(using='default')
+        self.assertEqual(self.existing_pk, instances[0].pk)
+        existing_qs = SaveModel.objects.filter(pk__in=[self.existing_pk])
+        self.mock.assert_has_calls(
+            [
+                call.pre_create([SaveModel(text='text3')], self.meta_params),
+                call.pre_update(existing_qs, self.meta_params),
+                call.post_create(
+                    SaveModel.objects.filter(pk__in=[instances[1].pk]), self.meta_params
+                ),
+                call.post_update(existing_qs, self.meta_params),
+            ]
+        )
+        self.assertEqual(4, len(self.mock.mock_calls))
+        self.assertEqual(3, SaveModel.objects.count())
+
+    def test_create_hooks(self):
+        instances = self.get_instances(CreateModel)
+
+        CreateModel.objects.upsert(instances, ['text'], update_fields=['text'])
+
+        self.assertEqual(
+            ['pre_create', 'post_create'], [name for name, _, _ in self.mock.mock_calls]
+        )
+        self.assertEqual(3, CreateModel.objects.count())
+
+    def test_ignore_hooks_matches_with_one_select(self):
+        instances = self.get_instances(SaveModel)
+
+        with CaptureQueriesContext(connection) as ctx:
+            SaveModel.objects.upsert(instances, ['text'], _ignore_hooks=True)
+
+        selects = [q['sql'] for q in ctx if q['sql'].startswith('SELECT')]
+        self.assertEqual(1, len(selects))
+        self.assertEqual(0, len(self.mock.mock_calls))
+        self.assertEqual(3, SaveModel.objects.count())
+
+    def match_late(self, path):
+        # The first match misses the row, as if a concurrent transaction inserted it afterwards
+        calls = []
+
+        def side_effect(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                match_existing(*args)
+
+        return patch(path, side_effect=side_effect)
+
+    def test_rows_inserted_after_matching_are_matched_again(self):
+        UniqueCodeModel.objects.bulk_create([UniqueCodeModel(text='text1', code='a')])
+        existing_pk = UniqueCodeModel.objects.get().pk
+        instances = [UniqueCodeModel(text='new', code='a'), UniqueCodeModel(text='new', code='b')]
+
+        with self.match_late('django_watcher.mixins.match_existing'):
+            UniqueCodeModel.objects.upsert(instances, ['code'])
+
+        self.assertEqual(existing_pk, instances[0].pk)
+        self.assertEqual(
+            [('a', 'new'), ('b', 'new')],
+            list(UniqueCodeModel.objects.order_by('code').values_list('code', 'text')),
+        )
+        self.mock.post_update.assert_called_once()
+
+    def test_ignore_hooks_matches_again(self):
+        UniqueCodeModel.objects.bulk_create([UniqueCodeModel(text='text1', code='a')])
+        instances = [UniqueCodeModel(text='new', code='a')]
+
+        with self.match_late('django_watcher.decorators.helpers.match_existing'):
+            UniqueCodeModel.objects.upsert(instances, ['code'], _ignore_hooks=True)
+
+        self.assertEqual([('a', 'new')], list(UniqueCodeModel.objects.values_list('code', 'text')))
+
+    def test_bulk_update_or_create_is_upsert(self):
+        for module, kwargs in (
+            ('mixins', {}),
+            ('decorators.helpers', {'_ignore_hooks': True}),
+        ):
+            with self.subTest(module=module):
+                UniqueCodeModel.objects.all().delete()
+                UniqueCodeModel.objects.bulk_create([UniqueCodeModel(text='text1', code='a')])
+                instances = [UniqueCodeModel(text='new', code='a')]
+
+                with self.match_late(f'django_watcher.{module}.match_existing'):
+                    UniqueCodeModel.objects.bulk_update_or_create(instances, ['code'], **kwargs)
+
+                self.assertEqual(
+                    [('a', 'new')], list(UniqueCodeModel.objects.values_list('code', 'text'))
+                )
+
+    def test_exception_on_post_update_dont_save(self):
+        instances = self.get_instances(SaveModel)
+        instances[0].text = 'text1'
+        self.mock.post_update.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            SaveModel.objects.upsert(instances, ['text'])
+
+        self.assertEqual(2, SaveModel.objects.count())
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test.testcases import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.models import TrackingModel, TrackingUpdateModel
+from tests.watchers import StubTrackingUpdateWatcher, StubTrackingWatcher
+
+
+class WatchFieldsTests(TestCase):
+    def setUp(self) -> None:
+        self.mock = MagicMock()
+        StubTrackingUpdateWatcher.set_hooks(
+            ('pre_update', self.mock.pre_update), ('post_update', self.mock.post_update)
+        )
+        StubTrackingWatcher.set_hooks(('post_save', self.mock.post_save))
+        for watcher in (StubTrackingUpdateWatcher, StubTrackingWatcher):
+            patcher = patch.object(
+                watcher,
+                'watch_fields',
+                {hook: {'text'} for hook in ('pre_save', 'pre_update', 'post_update', 'post_save')},
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        TrackingUpdateModel.objects.create(text='text')
+        TrackingModel.objects.create(text='text')
+        self.mock.reset_mock()
+
+    def get_savepoints(self, ctx):
+        return [q['sql'] for q in ctx if 'SAVEPOINT' in q['sql']]
+
+    def test_update_of_other_fields_skips_hooks_and_transaction(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = TrackingUpdateModel.objects.all().update(number=2)
+
+        self.assertEqual(1, result)
+        self.assertEqual([], self.get_savepoints(ctx))
+        self.mock.pre_update.assert_not_called()
+        self.mock.post_update.assert_not_called()
+        self.assertEqual(2, TrackingUpdateModel.objects.get().number)
+
+    def test_update_of_watched_fields_runs_hooks(self):
+        TrackingUpdateModel.objects.all().update(number=2, text='new_text')
+
+        self.mock.pre_update.assert_called_once()
+        self.mock.post_update.assert_called_once()
+
+    def test_hooks_params_are_dropped_when_skipped(self):
+        TrackingUpdateModel.objects.all().update(number=2, hooks__param='value')
+
+        self.assertEqual(2, TrackingUpdateModel.objects.get().number)
+
+    def test_instance_save_with_update_fields(self):
+        instance = TrackingUpdateModel.objects.get()
+        instance.number = 2
+        instance.text = 'new_text'
+
+        instance.save(update_fields=['number'])
+        self.mock.pre_update.assert_not_called()
+
+        instance.save(update_fields=['text'])
+        self.mock.pre_update.assert_called_once()
+
+    def test_instance_save_with_changed_fields(self):
+        instance = TrackingModel.objects.get()
+        instance.number = 2
+
+        with CaptureQueriesContext(connection) as ctx:
+            instance.save()
+
+        self.assertEqual([], self.get_savepoints(ctx))
+        self.mock.post_save.assert_not_called()
+        self.assertEqual(2, TrackingModel.objects.get().number)
+
+        instance.text = 'new_text'
+        instance.save()
+        self.mock.post_save.assert_called_once()
+
+    def test_unknown_fields_run_hooks(self):
+        instance = TrackingUpdateModel(pk=TrackingUpdateModel.objects.get().pk, text='new_text')
+
+        instance.save()
+
+        self.mock.pre_update.assert_called_once()
@@ -2,11 +2,18 @@ from typing import Callable, List, Tuple
 
 from django_watcher import (
     AbstractWatcher,
+    ArchiveWatcherMixin,
+    AuditWatcherMixin,
+    CacheInvalidationWatcherMixin,
+    CounterCacheWatcherMixin,
     CreateWatcherMixin,
     DeleteWatcherMixin,
     SaveWatcherMixin,
+    SearchIndexWatcherMixin,
+    SoftDeleteWatcherMixin,
     UpdateWatcherMixin,
 )
+from django_watcher.search import InMemorySearchBackend
 
 
 class WatchInspector(AbstractWatcher):
@@ -58,6 +65,56 @@ class StubSaveDeleteWatcher2(WatchInspector, SaveWatcherMixin, DeleteWatcherMixi
     pass
 
 
+class StubLockingWatcher(WatchInspector, SaveWatcherMixin, DeleteWatcherMixin):
+    select_for_update = {'skip_locked': True}
+
+
+class StubProjectingWatcher(WatchInspector, SaveWatcherMixin, DeleteWatcherMixin):
+    hook_fields = {'pre_update': ['id'], 'post_save': ['id'], 'post_delete': ['id']}
+
+
+class StubTrackingWatcher(WatchInspector, SaveWatcherMixin):
+    track_changes = True
+
+
+class StubTrackingUpdateWatcher(WatchInspector, UpdateWatcherMixin):
+    track_changes = True
+
+
+class StubSoftDeleteWatcher(WatchInspector, SoftDeleteWatcherMixin):
+    pass
+
+
+class StubArchiveWatcher(WatchInspector, ArchiveWatcherMixin):
+    archive_model = 'tests.ArchivedModel'
+
+
+class StubCounterCacheWatcher(WatchInspector, CounterCacheWatcherMixin):
+    counter_caches = [('parent', 'children_count')]
+
+
+class StubCacheInvalidationWatcher(WatchInspector, CacheInvalidationWatcherMixin):
+    cache_key_template = 'test:{model}:{pk}'
+    cache_generation_key = 'test:{model}:generation'
+
+
+class StubCachedCounterCacheWatcher(
+    WatchInspector, CounterCacheWatcherMixin, CacheInvalidationWatcherMixin
+):
+    counter_caches = [('parent', 'children_count')]
+    cache_key_template = 'test:{model}:{pk}'
+
+
+class StubAuditWatcher(WatchInspector, AuditWatcherMixin):
+    audit_model = 'tests.AuditRecord'
+    audit_fields = ['text', 'number']
+
+
+class StubSearchIndexWatcher(WatchInspector, SearchIndexWatcherMixin):
+    search_backend = InMemorySearchBackend()
+    search_fields = ['text', 'number']
+
+
 class DeleteWatcher(DeleteWatcherMixin):
     def post_delete(self, undeleted_instances, meta_params, **hooks_params) -> None:
         from tests.models import RelationDeleteModel2  # noqa